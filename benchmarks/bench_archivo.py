@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Archivo de páginas y re-extracción en paralelo (finfocus_indices/archivo.py)
+sobre años de versiones sintéticas de Principales Variables.
+
+Arma una versión por día a partir de la página grabada del BCRA, con la
+fila del CER reemplazada por el valor guardado de ese día y relleno para
+acercarla al tamaño real. Las archiva, las empaqueta y mide el tamaño en
+disco y la re-extracción con 1 proceso y con uno por núcleo. Como los
+valores salen de indices/cer.json, la re-extracción no debe encontrar
+diferencias.
+
+Uso:
+  python benchmarks/bench_archivo.py [--dias 2000] [--relleno 100] [--json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_extraccion import FUENTES, PAGINAS, rellenar
+from finfocus_indices import almacen, archivo, bcra
+
+FILA_CER = "<td>21/07/2025</td><td>608,3025</td>"
+
+def versiones(dias, relleno):
+    """[(t, html)] de los últimos `dias` días de cer.json."""
+    with open(os.path.join(PAGINAS, FUENTES["bcra"]), encoding="utf-8") as f:
+        base = rellenar(f.read(), relleno)
+    if FILA_CER not in base:
+        raise RuntimeError("La página grabada del BCRA no tiene la fila del CER esperada.")
+    cer = list(almacen.leer_json(os.path.join(RAIZ, "indices", "cer.json")).items())[-dias:]
+    salida = []
+    for fecha, valor in cer:
+        d = date.fromisoformat(fecha)
+        celda = f"{valor:.4f}".replace(".", ",")
+        fila = f"<td>{d.strftime('%d/%m/%Y')}</td><td>{celda}</td>"
+        salida.append((f"{fecha}T18:00:00+00:00", base.replace(FILA_CER, fila)))
+    return salida
+
+def tamanio(directorio):
+    return sum(os.path.getsize(os.path.join(r, a)) for r, _, archivos in os.walk(directorio) for a in archivos)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dias", type=int, default=2000)
+    parser.add_argument("--relleno", type=int, default=100, help="KB de relleno por página")
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de texto")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="finfocus-archivo-") as tmp:
+        dir_archivo = os.path.join(tmp, "archivo")
+        dir_indices = os.path.join(tmp, "indices")
+        shutil.copytree(os.path.join(RAIZ, "indices"), dir_indices)
+
+        lista = versiones(args.dias, args.relleno)
+        crudo = sum(len(html.encode("utf-8")) for _, html in lista)
+        t0 = time.perf_counter()
+        for t, html in lista:
+            sha = hashlib.sha256(html.encode("utf-8")).hexdigest()
+            archivo.guardar(bcra.URL_BCRA, html, sha, dir_archivo, t)
+        t_guardar = time.perf_counter() - t0
+        sueltos = tamanio(dir_archivo)
+
+        t0 = time.perf_counter()
+        archivo.empaquetar(dir_archivo, mes_actual=True)
+        t_empaquetar = time.perf_counter() - t0
+        empaquetado = tamanio(dir_archivo)
+
+        tiempos = {}
+        for procesos in (1, None):
+            t0 = time.perf_counter()
+            resumen = archivo.reextraer(["cer"], procesos, directorio=dir_archivo, dir_indices=dir_indices)
+            tiempos[procesos or os.cpu_count()] = time.perf_counter() - t0
+        cer = resumen["cer"]
+
+    resultado = {
+        "versiones": len(lista), "nucleos": os.cpu_count(),
+        "crudo_kib": round(crudo / 1024, 1), "sueltos_kib": round(sueltos / 1024, 1),
+        "empaquetado_kib": round(empaquetado / 1024, 1),
+        "guardar_s": round(t_guardar, 2), "empaquetar_s": round(t_empaquetar, 2),
+        "reextraer_s": {str(k): round(v, 2) for k, v in tiempos.items()},
+        "errores": len(cer["errores"]), "diferencias": len(cer["diferencias"]),
+    }
+    if args.json:
+        print(json.dumps(resultado, ensure_ascii=False, indent=2))
+        return
+    print(f"{resultado['versiones']} versiones: {resultado['crudo_kib']} KiB crudas, "
+          f"{resultado['sueltos_kib']} KiB en objetos sueltos, {resultado['empaquetado_kib']} KiB empaquetadas")
+    print(f"guardar {resultado['guardar_s']} s, empaquetar {resultado['empaquetar_s']} s")
+    for procesos, s in resultado["reextraer_s"].items():
+        print(f"re-extracción con {procesos} proceso(s): {s} s")
+    print(f"errores: {resultado['errores']}, diferencias con cer.json: {resultado['diferencias']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tiempo de arranque de la línea de comandos (./finfocus) contra las formas
+anteriores de consultar un valor: importar series.py (NumPy) o parsear el
+JSON entero. Cada comando corre --repeticiones veces en un proceso nuevo
+y se informa la mediana; "python vacío" es el piso del intérprete.
+
+Uso:
+  python benchmarks/bench_arranque.py [--repeticiones 15] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI  = os.path.join(RAIZ, "finfocus")
+
+COMANDOS = {
+    "python vacío":            ["-c", "pass"],
+    "finfocus get cer":        [CLI, "get", "cer", "2025-07-01"],
+    "finfocus get ripte1":     [CLI, "get", "ripte1", "2025-05-01"],
+    "finfocus range activa":   [CLI, "range", "activa", "2020-01-01", "2025-07-01"],
+    "finfocus coef cer":       [CLI, "coef", "cer", "2020-01-01", "2025-07-01"],
+    "series.py (NumPy)":       ["-c", "from datetime import date; from finfocus_indices import series; "
+                                      "print(series.obtener('cer').ultimo_hasta(date(2025, 7, 1)))"],
+    "json.load de cer.json":   ["-c", "import json; print(json.load(open('indices/cer.json'))['2025-07-01'])"],
+}
+
+MODULOS = ("numpy", "requests", "bs4", "urllib3", "dateutil")
+
+def medir(argumentos, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable] + argumentos, cwd=RAIZ, check=True, capture_output=True)
+        tiempos.append(time.perf_counter() - t0)
+    return statistics.median(tiempos)
+
+def importados():
+    """Qué módulos pesados quedan cargados después de un `get`."""
+    codigo = ("import sys; sys.argv = ['finfocus', 'get', 'cer', '2025-07-01']; "
+              "from finfocus_indices.__main__ import main; main(); "
+              f"print(*[m for m in {MODULOS!r} if m in sys.modules])")
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True,
+                            capture_output=True, text=True).stdout.splitlines()
+    return salida[-1].split() if len(salida) > 1 else []
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeticiones", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de tabla")
+    args = parser.parse_args(argv)
+
+    resultados = {nombre: round(medir(argumentos, args.repeticiones) * 1000, 1)
+                  for nombre, argumentos in COMANDOS.items()}
+    cargados = importados()
+    if args.json:
+        print(json.dumps({"mediana_ms": resultados, "modulos_pesados_en_get": cargados},
+                         ensure_ascii=False, indent=2))
+        return
+    piso = resultados["python vacío"]
+    print(f"{'comando':<24}{'ms':>8}{'sobre el piso':>15}")
+    for nombre, ms in resultados.items():
+        print(f"{nombre:<24}{ms:>8.1f}{ms - piso:>15.1f}")
+    print(f"módulos pesados cargados por get: {', '.join(cargados) or 'ninguno'}")
+
+if __name__ == "__main__":
+    main()
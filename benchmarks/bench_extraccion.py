@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compara la extracción con BeautifulSoup completo (antes) contra la
+extracción dirigida de finfocus_indices.extraccion (después) sobre las
+páginas grabadas de fixtures/paginas/.
+
+Mide el mejor tiempo de N repeticiones y el pico de memoria (tracemalloc).
+Con --relleno KB se agrega markup de relleno al final de cada página para
+acercarla al tamaño real de las fuentes (menúes, pie, scripts).
+
+Uso:
+  python benchmarks/bench_extraccion.py [--repeticiones 50] [--relleno 200] [--json]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import update_activa
+import update_ripte
+import update_smvm
+from finfocus_indices import bcra
+
+PAGINAS = os.path.join(RAIZ, "fixtures", "paginas")
+FUENTES = {
+    "bcra":  "www.bcra.gob.ar/PublicacionesEstadisticas/Principales_variables.asp",
+    "bna":   "www.bna.com.ar/home/informacionalusuariofinanciero",
+    "ripte": "www.argentina.gob.ar/trabajo/seguridadsocial/ripte",
+    "smvm":  "www.argentina.gob.ar/trabajo/consejodelsalario",
+}
+
+# --- Versiones anteriores (árbol completo de html.parser) ---
+
+def bcra_antes(html):
+    soup = BeautifulSoup(html, "html.parser")
+    tabla = soup.find("table")
+    encontradas = {}
+    for tr in tabla.select("tr"):
+        celdas = [td.get_text(strip=True) for td in tr.select("td")]
+        for serie, criterio in bcra.VARIABLES.items():
+            if len(celdas) >= 3 and bcra.coincide(celdas[0], criterio):
+                encontradas[serie] = (celdas[1], celdas[2])
+    return encontradas
+
+def bna_antes(html):
+    soup = BeautifulSoup(html, "html.parser")
+    tna = None
+    for li in soup.find_all("li"):
+        txt = li.get_text(strip=True)
+        if "T.N.A." in txt:
+            m = re.search(r'([\d]+,[\d]+)%', txt)
+            if m:
+                tna = float(m.group(1).replace(",", "."))
+                break
+    texto = soup.get_text(" ", strip=True)
+    m2 = re.search(r'Vigente desde\s+(\d{2}/\d{2}/\d{4})', texto)
+    return tna, datetime.strptime(m2.group(1), "%d/%m/%Y").date()
+
+def ripte_antes(html):
+    soup = BeautifulSoup(html, "html.parser")
+    row = soup.find("table").find("tbody").find("tr")
+    return [td.get_text(strip=True) for td in row.find_all("td")]
+
+def smvm_antes(html):
+    soup = BeautifulSoup(html, "html.parser")
+    tarjeta = soup.find(lambda tag:
+        tag.name in ("div", "section") and
+        "Salario Mínimo Vital y Móvil" in tag.get_text()
+    )
+    texto = tarjeta.get_text(separator=" ", strip=True)
+    return re.search(r"\$\s*([\d\.\,]+).*\((\w+)\s+(\d{4})\)", texto).groups()
+
+CASOS = {
+    "bcra":  (bcra_antes,  bcra.extraer_variables),
+    "bna":   (bna_antes,   update_activa.obtener_tna_y_vigencia),
+    "ripte": (ripte_antes, update_ripte.obtener_ripte),
+    "smvm":  (smvm_antes,  update_smvm.obtener_smvm),
+}
+
+def rellenar(html, kb):
+    if not kb:
+        return html
+    bloque = ('<div class="menu"><ul>' +
+              "".join(f'<li><a href="/seccion/{i}">Sección {i}</a></li>' for i in range(20)) +
+              "</ul></div>\n")
+    relleno = bloque * (kb * 1024 // len(bloque) + 1)
+    return html.replace("</body>", relleno + "</body>")
+
+def medir(fn, html, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        fn(html)
+        mejor = min(mejor, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn(html)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return mejor, pico
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeticiones", type=int, default=50)
+    parser.add_argument("--relleno", type=int, default=0, metavar="KB")
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de tabla")
+    args = parser.parse_args(argv)
+
+    resultados = []
+    for fuente, (antes, despues) in CASOS.items():
+        with open(os.path.join(PAGINAS, FUENTES[fuente]), encoding="utf-8") as f:
+            html = rellenar(f.read(), args.relleno)
+        t_antes, m_antes = medir(antes, html, args.repeticiones)
+        t_despues, m_despues = medir(despues, html, args.repeticiones)
+        resultados.append({
+            "fuente": fuente, "bytes": len(html.encode("utf-8")),
+            "antes_ms": round(t_antes * 1000, 3), "despues_ms": round(t_despues * 1000, 3),
+            "antes_pico_kb": round(m_antes / 1024, 1), "despues_pico_kb": round(m_despues / 1024, 1),
+        })
+
+    if args.json:
+        print(json.dumps(resultados, ensure_ascii=False, indent=2))
+        return
+    print(f"{'fuente':<7}{'KB':>8}{'antes ms':>11}{'después ms':>12}{'antes pico KB':>15}{'después pico KB':>17}")
+    for r in resultados:
+        print(f"{r['fuente']:<7}{r['bytes'] / 1024:>8.1f}{r['antes_ms']:>11.3f}{r['despues_ms']:>12.3f}"
+              f"{r['antes_pico_kb']:>15.1f}{r['despues_pico_kb']:>17.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Conversión de frecuencia con frecuencia.py contra los bucles de Python
+sobre las claves del JSON (agrupar los días por mes, buscar el último
+dato de cada fin de mes, repartir cada mes en sus días). Se mide el
+cálculo en frío (Serie nueva, sin caché) y la consulta con la caché
+ya armada; cada caso corre --repeticiones veces y se informa la mediana.
+
+Uso:
+  python benchmarks/bench_frecuencia.py [--repeticiones 5] [--json]
+"""
+
+import argparse
+import calendar
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from finfocus_indices import frecuencia, series
+
+PEDIDOS = [("activa", "cierre"), ("activa", "promedio"), ("pasiva", "promedio"),
+           ("cer", "cierre"), ("ripte", "mes"), ("inflacion", "prorrata")]
+
+def _datos(nombre):
+    fechas, valores = series.Serie(nombre).rango(date.min, date.max)
+    return {f.item(): float(v) for f, v in zip(fechas, valores) if v == v}
+
+def cierre_bucle(datos):
+    ultimo, meses = max(datos), {}
+    for fecha in sorted(datos):
+        if date(fecha.year, fecha.month, calendar.monthrange(fecha.year, fecha.month)[1]) <= ultimo:
+            meses[(fecha.year, fecha.month)] = datos[fecha]
+    return meses
+
+def promedio_bucle(datos):
+    ultimo, meses = max(datos), {}
+    for fecha, valor in datos.items():
+        if date(fecha.year, fecha.month, calendar.monthrange(fecha.year, fecha.month)[1]) <= ultimo:
+            meses.setdefault((fecha.year, fecha.month), []).append(valor)
+    primero = min(datos)
+    if primero.day != 1:
+        meses.pop((primero.year, primero.month), None)    # mes incompleto
+    return {k: sum(v) / len(v) for k, v in meses.items()}
+
+def mes_bucle(datos):
+    dias = {}
+    for fecha, valor in datos.items():
+        for d in range(calendar.monthrange(fecha.year, fecha.month)[1]):
+            dias[fecha + timedelta(d)] = valor
+    return dias
+
+def prorrata_bucle(datos):
+    dias, fechas = {}, sorted(datos)
+    for fecha, siguiente in zip(fechas, fechas[1:]):
+        largo = calendar.monthrange(fecha.year, fecha.month)[1]
+        for d in range(largo):
+            dias[fecha + timedelta(d)] = datos[fecha] * (datos[siguiente] / datos[fecha]) ** (d / largo)
+    dias[fechas[-1]] = datos[fechas[-1]]
+    return dias
+
+BUCLES = {"cierre": cierre_bucle, "promedio": promedio_bucle, "mes": mes_bucle, "prorrata": prorrata_bucle}
+
+def medir(fn, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        fn()
+        tiempos.append(time.perf_counter() - t0)
+    return statistics.median(tiempos)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de tabla")
+    args = parser.parse_args(argv)
+
+    resultados = {}
+    for nombre, metodo in PEDIDOS:
+        datos = _datos(nombre)
+        bucle = medir(lambda: BUCLES[metodo](datos), args.repeticiones)
+        frio = medir(lambda: frecuencia.convertir(series.Serie(nombre), metodo), args.repeticiones)
+        frecuencia.obtener(nombre, metodo)
+        caliente = medir(lambda: frecuencia.obtener(nombre, metodo), args.repeticiones)
+        resultados[f"{nombre}:{metodo}"] = {"bucle_ms": round(bucle * 1000, 2), "frio_ms": round(frio * 1000, 2),
+                                             "cache_ms": round(caliente * 1000, 3)}
+    frecuencia._cache.clear()
+    lote = medir(lambda: (frecuencia._cache.clear(), frecuencia.lote(PEDIDOS)), args.repeticiones)
+    if args.json:
+        print(json.dumps({"pedidos": resultados, "lote_frio_ms": round(lote * 1000, 2)}, indent=2))
+        return
+    print(f"{'pedido':<22}{'bucle ms':>10}{'frío ms':>10}{'caché ms':>10}")
+    for pedido, r in resultados.items():
+        print(f"{pedido:<22}{r['bucle_ms']:>10.2f}{r['frio_ms']:>10.2f}{r['cache_ms']:>10.3f}")
+    print(f"lote de {len(PEDIDOS)} pedidos en frío: {lote * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Historial de revisiones (finfocus_indices/historial.py) sobre años de
+corridas diarias simuladas de activa.
+
+Parte de la serie guardada sin sus últimos --dias días y los agrega de a
+uno por corrida, como update_activa; cada --rearmado corridas la vigencia
+se corre para atrás y se reescriben los últimos 10 días con otra tasa.
+Mide lo que cuesta registrar cada corrida, el tamaño del historial contra
+guardar una copia entera por corrida, la carga, y las consultas "al día
+K" contra rehacer la serie leyendo las revisiones hasta K.
+
+Uso:
+  python benchmarks/bench_historial.py [--dias 1500] [--rearmado 30] [--consultas 10000] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from finfocus_indices import almacen, historial
+
+T0 = 1_600_000_000
+DIA = 86400
+
+def corridas(serie, dias, rearmado):
+    """[(t, serie entera)] de cada corrida simulada."""
+    claves = list(serie)
+    data = {k: serie[k] for k in claves[:-dias]}
+    salida = []
+    for n, clave in enumerate(claves[-dias:], 1):
+        data = dict(data)
+        if n % rearmado == 0:
+            for k in list(data)[-10:]:
+                data[k] = round(data[k] * 0.999, 6)
+        data[clave] = serie[clave]
+        salida.append((T0 + n * DIA, data))
+    return salida
+
+def replay(path, t):
+    """La serie al instante t leyendo las revisiones en orden (sin índice)."""
+    estado = {}
+    with open(path, "rb") as f:
+        for linea in f:
+            revision = json.loads(linea)
+            if revision["t"] > t:
+                break
+            estado.update(revision["c"])
+            for k in revision.get("b", ()):
+                estado.pop(k, None)
+    return estado
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dias", type=int, default=1500)
+    parser.add_argument("--rearmado", type=int, default=30)
+    parser.add_argument("--consultas", type=int, default=10_000)
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de texto")
+    args = parser.parse_args(argv)
+
+    serie = almacen.cargar_diaria(os.path.join(RAIZ, "indices", "activa.json"))
+    lista = corridas(serie, args.dias, args.rearmado)
+    copias = sum(len(almacen.serializar(data)) for _, data in lista[::50]) * 50
+
+    with tempfile.TemporaryDirectory(prefix="finfocus-historial-") as tmp:
+        path = os.path.join(tmp, "activa.json")
+        h = historial.Historial(path)
+        t = time.perf_counter()
+        for instante, data in lista:
+            h.registrar(data, t=instante)
+        t_registrar = time.perf_counter() - t
+
+        t = time.perf_counter()
+        h = historial.Historial(path)
+        t_carga = time.perf_counter() - t
+
+        azar = random.Random(0)
+        claves = list(serie)[-args.dias - 400:]
+        pedidos = [(azar.choice(claves), T0 + azar.randrange(args.dias) * DIA) for _ in range(args.consultas)]
+        t = time.perf_counter()
+        for clave, instante in pedidos:
+            h.valor(clave, instante)
+        t_valor = time.perf_counter() - t
+
+        muestras = [T0 + azar.randrange(args.dias) * DIA for _ in range(20)]
+        t = time.perf_counter()
+        estados = [h.estado(instante) for instante in muestras]
+        t_estado = (time.perf_counter() - t) / len(muestras)
+        t = time.perf_counter()
+        rehechos = [replay(h.path, instante) for instante in muestras]
+        t_replay = (time.perf_counter() - t) / len(muestras)
+        iguales = all(a == dict(sorted(b.items())) for a, b in zip(estados, rehechos))
+        tamanio = os.path.getsize(h.path)
+
+    resultado = {
+        "corridas": len(lista), "revisiones": len(h.tiempos), "puntos": len(h.puntos),
+        "historial_kib": round(tamanio / 1024, 1), "copias_kib": round(copias / 1024, 1),
+        "registrar_ms": round(t_registrar / len(lista) * 1000, 3), "carga_ms": round(t_carga * 1000, 1),
+        "valor_us": round(t_valor / args.consultas * 1e6, 2),
+        "estado_ms": round(t_estado * 1000, 2), "replay_ms": round(t_replay * 1000, 2),
+        "iguales": iguales,
+    }
+    if args.json:
+        print(json.dumps(resultado, ensure_ascii=False, indent=2))
+        return
+    print(f"{resultado['corridas']} corridas, {resultado['revisiones']} revisiones, {resultado['puntos']} puntos")
+    print(f"historial {resultado['historial_kib']} KiB (una copia por corrida: {resultado['copias_kib']} KiB)")
+    print(f"registrar {resultado['registrar_ms']} ms por corrida, carga {resultado['carga_ms']} ms")
+    print(f"valor al día K: {resultado['valor_us']} µs; serie al día K: {resultado['estado_ms']} ms "
+          f"(releyendo las revisiones: {resultado['replay_ms']} ms, iguales: {resultado['iguales']})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compara el interés simple de una cartera sumando las tasas diarias de
+cada crédito contra los prefijos de finfocus_indices.intereses, y mide
+cuánto difieren (las sumas se agrupan distinto: difieren en redondeo).
+
+Las fechas se sortean dentro del rango de cada serie con una semilla fija
+(la misma cartera que bench_lote.py).
+
+Uso:
+  python benchmarks/bench_intereses.py [--creditos 10000] [--series activa,pasiva,cer] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_lote import cartera
+from finfocus_indices import intereses, series
+from finfocus_indices.series import EPOCA
+
+def sumando(prefijos, desdes, hastas):
+    """Suma de las tasas de (desde, hasta] de cada crédito, día por día."""
+    tasas = intereses.tasas_diarias(prefijos.inicio, prefijos._valores[:prefijos.n], prefijos.reglas)
+    i = desdes.astype(np.int64) + EPOCA - prefijos.inicio
+    j = hastas.astype(np.int64) + EPOCA - prefijos.inicio
+    return np.array([float(np.sum(tasas[a:b])) for a, b in zip(i.tolist(), j.tolist())])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--creditos", type=int, default=10_000)
+    parser.add_argument("--series", default="activa,pasiva,cer")
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de tabla")
+    args = parser.parse_args(argv)
+
+    resultados = []
+    for nombre in args.series.split(","):
+        _, desdes, hastas = cartera(series.obtener(nombre), args.creditos)
+
+        t0 = time.perf_counter()
+        prefijos = intereses.obtener(nombre)
+        t_armado = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        directo = sumando(prefijos, desdes, hastas)
+        t_suma = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        simple = prefijos.simple_lote(desdes, hastas)
+        t_prefijos = time.perf_counter() - t0
+
+        resultados.append({
+            "serie": nombre, "creditos": args.creditos,
+            "armado_ms": round(t_armado * 1000, 2), "suma_ms": round(t_suma * 1000, 2),
+            "prefijos_ms": round(t_prefijos * 1000, 3),
+            "desvio_max": float(np.max(np.abs(simple - directo))),
+        })
+
+    if args.json:
+        print(json.dumps(resultados, ensure_ascii=False, indent=2))
+        return
+    print(f"{'serie':<8}{'créditos':>10}{'armado ms':>11}{'suma ms':>10}{'prefijos ms':>13}{'desvío máx':>12}")
+    for r in resultados:
+        print(f"{r['serie']:<8}{r['creditos']:>10}{r['armado_ms']:>11.2f}{r['suma_ms']:>10.2f}"
+              f"{r['prefijos_ms']:>13.3f}{r['desvio_max']:>12.1e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Costo de journal.agregar() según el largo del journal y de leer() al
+final. La recuperación de una escritura cortada se prueba en
+tests/test_journal.py.
+
+Uso:
+  python benchmarks/bench_journal.py [--puntos 2000] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from finfocus_indices import journal
+
+def _dia(i):
+    return (date(2020, 1, 1) + timedelta(days=i)).isoformat()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--puntos", type=int, default=2000, help="entradas del journal al final")
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de texto")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        path = os.path.join(directorio, "largo.json")
+        tiempos = []
+        for i in range(args.puntos):
+            t0 = time.perf_counter()
+            journal.agregar(path, {_dia(i): float(i)})
+            tiempos.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        n = len(journal.leer(path))
+        lectura = time.perf_counter() - t0
+
+    cuarto = max(args.puntos // 4, 1)
+    resultado = {
+        "agregar_primeros_ms": round(sum(tiempos[:cuarto]) / cuarto * 1000, 3),
+        "agregar_ultimos_ms": round(sum(tiempos[-cuarto:]) / cuarto * 1000, 3),
+        "leer_ms": round(lectura * 1000, 2), "entradas": n,
+    }
+    if args.json:
+        print(json.dumps(resultado, indent=2))
+        return
+    print(f"agregar: {resultado['agregar_primeros_ms']} ms al principio, "
+          f"{resultado['agregar_ultimos_ms']} ms con {n} entradas; leer: {resultado['leer_ms']} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compara actualizar una cartera crédito por crédito (Serie.coeficiente)
+contra finfocus_indices.lote.actualizar, y verifica que los montos sean
+idénticos.
+
+Las fechas se sortean dentro del rango de cada serie con una semilla fija.
+
+Uso:
+  python benchmarks/bench_lote.py [--creditos 100000] [--indices activa,pasiva,cer,ripte] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from finfocus_indices import lote, series
+
+def cartera(serie, n, semilla=0):
+    rng = np.random.default_rng(semilla)
+    primera = np.datetime64(serie.primera, "D")
+    ultima = np.datetime64(serie.ultima[0], "D")
+    dias = int((ultima - primera).astype(np.int64))
+    a = rng.integers(0, dias + 1, n)
+    b = rng.integers(0, dias + 1, n)
+    desdes = primera + np.minimum(a, b)
+    hastas = primera + np.maximum(a, b)
+    capitales = np.round(rng.uniform(1_000, 5_000_000, n), 2)
+    return capitales, desdes, hastas
+
+def escalar(serie, capitales, desdes, hastas):
+    return [c * serie.coeficiente(d, h) for c, d, h in
+            zip(capitales.tolist(), desdes.tolist(), hastas.tolist())]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--creditos", type=int, default=100_000)
+    parser.add_argument("--indices", default="activa,pasiva,cer,ripte")
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de tabla")
+    args = parser.parse_args(argv)
+
+    resultados = []
+    for indice in args.indices.split(","):
+        serie = series.obtener(indice)
+        capitales, desdes, hastas = cartera(serie, args.creditos)
+        serie.valor(date.today())                   # carga e índice fuera de la medición
+
+        t0 = time.perf_counter()
+        uno_a_uno = escalar(serie, capitales, desdes, hastas)
+        t_escalar = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        montos, _ = lote.actualizar(capitales, desdes, hastas, indice)
+        t_lote = time.perf_counter() - t0
+
+        resultados.append({
+            "indice": indice, "creditos": args.creditos,
+            "escalar_ms": round(t_escalar * 1000, 2), "lote_ms": round(t_lote * 1000, 2),
+            "identicos": montos.tolist() == uno_a_uno,
+        })
+
+    if args.json:
+        print(json.dumps(resultados, ensure_ascii=False, indent=2))
+        return
+    print(f"{'índice':<8}{'créditos':>10}{'escalar ms':>12}{'lote ms':>10}{'idénticos':>11}")
+    for r in resultados:
+        print(f"{r['indice']:<8}{r['creditos']:>10}{r['escalar_ms']:>12.2f}{r['lote_ms']:>10.2f}"
+              f"{'sí' if r['identicos'] else 'NO':>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Prueba de carga del servicio de consulta (finfocus_indices/servicio.py).
+
+Abre --conexiones conexiones keep-alive y, durante --segundos, cada una
+manda consultas de la mezcla elegida lo más rápido que puede (una a la
+vez, como una calculadora). Informa consultas por segundo y latencias
+p50 / p99 / máxima por tipo de consulta.
+
+Sin --url levanta el servicio en un hilo de este proceso sobre indices/
+y accidente/ del repo (cliente y servidor comparten la CPU: para números
+limpios, correr el servicio aparte y pasar --url).
+
+Uso:
+  python benchmarks/carga_servicio.py [--conexiones 32] [--segundos 10]
+  python benchmarks/carga_servicio.py --url http://127.0.0.1:8765 --mezcla valor,coeficiente
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import urlsplit
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from finfocus_indices import servicio
+
+INICIO = date(2003, 1, 1).toordinal()
+FIN    = date(2025, 7, 1).toordinal()
+LOTE   = 1000
+
+def fecha_al_azar(rnd):
+    return date.fromordinal(rnd.randint(INICIO, FIN)).isoformat()
+
+def consultas(rnd):
+    """{tipo: fn() → (método, objetivo, cuerpo)}."""
+    def valor():
+        return "GET", f"/valor/{rnd.choice(('cer', 'pasiva', 'activa', 'ripte'))}?fecha={fecha_al_azar(rnd)}", b""
+    def rango():
+        desde = date.fromordinal(rnd.randint(INICIO, FIN - 31))
+        return "GET", f"/rango/cer?desde={desde}&hasta={desde + timedelta(days=30)}", b""
+    def coeficiente():
+        a, b = sorted((fecha_al_azar(rnd), fecha_al_azar(rnd)))
+        return "GET", f"/coeficiente/cer?desde={a}&hasta={b}", b""
+    def tope():
+        return "GET", f"/tope/{rnd.choice(('3', '11.a', '14.b'))}?fecha={rnd.randint(2010, 2025)}-06-01", b""
+    def lote():
+        pares = [sorted((fecha_al_azar(rnd), fecha_al_azar(rnd))) for _ in range(LOTE)]
+        cuerpo = {"serie": "cer", "desdes": [a for a, _ in pares], "hastas": [b for _, b in pares]}
+        return "POST", "/lote/coeficientes", json.dumps(cuerpo).encode("utf-8")
+    return {"valor": valor, "rango": rango, "coeficiente": coeficiente, "tope": tope, "lote": lote}
+
+async def cliente(host, puerto, tipos, generadores, hasta, latencias, errores):
+    reader, writer = await asyncio.open_connection(host, puerto)
+    try:
+        while time.perf_counter() < hasta:
+            tipo = random.choice(tipos)
+            metodo, objetivo, cuerpo = generadores[tipo]()
+            pedido = (f"{metodo} {objetivo} HTTP/1.1\r\nHost: {host}\r\n"
+                      f"Content-Length: {len(cuerpo)}\r\n\r\n").encode("latin-1") + cuerpo
+            t0 = time.perf_counter()
+            writer.write(pedido)
+            cabecera = await reader.readuntil(b"\r\n\r\n")
+            largo = 0
+            for linea in cabecera.decode("latin-1").split("\r\n"):
+                if linea.lower().startswith("content-length:"):
+                    largo = int(linea.split(":", 1)[1])
+            await reader.readexactly(largo)
+            latencias[tipo].append(time.perf_counter() - t0)
+            if not cabecera.startswith(b"HTTP/1.1 200"):
+                errores[tipo] = errores.get(tipo, 0) + 1
+    finally:
+        writer.close()
+
+async def correr(host, puerto, tipos, conexiones, segundos):
+    latencias = {t: [] for t in tipos}
+    errores = {}
+    hasta = time.perf_counter() + segundos
+    await asyncio.gather(*(cliente(host, puerto, tipos, consultas(random.Random(i)), hasta, latencias, errores)
+                           for i in range(conexiones)))
+    return latencias, errores
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(int(len(ordenados) * p), len(ordenados) - 1)]
+
+def servicio_local():
+    """Levanta el servicio en un hilo y devuelve su puerto."""
+    listo = threading.Event()
+    puerto = []
+    def listo_en(p):
+        puerto.append(p)
+        listo.set()
+    srv = servicio.Servicio()
+    hilo = threading.Thread(target=lambda: asyncio.run(srv.servir("127.0.0.1", 0, listo_en)), daemon=True)
+    hilo.start()
+    listo.wait()
+    return puerto[0]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="servicio ya levantado (por defecto, uno en este proceso)")
+    parser.add_argument("--conexiones", type=int, default=32)
+    parser.add_argument("--segundos", type=float, default=10)
+    parser.add_argument("--mezcla", default="valor,rango,coeficiente,tope",
+                        help="tipos de consulta: valor, rango, coeficiente, tope, lote")
+    parser.add_argument("--salida", help="guardar el resultado en JSON")
+    args = parser.parse_args(argv)
+    tipos = args.mezcla.split(",")
+    desconocidos = set(tipos) - set(consultas(random.Random()))
+    if desconocidos:
+        parser.error(f"tipos desconocidos: {', '.join(sorted(desconocidos))}")
+
+    if args.url:
+        url = urlsplit(args.url)
+        host, puerto = url.hostname, url.port or 80
+    else:
+        host, puerto = "127.0.0.1", servicio_local()
+
+    latencias, errores = asyncio.run(correr(host, puerto, tipos, args.conexiones, args.segundos))
+    total = sum(len(v) for v in latencias.values())
+    resultado = {"conexiones": args.conexiones, "segundos": args.segundos,
+                 "consultas": total, "por_segundo": round(total / args.segundos, 1),
+                 "errores": errores, "tipos": {}}
+    print(f"{total} consultas en {args.segundos:g} s con {args.conexiones} conexiones: "
+          f"{total / args.segundos:,.0f} consultas/s")
+    print(f"{'tipo':<13}{'n':>9}{'p50 ms':>10}{'p99 ms':>10}{'máx ms':>10}")
+    todas = []
+    for tipo, valores in latencias.items():
+        if not valores:
+            continue
+        todas += valores
+        fila = {"n": len(valores), "p50_ms": round(statistics.median(valores) * 1000, 3),
+                "p99_ms": round(percentil(valores, 0.99) * 1000, 3), "max_ms": round(max(valores) * 1000, 3)}
+        resultado["tipos"][tipo] = fila
+        print(f"{tipo:<13}{fila['n']:>9}{fila['p50_ms']:>10.3f}{fila['p99_ms']:>10.3f}{fila['max_ms']:>10.3f}")
+    if todas:
+        resultado["p99_ms"] = round(percentil(todas, 0.99) * 1000, 3)
+        print(f"{'total':<13}{len(todas):>9}{statistics.median(todas) * 1000:>10.3f}"
+              f"{resultado['p99_ms']:>10.3f}{max(todas) * 1000:>10.3f}")
+    if errores:
+        print(f"Respuestas no 200: {errores}")
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+    return 1 if errores else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Suite de benchmarks de las etapas de cada updater: carga, extracción,
+cálculo y guardado.
+
+Cada caso corre sobre una copia sintética de indices/ en un directorio
+temporal, escalada 1x/10x/100x (activa 1x son ~9.300 días, 10x ~93.000).
+Las series mensuales sólo se escalan hasta lo que admiten las claves
+"mmm-yy" (100 años), así que sus casos corren siempre en 1x. Las páginas
+de fixtures/paginas/ se agrandan con relleno proporcional a la escala.
+
+La salida es JSON (un registro por etapa, caso y escala) para guardar y
+comparar corridas:
+
+  python benchmarks/suite.py --salida bench.json
+  python benchmarks/suite.py --comparar bench.json      # ratios contra una corrida anterior
+
+Uso:
+  python benchmarks/suite.py [--escalas 1,10,100] [--repeticiones 5] [--etapas carga,calculo]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import update_activa
+import update_ripte
+import update_smvm
+from bench_extraccion import FUENTES, PAGINAS, rellenar
+from finfocus_indices import almacen, bcra, tasas
+
+ETAPAS = ("carga", "extraccion", "calculo", "guardado")
+
+def medir(fn, repeticiones):
+    """(mejor, mediana) en ms de `repeticiones` llamadas a fn()."""
+    tiempos = []
+    for i in range(repeticiones):
+        t0 = time.perf_counter()
+        fn(i)
+        tiempos.append((time.perf_counter() - t0) * 1000)
+    return min(tiempos), statistics.median(tiempos)
+
+def activa_sintetica(escala):
+    """activa.json real repetida hacia adelante hasta tener `escala` veces sus días."""
+    real = almacen.leer_json(os.path.join(RAIZ, "indices", "activa.json"))
+    valores = list(real.values())
+    n = len(valores) * escala
+    inicio = date.fromisoformat(next(iter(real)))
+    return {(inicio + timedelta(days=i)).isoformat(): valores[i % len(valores)] for i in range(n)}
+
+def preparar(directorio, escala):
+    """indices/ sintético en `directorio`: activa escalada, el resto como está."""
+    shutil.copytree(os.path.join(RAIZ, "indices"), os.path.join(directorio, "indices"))
+    for ext in (".bin", ".journal"):
+        path = os.path.join(directorio, "indices", "activa" + ext)
+        if os.path.exists(path):
+            os.remove(path)
+    data = activa_sintetica(escala)
+    # con coma colgante, como las que tolera cargar_activa
+    texto = almacen.serializar(data).decode("utf-8")
+    with open(os.path.join(directorio, "indices", "activa.json"), "w", encoding="utf-8") as f:
+        f.write(texto[:-2] + ",\n}")
+    return data
+
+def capitalizar_antes(prev_val, tasa_diaria, inicio, hoy):
+    """El bucle de update_activa.main() previo al motor de tasas."""
+    nuevos = {}
+    dia = inicio
+    while dia <= hoy:
+        nueva = round(prev_val * (1 + tasa_diaria), 6)
+        nuevos[dia.isoformat()] = nueva
+        prev_val = nueva
+        dia += timedelta(days=1)
+    return nuevos
+
+def casos(escala, data):
+    """{etapa: [(caso, n, fn(i))]} para una escala ya preparada en el cwd."""
+    path = almacen.path_json("activa")
+    paginas = {}
+    for fuente, ruta in FUENTES.items():
+        with open(os.path.join(PAGINAS, ruta), encoding="utf-8") as f:
+            html = f.read()
+        paginas[fuente] = rellenar(html, (escala - 1) * len(html) // 1024)
+    fin = date.fromisoformat(next(reversed(data)))
+    tna = 1.0                      # baja, para que 100x (~2.500 años) no desborde
+    inicio = date.fromisoformat(next(iter(data))) + timedelta(days=1)
+    ripte = update_ripte.cargar_ripte()
+    smvm = update_smvm.cargar_smvm()
+
+    def variar(d, i):
+        # los guardados no reescriben si no cambió nada: tocar un valor
+        d = dict(d)
+        k = next(reversed(d))
+        d[k] = d[k] + i + 1
+        return d
+
+    return {
+        "carga": [
+            ("leer_json activa (regex de comas)", len(data), lambda i: almacen.leer_json(path)),
+            ("cargar_activa", len(data), lambda i: update_activa.cargar_activa()),
+            ("abrir_diaria activa (.bin)", len(data), lambda i: almacen.abrir_diaria(path)),
+            ("cargar_ripte", len(ripte), lambda i: update_ripte.cargar_ripte()),
+            ("cargar_smvm", len(smvm), lambda i: update_smvm.cargar_smvm()),
+        ],
+        "extraccion": [
+            ("bcra.extraer_variables", len(paginas["bcra"]), lambda i: bcra.extraer_variables(paginas["bcra"])),
+            ("obtener_tna_y_vigencia", len(paginas["bna"]),
+             lambda i: update_activa.obtener_tna_y_vigencia(paginas["bna"])),
+            ("obtener_ripte", len(paginas["ripte"]), lambda i: update_ripte.obtener_ripte(paginas["ripte"])),
+            ("obtener_smvm", len(paginas["smvm"]), lambda i: update_smvm.obtener_smvm(paginas["smvm"])),
+        ],
+        "calculo": [
+            ("capitalizar activa (bucle anterior)", len(data) - 1,
+             lambda i: capitalizar_antes(100.0, tna / 100 / 365, inicio, fin)),
+            ("capitalizar activa (tasas.regenerar)", len(data) - 1,
+             lambda i: tasas.regenerar(100.0, [(inicio, tna)], inicio, fin)),
+            ("capitalizar activa (sin redondeo)", len(data) - 1,
+             lambda i: tasas.regenerar(100.0, [(inicio, tna)], inicio, fin, decimales=None)),
+        ],
+        "guardado": [
+            ("serializar activa", len(data), lambda i: almacen.serializar(data)),
+            ("guardar_activa", len(data), lambda i: update_activa.guardar_activa(variar(data, i))),
+            ("guardar_ripte", len(ripte), lambda i: update_ripte.guardar_ripte(variar(ripte, i))),
+            ("guardar_smvm", len(smvm), lambda i: update_smvm.guardar_smvm(variar(smvm, i))),
+        ],
+    }
+
+def commit_actual():
+    try:
+        return subprocess.run(["git", "-C", RAIZ, "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def correr(escalas, etapas, repeticiones):
+    resultados = []
+    cwd = os.getcwd()
+    for escala in escalas:
+        with tempfile.TemporaryDirectory(prefix="finfocus-bench-") as tmp:
+            data = preparar(tmp, escala)
+            os.chdir(tmp)
+            try:
+                update_activa.cargar_activa()           # arma el .bin fuera de la medición
+                for etapa, lista in casos(escala, data).items():
+                    if etapa not in etapas:
+                        continue
+                    for caso, n, fn in lista:
+                        mejor, mediana = medir(fn, repeticiones)
+                        resultados.append({"etapa": etapa, "caso": caso, "escala": escala, "n": n,
+                                           "mejor_ms": round(mejor, 3), "mediana_ms": round(mediana, 3)})
+            finally:
+                os.chdir(cwd)
+    return resultados
+
+def comparar(actual, anterior):
+    previos = {(r["etapa"], r["caso"], r["escala"]): r for r in anterior["resultados"]}
+    print(f"{'etapa':<11}{'caso':<40}{'esc':>5}{'antes ms':>11}{'ahora ms':>11}{'ratio':>8}")
+    for r in actual["resultados"]:
+        p = previos.get((r["etapa"], r["caso"], r["escala"]))
+        if not p:
+            continue
+        ratio = r["mejor_ms"] / p["mejor_ms"] if p["mejor_ms"] else float("inf")
+        print(f"{r['etapa']:<11}{r['caso']:<40}{r['escala']:>5}{p['mejor_ms']:>11.3f}"
+              f"{r['mejor_ms']:>11.3f}{ratio:>8.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--escalas", default="1,10,100")
+    parser.add_argument("--etapas", default=",".join(ETAPAS))
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--salida", help="archivo donde guardar el JSON (por defecto, stdout)")
+    parser.add_argument("--comparar", metavar="JSON", help="corrida anterior contra la cual comparar")
+    args = parser.parse_args(argv)
+
+    etapas = args.etapas.split(",")
+    desconocidas = set(etapas) - set(ETAPAS)
+    if desconocidas:
+        parser.error(f"etapas desconocidas: {', '.join(sorted(desconocidas))}")
+
+    salida = {
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit_actual(),
+        "python": platform.python_version(),
+        "maquina": platform.machine(),
+        "resultados": correr([int(e) for e in args.escalas.split(",")], etapas, args.repeticiones),
+    }
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            comparar(salida, json.load(f))
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(salida, f, ensure_ascii=False, indent=2)
+    elif not args.comparar:
+        print(json.dumps(salida, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
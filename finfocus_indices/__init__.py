@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+Herramientas compartidas por los scripts update_*.py.
+"""
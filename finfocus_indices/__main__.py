@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Línea de comandos única de finfocus.
+
+Cada subcomando importa sólo lo que usa: las consultas (get, range, coef)
+leen con consulta.py, sin NumPy ni requests, y responden en lo que tarda
+en arrancar Python; update corre update_all.py, export exportar.py y
+convert frecuencia.py, con todas sus opciones.
+
+Uso:
+  ./finfocus update [serie ...|all] [opciones de update_all.py]
+  ./finfocus get SERIE FECHA [--exacto] [--json]
+  ./finfocus range SERIE DESDE HASTA [--json]
+  ./finfocus coef SERIE DESDE HASTA [--json]
+  ./finfocus export DESTINO [--series a,b] [--frecuencia mensual] [opciones de exportar.py]
+  ./finfocus convert SERIE:METODO [...] [opciones de frecuencia.py]
+
+(o python -m finfocus_indices ...). Las fechas van en formato AAAA-MM-DD;
+las series mensuales toman el mes de la fecha.
+
+--indices DIR puede ir antes del subcomando y vale para todos: las
+consultas, export y convert leen de DIR, y update actualiza DIR (que
+tiene que llamarse indices/, como lo esperan los update_*.py).
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import date
+
+def _update(argumentos, indices=None):
+    from finfocus_indices import formato
+    sys.path.insert(0, formato.RAIZ)
+    import update_all
+    argumentos = [a for a in argumentos if a != "all"]
+    if indices:
+        # los update_*.py escriben en indices/ relativo al directorio de trabajo
+        indices = os.path.abspath(indices)
+        if os.path.basename(indices) != "indices":
+            sys.exit(f"finfocus: update --indices necesita un directorio llamado indices/ (no {indices})")
+        argumentos = ["--directorio", os.path.dirname(indices)] + argumentos
+    return update_all.main(argumentos)
+
+def _serie(args):
+    from finfocus_indices import consulta
+    return consulta.obtener(args.serie, args.indices)
+
+def _get(args):
+    serie = _serie(args)
+    if args.exacto:
+        valor = serie.valor(args.fecha)
+        dato = (args.fecha, valor) if valor is not None else None
+    else:
+        dato = serie.ultimo_hasta(args.fecha)
+    if args.json:
+        print(json.dumps({"serie": args.serie, "fecha": args.fecha.isoformat(),
+                          "valor": dato[1] if dato else None,
+                          "fecha_dato": dato[0].isoformat() if dato else None}))
+    elif dato is None:
+        print(f"{args.serie}: sin dato {'el' if args.exacto else 'en o antes del'} {args.fecha.isoformat()}",
+              file=sys.stderr)
+    else:
+        nota = f"  (dato del {dato[0].isoformat()})" if dato[0] != args.fecha else ""
+        print(f"{dato[1]}{nota}")
+    return 0 if dato else 1
+
+def _range(args):
+    puntos = _serie(args).rango(args.desde, args.hasta)
+    if args.json:
+        print(json.dumps({"serie": args.serie, "fechas": [f.isoformat() for f, _ in puntos],
+                          "valores": [v for _, v in puntos]}))
+    else:
+        sys.stdout.writelines(f"{f.isoformat()}\t{v}\n" for f, v in puntos)
+    return 0
+
+def _coef(args):
+    try:
+        coef = _serie(args).coeficiente(args.desde, args.hasta)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps({"serie": args.serie, "desde": args.desde.isoformat(),
+                          "hasta": args.hasta.isoformat(), "coeficiente": coef}))
+    else:
+        print(coef)
+    return 0
+
+def _export(argumentos, indices=None):
+    from finfocus_indices import exportar
+    return exportar.main(argumentos + (["--indices", indices] if indices else []))
+
+def _convert(argumentos, indices=None):
+    from finfocus_indices import frecuencia
+    return frecuencia.main(argumentos + (["--indices", indices] if indices else []))
+
+def _subcomando(argv):
+    """Posición del primer argumento que no es una opción global (ni su valor)."""
+    i = 0
+    while i < len(argv) and (argv[i] == "--indices" or argv[i].startswith("--indices=")):
+        i += 1 if "=" in argv[i] else 2
+    return min(i, len(argv))
+
+# subcomandos que pasan sus argumentos tal cual al script que delegan
+DELEGADOS = {"update": _update, "actualizar": _update, "export": _export, "exportar": _export,
+             "convert": _convert, "convertir": _convert}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # las opciones globales que van antes del subcomando valen también para los delegados
+    i = _subcomando(argv)
+    if i < len(argv) and argv[i] in DELEGADOS:
+        globales = argparse.ArgumentParser(prog="finfocus", allow_abbrev=False)
+        globales.add_argument("--indices")
+        return DELEGADOS[argv[i]](argv[i + 1:], globales.parse_args(argv[:i]).indices)
+
+    parser = argparse.ArgumentParser(prog="finfocus", description="Índices de finfocus.")
+    parser.add_argument("--indices", default=None, help="directorio de las series (por defecto, indices/)")
+    sub = parser.add_subparsers(dest="comando", required=True, metavar="COMANDO")
+
+    sub.add_parser("update", aliases=["actualizar"], help="actualizar series (update_all.py)")
+
+    p = sub.add_parser("get", aliases=["valor"], help="valor de una serie en una fecha")
+    p.add_argument("serie")
+    p.add_argument("fecha", type=date.fromisoformat)
+    p.add_argument("--exacto", action="store_true", help="sólo el dato de ese día o mes")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(fn=_get)
+
+    p = sub.add_parser("range", aliases=["rango"], help="datos de una serie entre dos fechas")
+    p.add_argument("serie")
+    p.add_argument("desde", type=date.fromisoformat)
+    p.add_argument("hasta", type=date.fromisoformat)
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(fn=_range)
+
+    p = sub.add_parser("coef", aliases=["coeficiente"], help="valor(hasta) / valor(desde)")
+    p.add_argument("serie")
+    p.add_argument("desde", type=date.fromisoformat)
+    p.add_argument("hasta", type=date.fromisoformat)
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(fn=_coef)
+
+    sub.add_parser("export", aliases=["exportar"], help="tabla alineada de varias series (exportar.py)")
+    sub.add_parser("convert", aliases=["convertir"], help="series diarias a mensuales y al revés (frecuencia.py)")
+
+    args = parser.parse_args(argv)
+    from finfocus_indices import formato
+    args.indices = args.indices or formato.DIR_INDICES
+    if args.serie not in formato.DIARIAS + formato.MENSUALES:
+        parser.error(f"serie desconocida: {args.serie} "
+                     f"(una de {', '.join(formato.DIARIAS + formato.MENSUALES)})")
+    return args.fn(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lectura y escritura de las series diarias sobre el almacén binario.
+
+El .bin (ver binario.py) es la fuente de verdad; el JSON de al lado se
+regenera desde él en cada guardado para que los consumidores existentes
+sigan funcionando. Si el JSON se editó a mano (su hash ya no coincide con
+el registrado en el .bin), gana el JSON: las lecturas lo toman de él sin
+escribir nada, y el .bin se reconstruye (y la edición queda en el
+historial) en el próximo guardado.
+
+Con FINFOCUS_MODO_ESCRITURA=journal (el del workflow diario), agregar_diaria()
+sólo suma los puntos nuevos al journal (ver journal.py) y las lecturas
+combinan base + journal. El journal se vuelca en la base al pasar
+MAX_JOURNAL entradas o MAX_JOURNAL_DIAS días (compactar_si_corresponde, que
+corre update_all.py); hasta entonces el .json publicado no incluye esos
+puntos y los .journal se publican junto a él. Sin la variable (corridas
+locales) se usa el modo completo, que reescribe la base en cada guardado.
+
+Toda escritura de una serie deja además sus cambios en el historial de
+revisiones (ver historial.py); los agregados del journal sólo anotan al
+final del .historial los puntos que cambiaron, sin cargarlo.
+
+Las series están en DIR_INDICES (formato.DIR_INDICES: FINFOCUS_INDICES o
+indices/ del repo), salvo que se pase otro directorio.
+
+Uso:
+  python -m finfocus_indices.almacen construir [serie ...]   # .bin desde los JSON
+  python -m finfocus_indices.almacen exportar [serie ...]    # JSON desde los .bin
+  python -m finfocus_indices.almacen compactar [serie ...]   # journal → base
+"""
+
+import json
+import os
+import re
+import sys
+from datetime import date
+
+from finfocus_indices import binario, formato, historial, journal, metricas
+
+DIR_INDICES = formato.DIR_INDICES     # update_all.py --directorio lo cambia
+DIARIAS     = formato.DIARIAS
+
+MODO_ESCRITURA   = os.environ.get("FINFOCUS_MODO_ESCRITURA", "completo")  # o "journal"
+MAX_JOURNAL      = 30
+MAX_JOURNAL_DIAS = 7
+
+def path_json(serie, directorio=None):
+    return os.path.join(directorio or DIR_INDICES, f"{serie}.json")
+
+def leer_json(path):
+    """Lee un JSON de índices tolerando comas colgantes antes de } o ]."""
+    with metricas.etapa("carga"):
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        return json.loads(re.sub(r',\s*([}\]])', r'\1', text))
+
+def serializar(data):
+    """Mismo formato que los update_*.py: indent=2, sin escapar acentos."""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _escribir_atomico(path, contenido):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(contenido)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    metricas.sumar("bytes_escritos", len(contenido))
+
+def _mismo_contenido(path, contenido):
+    try:
+        with open(path, "rb") as f:
+            return f.read() == contenido
+    except FileNotFoundError:
+        return False
+
+def guardar_json(path, data):
+    """
+    Escribe un JSON de índices (mensuales o no) sólo si cambia su
+    contenido, de forma atómica. Devuelve True si escribió.
+    """
+    with metricas.etapa("escritura"):
+        contenido = serializar(data)
+        if _mismo_contenido(path, contenido):
+            return False
+        historial.sembrar(path, lambda: leer_json(path))
+        _escribir_atomico(path, contenido)
+        historial.registrar(path, data)
+        return True
+
+def firma(path):
+    """
+    (mtime_ns, tamaño) del JSON, el .bin y el journal de `path` (None si
+    falta alguno): cambia cuando cambia algo de lo que se lee de la serie.
+    Sirve para invalidar lo que se calcula a partir de ella.
+    """
+    partes = []
+    for p in (path, binario.path_binario(path), journal.path_journal(path)):
+        try:
+            st = os.stat(p)
+            partes.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            partes.append(None)
+    return tuple(partes)
+
+def _bin_vigente(path):
+    """True si el .bin existe y corresponde al JSON actual (ver formato.bin_vigente)."""
+    return formato.bin_vigente(path)
+
+def _bin_al_dia(path):
+    """True si el encabezado del .bin tiene la mtime y el tamaño actuales del JSON."""
+    try:
+        encabezado = binario.leer_encabezado(binario.path_binario(path))
+    except (FileNotFoundError, ValueError):
+        return False
+    st = os.stat(path)
+    return encabezado[3:] == (st.st_mtime_ns, st.st_size)
+
+def _cargar_base(path):
+    """Base sin el journal: del .bin si está al día, si no del JSON (sin escribir)."""
+    if _bin_vigente(path):
+        return binario.abrir(binario.path_binario(path)).a_dict()
+    if not os.path.exists(path):
+        return {}
+    # El JSON cambió por fuera del almacén: se lee de él y el .bin se
+    # reconstruye en el próximo guardado (ver _registrar_edicion)
+    return binario.a_dict(*binario.desde_dict(leer_json(path)))
+
+def cargar_diaria(path):
+    """
+    Devuelve la serie diaria de `path` (indices/<serie>.json) como dict
+    {"YYYY-MM-DD": valor} ordenado por fecha: la base (del .bin si está al
+    día) más lo pendiente en el journal.
+    """
+    with metricas.etapa("carga"):
+        data = _cargar_base(path)
+        pendientes = journal.leer(path)
+        if pendientes:
+            data.update(pendientes)
+            data = dict(sorted(data.items()))
+        return data
+
+def abrir_diaria(path):
+    """
+    SerieDiaria de `path`: mapeada en memoria desde el .bin si está al día
+    y no hay journal pendiente; si no, armada en memoria desde el JSON y
+    el journal. Nunca escribe.
+    """
+    with metricas.etapa("carga"):
+        if not journal.entradas(path) and _bin_vigente(path):
+            return binario.abrir(binario.path_binario(path))
+        inicio, valores = binario.desde_dict(cargar_diaria(path))
+        return binario.SerieDiaria(inicio, valores)
+
+def _guardar_base(path, data):
+    with metricas.etapa("escritura"):
+        inicio, valores = binario.desde_dict(data)
+        contenido = serializar(binario.a_dict(inicio, valores))
+        if not _mismo_contenido(path, contenido):
+            _escribir_atomico(path, contenido)
+        elif _bin_al_dia(path):
+            return
+        # el JSON primero: el .bin guarda su mtime y tamaño (si se corta en
+        # el medio, el .bin viejo no le corresponde y gana el JSON nuevo)
+        st = os.stat(path)
+        binario.escribir(binario.path_binario(path), inicio, valores, binario.hash_json(contenido),
+                         st.st_mtime_ns, st.st_size)
+
+def _registrar_edicion(path):
+    """
+    Antes de escribir: si el JSON se editó por fuera del almacén (el .bin
+    no le corresponde), deja esa versión en el historial para no perderla.
+    """
+    historial.sembrar(path, lambda: cargar_diaria(path))
+    if os.path.exists(path) and not _bin_vigente(path):
+        historial.registrar(path, cargar_diaria(path))
+
+def _cambiados(path, puntos):
+    """
+    Los días de `puntos` cuyo valor difiere del actual, buscados en el
+    journal y en el .bin mapeado: sin cargar la serie entera.
+    """
+    pendientes = journal.leer(path)
+    if _bin_vigente(path):
+        base = binario.abrir(binario.path_binario(path))
+    else:
+        base = binario.SerieDiaria(*binario.desde_dict(_cargar_base(path)))
+    cambios = {}
+    for fecha, valor in puntos.items():
+        if fecha in pendientes:
+            previo = pendientes[fecha]
+        else:
+            previo = base.valor(date.fromisoformat(fecha)) if base.inicio else None
+        if previo != valor:
+            cambios[fecha] = valor
+    return cambios
+
+def guardar_diaria(path, data):
+    """
+    Reescribe la serie completa: el .bin y el JSON exportado desde él.
+    `data` debe ser la serie entera (como la devuelve cargar_diaria), así
+    que el journal queda incorporado y se vacía.
+    """
+    _registrar_edicion(path)
+    _guardar_base(path, data)
+    journal.vaciar(path)
+    historial.registrar(path, data)
+
+def agregar_diaria(path, puntos):
+    """
+    Agrega o reemplaza los días de `puntos`. En modo journal sólo escribe
+    esos puntos; en modo completo reescribe la base.
+    """
+    metricas.sumar("puntos_agregados", len(puntos))
+    if MODO_ESCRITURA == "journal":
+        _registrar_edicion(path)
+        cambios = _cambiados(path, puntos)
+        journal.agregar(path, puntos)
+        historial.anotar(path, cambios)
+        return
+    data = cargar_diaria(path)
+    data.update(puntos)
+    guardar_diaria(path, data)
+
+def compactar(path):
+    """Vuelca el journal en la base (.bin + JSON) y lo vacía."""
+    guardar_diaria(path, cargar_diaria(path))
+
+def compactar_si_corresponde(path):
+    """Compacta si el journal superó MAX_JOURNAL entradas o MAX_JOURNAL_DIAS días."""
+    n = len(journal.entradas(path))
+    if n and (n >= MAX_JOURNAL or journal.antiguedad(path) >= MAX_JOURNAL_DIAS * 86400):
+        compactar(path)
+        return True
+    return False
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ("construir", "exportar", "compactar"):
+        print(__doc__.split("Uso:")[1].rstrip())
+        return 2
+    series = argv[1:] or DIARIAS
+    for serie in series:
+        path = path_json(serie)
+        if argv[0] == "compactar":
+            n = len(journal.entradas(path))
+            compactar(path)
+            print(f"✅ {serie}: {n} entradas del journal volcadas en {path}")
+            continue
+        if argv[0] == "construir":
+            data = leer_json(path)
+        else:
+            data = binario.abrir(binario.path_binario(path)).a_dict()
+        _guardar_base(path, data)
+        print(f"✅ {serie}: {len(data)} días en {binario.path_binario(path)} y {path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Archivo de las páginas fuente descargadas, para poder reprocesarlas.
+
+Si una fuente cambia su HTML o aparece un error en un parser, los valores
+mal extraídos quedan en los JSON: sin las páginas originales no hay cómo
+volver a sacarlos. Con el archivo activado (update_all.py --archivar o
+FINFOCUS_ARCHIVAR=1; viene apagado), cache_http guarda acá cada versión
+nueva de cada página:
+
+  archivo/registro.jsonl       una línea por versión: {t, fuente, url, sha256, bytes}
+  archivo/objetos/ab/cd….xz    el cuerpo comprimido con lzma, direccionado por
+                               su sha256 (la misma versión se guarda una vez)
+  archivo/paquetes/…           empaquetar() junta los objetos sueltos de cada
+                               fuente y mes en un solo stream xz (las versiones
+                               de una misma página se parecen mucho: comprimidas
+                               juntas ocupan una fracción) con su índice .json
+
+reextraer() corre los parsers actuales sobre todas las versiones
+archivadas en un pool de procesos (uno por núcleo; cada tarea es un
+paquete o un lote de objetos sueltos, así que cada stream se descomprime
+una vez) y compara lo extraído con lo guardado. Con aplicar=True
+reescribe las series que difieren:
+
+  - pasiva, cer, ripte, smvm, inflacion_esperada: el valor de cada fecha o mes;
+  - inflacion: la variación del mes, encadenada sobre el mes anterior guardado;
+  - activa: el cronograma de T.N.A. extraído, capitalizado desde su primera
+    vigencia archivada hasta el último día guardado (tasas.regenerar_serie).
+
+ripte1 y ripte2 se recalculan solas desde ripte en la próxima corrida de
+update_all.py (pipeline.py detecta el cambio de su entrada).
+
+El directorio es archivo/ en la raíz del repo (no depende del directorio
+actual); FINFOCUS_ARCHIVO lo cambia y update_all.py --directorio DIR usa
+DIR/archivo, junto al indices/ que actualiza.
+
+Uso:
+  python -m finfocus_indices.archivo                       # resumen
+  python -m finfocus_indices.archivo empaquetar [--mes-actual]
+  python -m finfocus_indices.archivo reextraer [serie ...] [--procesos N] [--aplicar]
+"""
+
+import argparse
+import importlib
+import json
+import lzma
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from functools import lru_cache
+
+from finfocus_indices import almacen, formato, mensual
+
+DIR_ARCHIVO = os.path.abspath(os.environ.get("FINFOCUS_ARCHIVO") or os.path.join(formato.RAIZ, "archivo"))
+ENV_ARCHIVAR = "FINFOCUS_ARCHIVAR"
+REGISTRO    = "registro.jsonl"
+LOTE        = 64
+TOLERANCIA  = 1e-6
+
+# URL → fuente (los mismos nombres que pipeline.Nodo.fuentes)
+FUENTES = {
+    "https://www.bcra.gob.ar/PublicacionesEstadisticas/Principales_variables.asp": "bcra",
+    "https://www.bna.com.ar/home/informacionalusuariofinanciero": "bna",
+    "https://www.argentina.gob.ar/trabajo/seguridadsocial/ripte": "ripte",
+    "https://www.argentina.gob.ar/trabajo/consejodelsalario": "smvm",
+}
+SERIES = {
+    "bcra": ("pasiva", "cer", "inflacion", "inflacion_esperada"),
+    "bna": ("activa",),
+    "ripte": ("ripte",),
+    "smvm": ("smvm",),
+}
+
+# si cache_http archiva lo que descarga (update_all.py --archivar lo prende)
+archivar = os.environ.get(ENV_ARCHIVAR, "") not in ("", "0")
+
+_lock   = threading.Lock()
+_ultimas = {}          # directorio → {url: sha256 de su última versión}
+
+def _path(*partes, directorio=None):
+    return os.path.join(directorio or DIR_ARCHIVO, *partes)
+
+def _path_objeto(sha, directorio=None):
+    return _path("objetos", sha[:2], sha[2:] + ".xz", directorio=directorio)
+
+def _escribir_atomico(path, contenido):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(contenido)
+    os.replace(tmp, path)
+
+def registro(directorio=None):
+    """Entradas del registro en orden de descarga."""
+    try:
+        with open(_path(REGISTRO, directorio=directorio), "r", encoding="utf-8") as f:
+            return [json.loads(linea) for linea in f if linea.endswith("\n")]
+    except FileNotFoundError:
+        return []
+
+def _indice_paquetes(directorio=None):
+    """{sha256: (paquete, offset, largo)} de todos los paquetes."""
+    indice = {}
+    carpeta = _path("paquetes", directorio=directorio)
+    if not os.path.isdir(carpeta):
+        return indice
+    for nombre in sorted(os.listdir(carpeta)):
+        if nombre.endswith(".json"):
+            with open(os.path.join(carpeta, nombre), "r", encoding="utf-8") as f:
+                for sha, (offset, largo) in json.load(f).items():
+                    indice[sha] = (nombre[:-len(".json")], offset, largo)
+    return indice
+
+def guardar(url, texto, sha, directorio=None, t=None):
+    """
+    Archiva una versión de una página descargada en `t` (por defecto,
+    ahora). No hace nada si es la misma versión que la última de esa URL.
+    Devuelve True si agregó una entrada al registro.
+    """
+    directorio = directorio or DIR_ARCHIVO
+    with _lock:
+        if directorio not in _ultimas:
+            _ultimas[directorio] = {e["url"]: e["sha256"] for e in registro(directorio)}
+        ultimas = _ultimas[directorio]
+        if ultimas.get(url) == sha:
+            return False
+        path = _path_objeto(sha, directorio)
+        if not os.path.exists(path) and sha not in _indice_paquetes(directorio):
+            _escribir_atomico(path, lzma.compress(texto.encode("utf-8")))
+        entrada = {"t": t or datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                   "fuente": FUENTES.get(url), "url": url, "sha256": sha,
+                   "bytes": len(texto.encode("utf-8"))}
+        with open(_path(REGISTRO, directorio=directorio), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+        ultimas[url] = sha
+        return True
+
+@lru_cache(maxsize=4)
+def _paquete(path):
+    with open(path, "rb") as f:
+        return lzma.decompress(f.read())
+
+def leer(sha, directorio=None, indice=None):
+    """Texto de una versión archivada."""
+    path = _path_objeto(sha, directorio)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return lzma.decompress(f.read()).decode("utf-8")
+    indice = _indice_paquetes(directorio) if indice is None else indice
+    if sha not in indice:
+        raise KeyError(f"No está en el archivo: {sha}")
+    paquete, offset, largo = indice[sha]
+    datos = _paquete(_path("paquetes", paquete + ".xz", directorio=directorio))
+    return datos[offset:offset + largo].decode("utf-8")
+
+def empaquetar(directorio=None, mes_actual=False):
+    """
+    Mueve los objetos sueltos a un paquete por fuente y mes (el mes de su
+    primera descarga). Salvo `mes_actual`, sólo empaqueta meses cerrados:
+    así cada paquete se escribe una vez y no se reescribe en cada corrida.
+    Devuelve {paquete: objetos agregados}.
+    """
+    directorio = directorio or DIR_ARCHIVO
+    hoy = datetime.now(timezone.utc).strftime("%Y-%m")
+    grupos = defaultdict(list)
+    vistos = set()
+    with _lock:
+        for e in registro(directorio):
+            sha = e["sha256"]
+            if not mes_actual and e["t"][:7] >= hoy:
+                continue
+            if sha not in vistos and os.path.exists(_path_objeto(sha, directorio)):
+                vistos.add(sha)
+                grupos[f"{e['fuente'] or 'otra'}-{e['t'][:7]}"].append(sha)
+        agregados = {}
+        for nombre, shas in grupos.items():
+            path_xz = _path("paquetes", nombre + ".xz", directorio=directorio)
+            path_idx = _path("paquetes", nombre + ".json", directorio=directorio)
+            datos, indice = bytearray(), {}
+            if os.path.exists(path_xz):
+                with open(path_xz, "rb") as f:
+                    datos += lzma.decompress(f.read())
+                with open(path_idx, "r", encoding="utf-8") as f:
+                    indice = json.load(f)
+            for sha in shas:
+                if sha in indice:
+                    continue
+                with open(_path_objeto(sha, directorio), "rb") as f:
+                    cuerpo = lzma.decompress(f.read())
+                indice[sha] = [len(datos), len(cuerpo)]
+                datos += cuerpo
+            _escribir_atomico(path_xz, lzma.compress(bytes(datos), preset=6 | lzma.PRESET_EXTREME))
+            _escribir_atomico(path_idx, json.dumps(indice).encode("utf-8"))
+            _paquete.cache_clear()
+            for sha in shas:
+                os.remove(_path_objeto(sha, directorio))
+            agregados[nombre] = len(shas)
+        return agregados
+
+# Extractores: corren en los procesos del pool con los parsers actuales.
+# Cada uno devuelve {serie: {clave: valor}}.
+
+def _importar_script(nombre):
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if raiz not in sys.path:
+        sys.path.insert(0, raiz)
+    return importlib.import_module(nombre)
+
+def _extraer_bcra(html):
+    from finfocus_indices import bcra
+    salida = {}
+    for serie, (fecha, valor) in bcra.extraer_variables(html).items():
+        if serie in ("pasiva", "cer"):
+            clave = fecha.isoformat()
+        else:
+            clave = mensual.clave(mensual.indice_de_fecha(fecha))
+        salida[serie] = {clave: valor}
+    return salida
+
+def _extraer_bna(html):
+    tna, vigencia = _importar_script("update_activa").obtener_tna_y_vigencia(html)
+    return {"activa": {vigencia.isoformat(): tna}}
+
+def _extraer_ripte(html):
+    clave, valor = _importar_script("update_ripte").obtener_ripte(html)
+    return {"ripte": {clave: valor}}
+
+def _extraer_smvm(html):
+    clave, valor = _importar_script("update_smvm").obtener_smvm(html)
+    return {"smvm": {clave: valor}}
+
+EXTRACTORES = {"bcra": _extraer_bcra, "bna": _extraer_bna, "ripte": _extraer_ripte, "smvm": _extraer_smvm}
+
+def _procesar(tarea):
+    """Tarea del pool: [(t, fuente, sha)] → [(t, fuente, sha, extraído o None, error o None)]."""
+    directorio, entradas = tarea
+    indice = _indice_paquetes(directorio)
+    salida = []
+    for t, fuente, sha in entradas:
+        try:
+            salida.append((t, fuente, sha, EXTRACTORES[fuente](leer(sha, directorio, indice)), None))
+        except Exception as e:
+            salida.append((t, fuente, sha, None, f"{type(e).__name__}: {e}"))
+    return salida
+
+def _tareas(entradas, directorio):
+    """Agrupa las versiones por paquete (se descomprime una vez) o en lotes de LOTE."""
+    indice = _indice_paquetes(directorio)
+    grupos = defaultdict(list)
+    for e in entradas:
+        clave = indice[e["sha256"]][0] if e["sha256"] in indice else f"sueltos-{len(grupos)}"
+        grupos[clave].append((e["t"], e["fuente"], e["sha256"]))
+    tareas = []
+    for lista in grupos.values():
+        for i in range(0, len(lista), LOTE):
+            tareas.append((directorio, lista[i:i + LOTE]))
+    return tareas
+
+def _coincide(guardado, publicado):
+    """
+    True si lo guardado es lo publicado con más precisión: la página
+    redondea (1.6 % de inflación, RIPTE a 2 decimales) y lo guardado puede
+    venir de una fuente más precisa.
+    """
+    decimales = len(repr(float(publicado)).partition(".")[2])
+    return (round(guardado, decimales) == publicado
+            or abs(guardado - publicado) <= TOLERANCIA * max(abs(guardado), 1.0))
+
+def _reconstruir(serie, puntos, dir_indices):
+    """(guardado, nuevo) de la serie con los puntos extraídos aplicados."""
+    path = almacen.path_json(serie, dir_indices)
+    if serie in almacen.DIARIAS:
+        guardado = almacen.cargar_diaria(path)
+    else:
+        guardado = almacen.leer_json(path) if os.path.exists(path) else {}
+    nuevo = dict(guardado)
+    if serie == "activa":
+        from finfocus_indices import tasas
+        cronograma = sorted((date.fromisoformat(f), tna) for f, tna in puntos.items())
+        desde = cronograma[0][0]
+        hasta = date.fromisoformat(max(guardado))
+        if desde <= hasta:
+            nuevo.update(tasas.regenerar_serie(guardado, cronograma, desde, hasta))
+    elif serie == "inflacion":
+        from finfocus_indices import derivadas
+        for clave in sorted(puntos, key=mensual.parsear):
+            previa = mensual.clave(mensual.parsear(clave) - 1)
+            if previa not in nuevo:
+                raise RuntimeError(f"inflacion: falta {previa} para encadenar {clave}")
+            if clave in nuevo and _coincide((nuevo[clave] / nuevo[previa] - 1) * 100, puntos[clave]):
+                continue
+            variacion = mensual.desde_dict({clave: puntos[clave]})
+            nuevo[clave] = derivadas.encadenar(variacion, nuevo[previa]).ultimo()[1]
+    else:
+        nuevo.update({clave: valor for clave, valor in puntos.items()
+                      if clave not in guardado or not _coincide(guardado[clave], valor)})
+    return guardado, nuevo
+
+def reextraer(series=None, procesos=None, aplicar=False, directorio=None, dir_indices=None):
+    """
+    Corre los parsers actuales sobre todo el archivo y devuelve por serie
+    {versiones, errores, diferencias, nuevos, escrito}. Con `aplicar`
+    reescribe las series con diferencias o puntos nuevos.
+    """
+    directorio = directorio or DIR_ARCHIVO
+    series = list(series or [s for lista in SERIES.values() for s in lista])
+    fuentes = {f for f, lista in SERIES.items() if set(lista) & set(series)}
+    entradas = [e for e in registro(directorio) if e["fuente"] in fuentes]
+
+    resultados = []
+    tareas = _tareas(entradas, directorio)
+    if procesos == 1 or len(tareas) <= 1:
+        resultados = [r for t in tareas for r in _procesar(t)]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            for lote in pool.map(_procesar, tareas):
+                resultados.extend(lote)
+
+    # en orden de descarga: si dos versiones dan la misma clave, gana la última
+    resultados.sort(key=lambda r: r[0])
+    puntos = {s: {} for s in series}
+    resumen = {s: {"versiones": 0, "errores": [], "diferencias": [], "nuevos": [], "escrito": False}
+               for s in series}
+    for t, fuente, sha, extraido, error in resultados:
+        for serie in SERIES[fuente]:
+            if serie not in puntos:
+                continue
+            resumen[serie]["versiones"] += 1
+            if error:
+                resumen[serie]["errores"].append({"t": t, "sha256": sha, "error": error})
+            elif serie in extraido:
+                puntos[serie].update(extraido[serie])
+
+    for serie in series:
+        if not puntos[serie]:
+            continue
+        try:
+            guardado, nuevo = _reconstruir(serie, puntos[serie], dir_indices)
+        except RuntimeError as e:
+            resumen[serie]["errores"].append({"error": str(e)})
+            continue
+        for clave, valor in nuevo.items():
+            if clave not in guardado:
+                resumen[serie]["nuevos"].append({"clave": clave, "valor": valor})
+            elif guardado[clave] != valor:
+                resumen[serie]["diferencias"].append(
+                    {"clave": clave, "guardado": guardado[clave], "reextraido": valor})
+        if aplicar and (resumen[serie]["diferencias"] or resumen[serie]["nuevos"]):
+            path = almacen.path_json(serie, dir_indices)
+            if serie in almacen.DIARIAS:
+                almacen.guardar_diaria(path, dict(sorted(nuevo.items())))
+            else:
+                orden = sorted(nuevo, key=mensual.parsear)
+                almacen.guardar_json(path, {k: nuevo[k] for k in orden})
+            resumen[serie]["escrito"] = True
+    return resumen
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Archivo de páginas fuente y re-extracción.")
+    sub = parser.add_subparsers(dest="comando")
+    p = sub.add_parser("empaquetar", help="juntar los objetos sueltos de los meses cerrados en paquetes xz")
+    p.add_argument("--mes-actual", action="store_true", help="empaquetar también el mes en curso")
+    p = sub.add_parser("reextraer", help="correr los parsers actuales sobre todo el archivo")
+    p.add_argument("series", nargs="*", help="series a revisar (por defecto, todas)")
+    p.add_argument("--procesos", type=int, default=None, help="procesos del pool (por defecto, uno por núcleo)")
+    p.add_argument("--aplicar", action="store_true", help="reescribir las series que difieren")
+    args = parser.parse_args(argv)
+
+    if args.comando == "empaquetar":
+        for nombre, n in empaquetar(mes_actual=args.mes_actual).items():
+            print(f"✅ {nombre}: {n} versiones empaquetadas")
+        return 0
+    if args.comando == "reextraer":
+        validas = [s for lista in SERIES.values() for s in lista]
+        desconocidas = [s for s in args.series if s not in validas]
+        if desconocidas:
+            parser.error(f"series desconocidas: {', '.join(desconocidas)}")
+        t0 = time.perf_counter()
+        resumen = reextraer(args.series, args.procesos, args.aplicar)
+        print(json.dumps(resumen, ensure_ascii=False, indent=2))
+        print(f"Re-extracción en {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+        return 1 if any(r["diferencias"] and not r["escrito"] for r in resumen.values()) else 0
+
+    entradas = registro()
+    por_fuente = defaultdict(int)
+    for e in entradas:
+        por_fuente[e["fuente"]] += 1
+    total = 0
+    for raiz, _, archivos in os.walk(DIR_ARCHIVO):
+        total += sum(os.path.getsize(os.path.join(raiz, a)) for a in archivos)
+    crudo = sum(e["bytes"] for e in entradas)
+    print(f"{len(entradas)} versiones en {DIR_ARCHIVO} ({total / 1024:.1f} KiB en disco, "
+          f"{crudo / 1024:.1f} KiB sin comprimir)")
+    for fuente, n in sorted(por_fuente.items()):
+        print(f"  {fuente}: {n}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
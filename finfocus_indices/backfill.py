@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Carga masiva de historia desde exportaciones completas de las fuentes.
+
+Los scrapers sólo ven el último valor publicado; si una corrida no se hizo,
+el día se pierde. Este modo ingiere un CSV con la historia (las series del
+BCRA exportadas a CSV, la tabla histórica de RIPTE, etc.) y lo funde con la
+serie guardada:
+
+  - el archivo se lee en bloques de BLOQUE filas, cada bloque se convierte
+    a arreglos y se vuelca sobre el arreglo denso de la serie, así que la
+    memoria no depende del largo del archivo;
+  - cada valor que ya teníamos se compara con el del archivo (tolerancia
+    relativa); las diferencias se informan como conflictos y, salvo
+    --sobrescribir, no se escribe nada;
+  - al final se escribe la serie una sola vez.
+
+Formatos aceptados por fila (separador ; , o tab, detectado solo):
+  diarias:   2025-07-21 | 21/07/2025 | 21-07-2025
+  mensuales: may-25 | Mayo/2025 | 2025-05 | 05/2025
+  valores:   608.3025 | 608,3025 | 20.509,1752
+Las filas que no se pueden interpretar (encabezados, notas) se cuentan
+como ignoradas.
+
+Uso:
+  python -m finfocus_indices.backfill cer fixtures/backfill/cer.csv [--simular]
+  python -m finfocus_indices.backfill pasiva fixtures/backfill/pasiva.csv
+  # la tabla de RIPTE publica 2 decimales; lo guardado tiene hasta 7
+  python -m finfocus_indices.backfill ripte fixtures/backfill/ripte.csv --tolerancia 1e-4
+"""
+
+import argparse
+import csv
+import json
+import sys
+from datetime import date
+
+import numpy as np
+
+from finfocus_indices import almacen, bcra, binario, mensual
+
+BLOQUE      = 10_000
+TOLERANCIA  = 1e-6
+MAX_DETALLE = 20
+MENSUALES   = ("ripte", "smvm", "inflacion", "inflacion_esperada")
+SERIES      = almacen.DIARIAS + MENSUALES
+
+MESES = {
+    "enero": 1, "febrero": 2, "marzo": 3, "abril": 4, "mayo": 5, "junio": 6, "julio": 7,
+    "agosto": 8, "septiembre": 9, "setiembre": 9, "octubre": 10, "noviembre": 11, "diciembre": 12,
+}
+
+def parsear_dia(txt):
+    """Fecha de una fila diaria → ordinal."""
+    txt = txt.strip()
+    if len(txt) == 10 and txt[4] == "-":
+        return date.fromisoformat(txt).toordinal()
+    return bcra.parsear_fecha(txt).toordinal()
+
+def parsear_mes(txt):
+    """Mes de una fila mensual → índice de mes absoluto."""
+    txt = txt.strip().lower()
+    if "/" in txt:
+        a, b = txt.split("/")
+        if a in MESES:                                  # Mayo/2025
+            return mensual.indice(int(b), MESES[a])
+        return mensual.indice(int(b), int(a))          # 05/2025
+    if txt[:4].isdigit():                               # 2025-05
+        return mensual.indice(int(txt[:4]), int(txt[5:7]))
+    return mensual.parsear(txt)                         # may-25
+
+def parsear_numero(txt):
+    txt = txt.strip()
+    if "," in txt:
+        return bcra.parsear_valor(txt)
+    return float(txt)
+
+def filas(f):
+    """Itera las filas de un CSV abierto, detectando el separador."""
+    muestra = f.read(4096)
+    f.seek(0)
+    try:
+        dialecto = csv.Sniffer().sniff(muestra, delimiters=";,\t")
+    except csv.Error:
+        dialecto = csv.excel
+    yield from csv.reader(f, dialecto)
+
+def bloques(f, parsear_unidad, columna_fecha=0, columna_valor=1, bloque=BLOQUE):
+    """
+    Itera (unidades, valores, ignoradas) de a `bloque` filas: unidades es
+    int64 (ordinal o índice de mes) y valores float64.
+    """
+    unidades, valores, ignoradas = [], [], 0
+    for fila in filas(f):
+        try:
+            u = parsear_unidad(fila[columna_fecha])
+            v = parsear_numero(fila[columna_valor])
+        except (IndexError, ValueError, KeyError, RuntimeError):
+            ignoradas += 1
+            continue
+        unidades.append(u)
+        valores.append(v)
+        if len(unidades) >= bloque:
+            yield np.array(unidades, dtype=np.int64), np.array(valores, dtype="<f8"), ignoradas
+            unidades, valores, ignoradas = [], [], 0
+    if unidades or ignoradas:
+        yield np.array(unidades, dtype=np.int64), np.array(valores, dtype="<f8"), ignoradas
+
+class Fusion:
+    """Arreglo denso de la serie guardada más lo que va llegando del archivo."""
+
+    def __init__(self, inicio, valores, tolerancia=TOLERANCIA, sobrescribir=False):
+        self.inicio = inicio
+        self.valores = np.array(valores, dtype="<f8")            # copia escribible
+        self.guardado = ~np.isnan(self.valores)
+        self.visto = np.zeros(len(self.valores), dtype=bool)
+        self.tolerancia = tolerancia
+        self.sobrescribir = sobrescribir
+        self.resumen = {"filas": 0, "ignoradas": 0, "nuevos": 0, "coincidentes": 0,
+                        "corregidos": 0, "conflictos": 0, "detalle_conflictos": []}
+
+    def _cubrir(self, desde, hasta):
+        """Agranda los arreglos para que vayan de `desde` a `hasta`."""
+        if not len(self.valores):
+            self.inicio = desde
+        antes = max(self.inicio - desde, 0)
+        despues = max(hasta - (self.inicio + len(self.valores) - 1), 0)
+        if antes or despues:
+            self.valores = np.pad(self.valores, (antes, despues), constant_values=np.nan)
+            self.guardado = np.pad(self.guardado, (antes, despues))
+            self.visto = np.pad(self.visto, (antes, despues))
+            self.inicio -= antes
+
+    def _conflicto(self, unidades, guardados, nuevos, formato):
+        self.resumen["conflictos"] += len(unidades)
+        detalle = self.resumen["detalle_conflictos"]
+        for u, g, n in zip(unidades.tolist(), guardados.tolist(), nuevos.tolist()):
+            if len(detalle) >= MAX_DETALLE:
+                break
+            detalle.append({"fecha": formato(u), "guardado": g, "archivo": n})
+
+    def agregar(self, unidades, valores, ignoradas, formato):
+        self.resumen["filas"] += len(unidades)
+        self.resumen["ignoradas"] += ignoradas
+        if not len(unidades):
+            return
+        # repetidos dentro del bloque: gana el último, los distintos son conflicto
+        orden = np.argsort(unidades, kind="stable")
+        unidades, valores = unidades[orden], valores[orden]
+        ultimo = np.r_[unidades[1:] != unidades[:-1], True]
+        siguiente = np.r_[valores[1:], np.nan]
+        repetido_distinto = ~ultimo & ~self._iguales(valores, siguiente)
+        if repetido_distinto.any():
+            self._conflicto(unidades[repetido_distinto], valores[repetido_distinto],
+                            siguiente[repetido_distinto], formato)
+        unidades, valores = unidades[ultimo], valores[ultimo]
+
+        self._cubrir(int(unidades[0]), int(unidades[-1]))
+        i = unidades - self.inicio
+        previos = self.valores[i]
+        tenia = self.guardado[i] | self.visto[i]
+        iguales = self._iguales(previos, valores)
+
+        distintos = tenia & ~iguales
+        if distintos.any():
+            self._conflicto(unidades[distintos], previos[distintos], valores[distintos], formato)
+        self.resumen["coincidentes"] += int(np.count_nonzero(tenia & iguales & self.guardado[i]))
+        self.resumen["nuevos"] += int(np.count_nonzero(~tenia))
+
+        escribir = ~tenia | (distintos & self.sobrescribir)
+        self.resumen["corregidos"] += int(np.count_nonzero(distintos & self.sobrescribir))
+        self.valores[i[escribir]] = valores[escribir]
+        self.visto[i] = True
+
+    def _iguales(self, a, b):
+        return np.abs(a - b) <= self.tolerancia * np.maximum(np.abs(a), 1.0)
+
+def rellenar(serie, f, columna_fecha=0, columna_valor=1, tolerancia=TOLERANCIA,
+             sobrescribir=False, simular=False, directorio=None, bloque=BLOQUE):
+    """
+    Funde el CSV abierto `f` en la serie y devuelve el resumen. Con
+    conflictos y sin `sobrescribir` (o con `simular`) no escribe nada.
+    """
+    if serie not in SERIES:
+        raise KeyError(f"Serie desconocida para backfill: {serie!r}")
+    path = almacen.path_json(serie, directorio)
+    if serie in almacen.DIARIAS:
+        base = almacen.abrir_diaria(path)
+        fusion = Fusion(base.inicio.toordinal() if base.inicio else 0, base.valores, tolerancia, sobrescribir)
+        parsear_unidad, formato = parsear_dia, lambda u: date.fromordinal(u).isoformat()
+    else:
+        base = mensual.cargar(path)
+        fusion = Fusion(base.inicio, base.valores, tolerancia, sobrescribir)
+        parsear_unidad, formato = parsear_mes, mensual.clave
+
+    for unidades, valores, ignoradas in bloques(f, parsear_unidad, columna_fecha, columna_valor, bloque):
+        fusion.agregar(unidades, valores, ignoradas, formato)
+
+    resumen = dict(fusion.resumen, serie=serie, escrito=False)
+    if simular or (resumen["conflictos"] and not sobrescribir):
+        return resumen
+    if resumen["nuevos"] or resumen["corregidos"]:
+        if serie in almacen.DIARIAS:
+            almacen.guardar_diaria(path, binario.a_dict(date.fromordinal(fusion.inicio), fusion.valores))
+        else:
+            almacen.guardar_json(path, mensual.SerieMensual(fusion.inicio, fusion.valores).a_dict())
+        resumen["escrito"] = True
+    return resumen
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carga masiva de historia desde un CSV.")
+    parser.add_argument("serie", choices=SERIES)
+    parser.add_argument("archivo", help="CSV con fecha y valor por fila")
+    parser.add_argument("--columna-fecha", type=int, default=0)
+    parser.add_argument("--columna-valor", type=int, default=1)
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="diferencia relativa admitida contra lo guardado")
+    parser.add_argument("--sobrescribir", action="store_true",
+                        help="ante conflictos, quedarse con el valor del archivo")
+    parser.add_argument("--simular", action="store_true", help="no escribir nada")
+    parser.add_argument("--encoding", default="utf-8-sig")
+    args = parser.parse_args(argv)
+
+    with open(args.archivo, "r", encoding=args.encoding, newline="") as f:
+        resumen = rellenar(args.serie, f, args.columna_fecha, args.columna_valor,
+                           args.tolerancia, args.sobrescribir, args.simular)
+    print(json.dumps(resumen, ensure_ascii=False, indent=2))
+    if resumen["conflictos"] and not args.sobrescribir:
+        print(f"❌ {resumen['conflictos']} valores no coinciden con lo guardado; "
+              f"no se escribió nada (revisar o usar --sobrescribir).")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Extractor único de la tabla "Principales Variables" del BCRA.
+
+La página se descarga y se recorre una sola vez por proceso; el resultado
+trae todas las filas que seguimos, indexadas por serie. Para sumar una
+variable nueva alcanza con agregarla a VARIABLES.
+
+La descarga pasa por cache_http: si la página no cambió desde que una
+serie la confirmó, variable() devuelve None y no se parsea nada.
+"""
+
+import threading
+import urllib3
+from datetime import datetime
+
+from finfocus_indices import cache_http, extraccion, metricas
+
+# Suprimir warnings SSL
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+URL_BCRA = "https://www.bcra.gob.ar/PublicacionesEstadisticas/Principales_variables.asp"
+
+# serie → cómo reconocer su fila por la primera celda:
+#   "prefijo":  la celda empieza con ese texto (exacto)
+#   "contiene": todos los textos aparecen en la celda (sin distinguir mayúsculas)
+VARIABLES = {
+    "cer":                {"prefijo": "CER | Base 02/02/2002"},
+    "pasiva":             {"contiene": ["uso de la Justicia"]},
+    "inflacion":          {"contiene": ["Inflación mensual"]},
+    "inflacion_esperada": {"contiene": ["REM próximos 12 meses", "MEDIANA"]},
+}
+
+_pagina    = None
+_resultado = None
+_lock      = threading.Lock()
+
+def coincide(celda, criterio):
+    if "prefijo" in criterio and not celda.startswith(criterio["prefijo"]):
+        return False
+    celda = celda.lower()
+    return all(txt.lower() in celda for txt in criterio.get("contiene", []))
+
+def parsear_fecha(txt):
+    """Acepta 'DD/MM/YYYY' o 'DD-MM-YYYY'."""
+    try:
+        return datetime.strptime(txt.replace("-", "/"), "%d/%m/%Y").date()
+    except ValueError:
+        raise RuntimeError(f"Formato de fecha inesperado: {txt}")
+
+def parsear_valor(txt):
+    """Convierte '1.607,6799' → 1607.6799 (punto de miles, coma decimal)."""
+    try:
+        return float(txt.replace(".", "").replace(",", "."))
+    except ValueError:
+        raise RuntimeError(f"Valor numérico inválido: {txt}")
+
+def extraer_variables(html, variables=VARIABLES):
+    """
+    Recorre la tabla una sola vez y devuelve {serie: (fecha, valor)}
+    para cada variable encontrada. Deja de parsear cuando aparecieron todas.
+    """
+    filas = extraccion.filas_tabla(html)
+    if filas is None:
+        raise RuntimeError("No encontré la tabla de Principales Variables.")
+
+    pendientes = dict(variables)
+    encontradas = {}
+    for celdas in filas:
+        if len(celdas) < 3:
+            continue
+        for serie, criterio in list(pendientes.items()):
+            if coincide(celdas[0], criterio):
+                # Estructura: ["CER | Base ...", "19/07/2025", "607,6799", ...]
+                encontradas[serie] = (parsear_fecha(celdas[1]), parsear_valor(celdas[2]))
+                del pendientes[serie]
+                break
+        if not pendientes:
+            break
+    return encontradas
+
+def pagina():
+    """
+    Descarga la página una vez por proceso. Si varios hilos la piden a la
+    vez, sólo el primero descarga y los demás esperan su resultado.
+    """
+    global _pagina
+    with _lock:
+        if _pagina is None:
+            _pagina = cache_http.obtener(URL_BCRA, timeout=10, verify=False)
+        return _pagina
+
+def obtener_variables():
+    """Devuelve {serie: (fecha, valor)}, parseando la página una sola vez."""
+    global _resultado
+    html = pagina().texto
+    with _lock:
+        if _resultado is None:
+            with metricas.etapa("parseo"):
+                _resultado = extraer_variables(html)
+        return _resultado
+
+def variable(serie):
+    """
+    Devuelve (fecha, valor) de una serie, o None si la página no cambió desde
+    la última vez que se confirmó esa serie. Falla si la fila no está.
+    """
+    if cache_http.ya_procesada(pagina(), f"bcra:{serie}"):
+        return None
+    encontradas = obtener_variables()
+    if serie not in encontradas:
+        raise RuntimeError(f"No encontré la fila de '{serie}' en Principales Variables.")
+    return encontradas[serie]
+
+def confirmar(serie):
+    """Marca la página actual como procesada por `serie`."""
+    cache_http.confirmar(pagina(), f"bcra:{serie}")
+
+if __name__ == "__main__":
+    for serie, (fecha, valor) in obtener_variables().items():
+        print(f"{serie}: {fecha.isoformat()} → {valor}")
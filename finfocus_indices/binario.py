@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Formato binario columnar para las series diarias (activa, pasiva, cer).
+
+Un archivo .bin tiene un encabezado de 48 bytes y después un arreglo
+contiguo de float64 little-endian, uno por día corrido desde la fecha de
+inicio (NaN = día sin dato):
+
+  magia (8s) | ordinal de la fecha inicial (q) | cantidad de días (q)
+  | hash del JSON exportado (8s) | mtime_ns del JSON (q) | tamaño del JSON (q)
+  | valores (n × <f8)
+
+Se lee con memmap: buscar un día es un acceso por offset y los rangos son
+vistas de NumPy sin copia. La mtime y el tamaño permiten ver sin leer el
+JSON que no cambió desde la última exportación; si no coinciden, el hash
+dice si se editó a mano (formato.bin_vigente). El encabezado está definido en
+formato.py, que lo comparte con la lectura sin NumPy (consulta.py).
+"""
+
+import os
+from datetime import date
+
+import numpy as np
+
+from finfocus_indices import metricas
+from finfocus_indices.formato import ENCABEZADO, MAGIA, hash_json, leer_encabezado, path_binario
+
+def desde_dict(data):
+    """
+    Convierte {"YYYY-MM-DD": valor} en (fecha_inicial, arreglo float64)
+    con un lugar por día corrido y NaN en los días que faltan.
+    """
+    if not data:
+        return None, np.empty(0, dtype="<f8")
+    dias = np.array(list(data.keys()), dtype="datetime64[D]")
+    valores = np.fromiter(data.values(), dtype="<f8", count=len(data))
+    inicio = dias.min()
+    offsets = (dias - inicio).astype(np.int64)
+    arreglo = np.full(int(offsets.max()) + 1, np.nan, dtype="<f8")
+    arreglo[offsets] = valores
+    return inicio.item(), arreglo
+
+def a_dict(inicio, valores):
+    """Inversa de desde_dict: {"YYYY-MM-DD": valor}, sin los días NaN."""
+    if inicio is None or len(valores) == 0:
+        return {}
+    dias = np.datetime64(inicio, "D") + np.arange(len(valores))
+    hay = ~np.isnan(valores)
+    return dict(zip(np.datetime_as_string(dias[hay]).tolist(),
+                    np.asarray(valores)[hay].tolist()))
+
+def escribir(path, inicio, valores, hash_export=b"\0" * 8, mtime_ns=0, tamanio=0):
+    """
+    Escribe el .bin de forma atómica (archivo temporal + rename). hash_export,
+    mtime_ns y tamanio describen el JSON que le corresponde.
+    """
+    valores = np.ascontiguousarray(valores, dtype="<f8")
+    ordinal = inicio.toordinal() if inicio is not None else 0
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(ENCABEZADO.pack(MAGIA, ordinal, len(valores), hash_export, mtime_ns, tamanio))
+        f.write(valores.tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    metricas.sumar("bytes_escritos", ENCABEZADO.size + valores.nbytes)
+
+class SerieDiaria:
+    """Serie diaria: fecha inicial + un float64 por día corrido."""
+
+    def __init__(self, inicio, valores, path=None):
+        self.inicio  = inicio
+        self.valores = valores
+        self.path    = path
+
+    def __len__(self):
+        return len(self.valores)
+
+    @property
+    def fin(self):
+        return date.fromordinal(self.inicio.toordinal() + len(self.valores) - 1)
+
+    def offset(self, fecha):
+        return fecha.toordinal() - self.inicio.toordinal()
+
+    def valor(self, fecha):
+        """Valor de un día (None si está fuera de rango o falta)."""
+        i = self.offset(fecha)
+        if i < 0 or i >= len(self.valores):
+            return None
+        v = float(self.valores[i])
+        return None if v != v else v
+
+    def rango(self, desde, hasta):
+        """Vista sin copia de los valores entre desde y hasta (inclusive)."""
+        i = max(self.offset(desde), 0)
+        j = min(self.offset(hasta) + 1, len(self.valores))
+        return self.valores[i:max(i, j)]
+
+    def a_dict(self):
+        return a_dict(self.inicio, self.valores)
+
+def abrir(path):
+    """Abre un .bin mapeado en memoria (sólo lectura)."""
+    inicio, n = leer_encabezado(path)[:2]
+    if n:
+        valores = np.memmap(path, dtype="<f8", mode="r", offset=ENCABEZADO.size, shape=(n,))
+    else:
+        valores = np.empty(0, dtype="<f8")
+    return SerieDiaria(inicio, valores, path)
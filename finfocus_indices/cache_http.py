@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caché en disco de las páginas fuente con GET condicional.
+
+Por cada URL guarda ETag / Last-Modified, el sha256 del cuerpo y el cuerpo
+comprimido. Cada consumidor (una serie) marca qué versión de la página ya
+procesó; si la fuente responde 304 o devuelve el mismo contenido, el
+consumidor puede saltear el parseo y la reescritura del JSON.
+
+Las entradas que no se refrescan en TTL_DIAS se descartan, y nunca se
+guardan más de MAX_ENTRADAS URLs. Para forzar una descarga completa y
+reprocesar todo: FINFOCUS_REFRESCAR=1 (o update_all.py --refrescar).
+
+Uso:
+  python -m finfocus_indices.cache_http            # listar entradas
+  python -m finfocus_indices.cache_http --purgar   # aplicar TTL / tope
+  python -m finfocus_indices.cache_http --vaciar   # borrar todo
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import NamedTuple
+
+from finfocus_indices import archivo, descargas, metricas
+
+DIR_CACHE     = os.environ.get("FINFOCUS_CACHE", os.path.join(".finfocus_cache", "http"))
+INDICE        = "indice.json"
+TTL_DIAS      = 30
+MAX_ENTRADAS  = 64
+ENV_REFRESCAR = "FINFOCUS_REFRESCAR"
+
+refrescar = os.environ.get(ENV_REFRESCAR, "") not in ("", "0")
+
+_lock   = threading.Lock()
+_indice = None
+
+class Pagina(NamedTuple):
+    url: str
+    texto: str
+    sha256: str
+    no_modificada: bool   # la fuente respondió 304
+
+def _path(nombre):
+    return os.path.join(DIR_CACHE, nombre)
+
+def _archivo_cuerpo(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html.gz"
+
+def _escribir_atomico(path, contenido):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(contenido)
+    os.replace(tmp, path)
+
+def _cargar():
+    global _indice
+    if _indice is None:
+        try:
+            with open(_path(INDICE), encoding="utf-8") as f:
+                _indice = json.load(f)
+        except (OSError, ValueError):
+            _indice = {}
+        _purgar_vencidas()
+    return _indice
+
+def _guardar():
+    os.makedirs(DIR_CACHE, exist_ok=True)
+    texto = json.dumps(_indice, ensure_ascii=False, indent=2)
+    _escribir_atomico(_path(INDICE), texto.encode("utf-8"))
+
+def _descartar(url):
+    _indice.pop(url, None)
+    try:
+        os.remove(_path(_archivo_cuerpo(url)))
+    except OSError:
+        pass
+
+def _purgar_vencidas():
+    """Descarta entradas vencidas y, si sobran, las menos recientes."""
+    limite = time.time() - TTL_DIAS * 86400
+    for url, entrada in list(_indice.items()):
+        if entrada.get("descargada", 0) < limite:
+            _descartar(url)
+    sobrantes = len(_indice) - MAX_ENTRADAS
+    if sobrantes > 0:
+        por_edad = sorted(_indice, key=lambda u: _indice[u].get("descargada", 0))
+        for url in por_edad[:sobrantes]:
+            _descartar(url)
+
+def obtener(url, **kwargs):
+    """
+    GET condicional de `url`. Devuelve una Pagina con el cuerpo vigente,
+    leído de la caché si la fuente respondió 304.
+    """
+    with _lock:
+        entrada = None if refrescar else _cargar().get(url)
+    headers = dict(kwargs.pop("headers", None) or {})
+    if entrada and os.path.exists(_path(_archivo_cuerpo(url))):
+        if entrada.get("etag"):
+            headers["If-None-Match"] = entrada["etag"]
+        if entrada.get("last_modified"):
+            headers["If-Modified-Since"] = entrada["last_modified"]
+
+    with metricas.etapa("descarga"):
+        resp = descargas.get(url, headers=headers, **kwargs)
+        if resp.status_code == 304 and entrada:
+            with gzip.open(_path(_archivo_cuerpo(url)), "rt", encoding="utf-8") as f:
+                texto = f.read()
+            sha, no_modificada = entrada["sha256"], True
+            metricas.sumar("cache_304")
+        else:
+            resp.raise_for_status()
+            texto = resp.text
+            sha = hashlib.sha256(resp.content).hexdigest()
+            no_modificada = False
+            metricas.sumar("bytes_descargados", len(resp.content))
+
+    if archivo.archivar and not no_modificada:
+        try:
+            archivo.guardar(url, texto, sha)
+        except OSError as e:
+            print(f"⚠️ no pude archivar {url}: {e}", file=sys.stderr)
+
+    with _lock:
+        indice = _cargar()
+        previa = indice.get(url, {})
+        if sha != previa.get("sha256"):
+            os.makedirs(DIR_CACHE, exist_ok=True)
+            _escribir_atomico(_path(_archivo_cuerpo(url)), gzip.compress(texto.encode("utf-8")))
+        indice[url] = {
+            "etag":          resp.headers.get("ETag") or previa.get("etag"),
+            "last_modified": resp.headers.get("Last-Modified") or previa.get("last_modified"),
+            "sha256":        sha,
+            "descargada":    time.time(),
+            "procesada":     previa.get("procesada", {}) if sha == previa.get("sha256") else {},
+        }
+        _guardar()
+    return Pagina(url, texto, sha, no_modificada)
+
+def ya_procesada(pagina, consumidor):
+    """True si `consumidor` ya procesó exactamente este contenido."""
+    if refrescar:
+        return False
+    with _lock:
+        entrada = _cargar().get(pagina.url, {})
+    procesada = entrada.get("sha256") == pagina.sha256 and consumidor in entrada.get("procesada", {})
+    if procesada:
+        metricas.sumar("cache_hit")
+    return procesada
+
+def resultado_guardado(pagina, consumidor):
+    """Lo que `consumidor` guardó al confirmar esta página (o None)."""
+    with _lock:
+        return _cargar().get(pagina.url, {}).get("procesada", {}).get(consumidor)
+
+def confirmar(pagina, consumidor, resultado=True):
+    """
+    Marca la página como procesada por `consumidor`. `resultado` debe ser
+    serializable a JSON y permite reusar lo extraído sin volver a parsear.
+    """
+    with _lock:
+        entrada = _cargar().get(pagina.url)
+        if entrada is None or entrada["sha256"] != pagina.sha256:
+            return
+        entrada["procesada"][consumidor] = resultado
+        _guardar()
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--vaciar" in argv:
+        shutil.rmtree(DIR_CACHE, ignore_errors=True)
+        print(f"Caché {DIR_CACHE} vaciada.")
+        return
+    with _lock:
+        indice = _cargar()
+        if "--purgar" in argv:
+            _guardar()
+    for url, e in indice.items():
+        edad = (time.time() - e["descargada"]) / 86400
+        print(f"{url}\n  sha256={e['sha256'][:12]} etag={e['etag']} hace {edad:.1f} días"
+              f" procesada por: {', '.join(e['procesada']) or '-'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Calendario de días hábiles judiciales.
+
+Se arma una vez a partir de indices/inhabiles_judiciales.json y los fines
+de semana, para todos los días entre DESDE y HASTA:
+
+  - habil[i]: True si el día i es hábil.
+  - acumulados[i]: cantidad de días hábiles anteriores al día i.
+  - posiciones[k]: día del k-ésimo hábil (inversa de acumulados).
+
+Con eso contar hábiles entre dos fechas, sumar N hábiles o buscar el
+próximo hábil son accesos directos a los arreglos. Cada función tiene una
+variante *_lote que recibe arreglos de fechas (datetime64[D]).
+
+obtener() devuelve el calendario compartido y lo reconstruye si el JSON
+cambió (fecha de modificación o tamaño) desde la última vez.
+
+    from finfocus_indices import calendario
+    cal = calendario.obtener()
+    cal.sumar_habiles(date(2025, 7, 4), 5)
+"""
+
+import json
+import os
+import threading
+from datetime import date
+
+import numpy as np
+
+from finfocus_indices.series import DIR_INDICES, EPOCA
+
+PATH_INHABILES = os.path.join(DIR_INDICES, "inhabiles_judiciales.json")
+DESDE = date(1990, 1, 1)
+HASTA = date(2100, 12, 31)
+
+class Calendario:
+    def __init__(self, inhabiles, desde=DESDE, hasta=HASTA):
+        self.desde = desde
+        self.hasta = hasta
+        self._inicio = desde.toordinal()
+        dias = np.arange(self._inicio, hasta.toordinal() + 1, dtype=np.int64)
+        # date.weekday(): lunes = 0 ... domingo = 6; ordinal 1 (0001-01-01) es lunes
+        self.habil = (dias - 1) % 7 < 5
+        feriados = np.array([f.toordinal() for f in inhabiles], dtype=np.int64) - self._inicio
+        feriados = feriados[(feriados >= 0) & (feriados < len(dias))]
+        self.habil[feriados] = False
+        self.acumulados = np.concatenate(([0], np.cumsum(self.habil)))
+        self.posiciones = np.flatnonzero(self.habil)
+
+    def _indice(self, fecha):
+        i = fecha.toordinal() - self._inicio
+        if not 0 <= i < len(self.habil):
+            raise RuntimeError(f"{fecha.isoformat()} está fuera del calendario "
+                               f"({self.desde.isoformat()} a {self.hasta.isoformat()}).")
+        return i
+
+    def _indices(self, fechas):
+        i = np.asarray(fechas, dtype="datetime64[D]").astype(np.int64) + EPOCA - self._inicio
+        if i.size and (i.min() < 0 or i.max() >= len(self.habil)):
+            raise RuntimeError(f"Hay fechas fuera del calendario "
+                               f"({self.desde.isoformat()} a {self.hasta.isoformat()}).")
+        return i
+
+    def _dia(self, k):
+        if not 0 <= k < len(self.posiciones):
+            raise RuntimeError("El resultado cae fuera del calendario.")
+        return date.fromordinal(self._inicio + int(self.posiciones[k]))
+
+    def _dias(self, k):
+        if k.size and (k.min() < 0 or k.max() >= len(self.posiciones)):
+            raise RuntimeError("Hay resultados que caen fuera del calendario.")
+        return (self.posiciones[k] + self._inicio - EPOCA).astype("datetime64[D]")
+
+    def es_habil(self, fecha):
+        return bool(self.habil[self._indice(fecha)])
+
+    def habiles_entre(self, desde, hasta):
+        """Días hábiles posteriores a `desde` hasta `hasta` inclusive."""
+        return int(self.acumulados[self._indice(hasta) + 1] - self.acumulados[self._indice(desde) + 1])
+
+    def sumar_habiles(self, fecha, n):
+        """
+        El n-ésimo día hábil posterior a `fecha` (anterior si n < 0); con
+        n = 0 devuelve la misma fecha.
+        """
+        if n == 0:
+            return fecha
+        i = self._indice(fecha)
+        k = self.acumulados[i + 1] + n - 1 if n > 0 else self.acumulados[i] + n
+        return self._dia(k)
+
+    def proximo_habil(self, fecha):
+        """`fecha` si es hábil; si no, el primer hábil posterior."""
+        return self._dia(self.acumulados[self._indice(fecha)])
+
+    def es_habil_lote(self, fechas):
+        return self.habil[self._indices(fechas)]
+
+    def habiles_entre_lote(self, desdes, hastas):
+        return self.acumulados[self._indices(hastas) + 1] - self.acumulados[self._indices(desdes) + 1]
+
+    def sumar_habiles_lote(self, fechas, n):
+        i = self._indices(fechas)
+        n = np.broadcast_to(np.asarray(n, dtype=np.int64), i.shape)
+        k = np.where(n > 0, self.acumulados[i + 1] + n - 1, self.acumulados[i] + n)
+        if np.any((n != 0) & ((k < 0) | (k >= len(self.posiciones)))):
+            raise RuntimeError("Hay resultados que caen fuera del calendario.")
+        dias = self._dias(np.clip(k, 0, len(self.posiciones) - 1))
+        return np.where(n == 0, np.asarray(fechas, dtype="datetime64[D]"), dias)
+
+    def proximo_habil_lote(self, fechas):
+        return self._dias(self.acumulados[self._indices(fechas)])
+
+_calendario = None
+_firma = None
+_lock = threading.Lock()
+
+def leer_inhabiles(path=PATH_INHABILES):
+    with open(path, "r", encoding="utf-8") as f:
+        return [date.fromisoformat(d) for d in json.load(f)]
+
+def obtener(path=PATH_INHABILES):
+    """Calendario compartido; se reconstruye si cambió el JSON de inhábiles."""
+    global _calendario, _firma
+    st = os.stat(path)
+    firma = (path, st.st_mtime_ns, st.st_size)
+    with _lock:
+        if firma != _firma:
+            _calendario = Calendario(leer_inhabiles(path))
+            _firma = firma
+        return _calendario
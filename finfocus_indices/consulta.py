@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Consultas puntuales sobre indices/ sin NumPy, para la línea de comandos.
+
+series.py arma arreglos de NumPy y es lo que conviene para carteras y
+rangos largos, pero importar NumPy tarda más que toda una consulta. Acá
+las diarias se leen del .bin con mmap y struct (un día es un acceso por
+offset) y las mensuales de su JSON, que es chico. Los resultados son los
+mismos que los de series.Serie:
+
+  - el .bin vale sólo si corresponde al JSON (formato.bin_vigente; si no,
+    se lee el JSON, como hace almacen) y lo pendiente en el journal lo pisa;
+  - ripte1 y ripte2 son ripte corrida uno y dos meses (formato.REZAGOS);
+  - las mensuales usan el primer día del mes como fecha.
+
+    from finfocus_indices import consulta
+    cer = consulta.obtener("cer")
+    cer.ultimo_hasta(date(2025, 7, 1))    # (fecha, valor)
+    cer.rango(desde, hasta)               # [(fecha, valor)] de los días con dato
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from datetime import date
+
+from finfocus_indices import formato, journal
+
+_F8 = struct.Struct("<d")
+
+class _Serie:
+    def coeficiente(self, desde, hasta):
+        """valor(hasta) / valor(desde) con el último dato en o antes de cada punta."""
+        a, b = self.ultimo_hasta(desde), self.ultimo_hasta(hasta)
+        if a is None or b is None:
+            raise RuntimeError(f"{self.nombre}: no hay datos en o antes de {min(desde, hasta).isoformat()}")
+        return b[1] / a[1]
+
+class Diaria(_Serie):
+    """Serie diaria leída del .bin (o del JSON) más el journal."""
+
+    frecuencia = "diaria"
+
+    def __init__(self, nombre, path):
+        self.nombre = nombre
+        self._mm = None
+        self._dict = {}
+        self._bin_inicio, self._bin_n = 0, 0
+        path_bin = formato.path_binario(path)
+        if formato.bin_vigente(path):
+            inicio, self._bin_n = formato.leer_encabezado(path_bin)[:2]
+            if self._bin_n:
+                self._bin_inicio = inicio.toordinal()
+                with open(path_bin, "rb") as f:
+                    self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        elif os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.loads(re.sub(r',\s*([}\]])', r'\1', f.read()))
+            self._dict = {date.fromisoformat(k).toordinal(): float(v) for k, v in data.items()}
+        pendientes = {date.fromisoformat(k).toordinal(): float(v) for k, v in journal.leer(path).items()}
+        self._dict.update(pendientes)
+        # inicio y n abarcan el .bin y los días sueltos (JSON o journal)
+        extremos = list(self._dict)
+        if self._bin_n:
+            extremos += [self._bin_inicio, self._bin_inicio + self._bin_n - 1]
+        self.inicio = min(extremos, default=0)
+        self.n = max(extremos) - self.inicio + 1 if extremos else 0
+
+    def _en(self, ordinal):
+        """Valor del día con ese ordinal, o None."""
+        if ordinal in self._dict:
+            return self._dict[ordinal]
+        i = ordinal - self._bin_inicio
+        if i < 0 or i >= self._bin_n:
+            return None
+        v = _F8.unpack_from(self._mm, formato.ENCABEZADO.size + 8 * i)[0]
+        return None if v != v else v
+
+    def valor(self, fecha):
+        """Valor exacto del día o None."""
+        return self._en(fecha.toordinal())
+
+    def ultimo_hasta(self, fecha):
+        """(fecha, valor) del último dato en o antes de `fecha`, o None."""
+        o = min(fecha.toordinal(), self.inicio + self.n - 1)
+        while o >= self.inicio:
+            v = self._en(o)
+            if v is not None:
+                return date.fromordinal(o), v
+            o -= 1
+        return None
+
+    def rango(self, desde, hasta):
+        """[(fecha, valor)] de los días con dato entre desde y hasta inclusive."""
+        a = max(desde.toordinal(), self.inicio)
+        b = min(hasta.toordinal(), self.inicio + self.n - 1)
+        if a > b:
+            return []
+        valores = [None] * (b - a + 1)
+        inicio = self._bin_inicio
+        i, j = max(a - inicio, 0), min(b - inicio + 1, self._bin_n)
+        if i < j:
+            base = formato.ENCABEZADO.size
+            bloque = array("d", self._mm[base + 8 * i:base + 8 * j])
+            if sys.byteorder != "little":
+                bloque.byteswap()
+            valores[inicio + i - a:inicio + j - a] = [v if v == v else None for v in bloque]
+        for o, v in self._dict.items():
+            if a <= o <= b:
+                valores[o - a] = v
+        return [(date.fromordinal(a + k), v) for k, v in enumerate(valores) if v is not None]
+
+class Mensual(_Serie):
+    """Serie mensual {índice de mes: valor}, opcionalmente corrida `rezago` meses."""
+
+    frecuencia = "mensual"
+
+    def __init__(self, nombre, path, rezago=0):
+        self.nombre = nombre
+        self._meses = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._meses = {formato.parsear(k) + rezago: float(v) for k, v in data.items()}
+
+    def valor(self, fecha):
+        """Valor del mes de `fecha` o None."""
+        return self._meses.get(formato.indice_de_fecha(fecha))
+
+    def ultimo_hasta(self, fecha):
+        """(primer día del mes, valor) del último mes con dato en o antes de `fecha`."""
+        if not self._meses:
+            return None
+        i = min(formato.indice_de_fecha(fecha), max(self._meses))
+        primero = min(self._meses)
+        while i >= primero:
+            if i in self._meses:
+                return formato.fecha_de_indice(i), self._meses[i]
+            i -= 1
+        return None
+
+    def rango(self, desde, hasta):
+        """[(primer día del mes, valor)] de los meses con dato entre desde y hasta."""
+        a, b = formato.indice_de_fecha(desde), formato.indice_de_fecha(hasta)
+        return [(formato.fecha_de_indice(i), self._meses[i]) for i in sorted(self._meses) if a <= i <= b]
+
+def obtener(nombre, directorio=formato.DIR_INDICES):
+    """Diaria o Mensual de la serie `nombre`."""
+    if nombre in formato.DIARIAS:
+        return Diaria(nombre, os.path.join(directorio, f"{nombre}.json"))
+    if nombre in formato.REZAGOS:
+        base, meses = formato.REZAGOS[nombre]
+        return Mensual(nombre, os.path.join(directorio, f"{base}.json"), meses)
+    if nombre in formato.MENSUALES:
+        return Mensual(nombre, os.path.join(directorio, f"{nombre}.json"))
+    raise KeyError(f"Serie desconocida: {nombre!r}")
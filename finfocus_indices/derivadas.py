@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Series derivadas que se calculan al leer en lugar de guardarse aparte.
+
+ripte1 y ripte2 son ripte corrida uno y dos meses: se definen como vistas
+desplazadas de la serie base (mismo arreglo, otro mes inicial), sin copia
+ni archivo propio, y no pueden quedar atrasadas respecto de ripte.
+
+    from finfocus_indices import derivadas
+    ripte1 = derivadas.calcular("ripte1")      # SerieMensual
+
+exportar() sigue escribiendo ripte1.json / ripte2.json para quien los lea
+directamente: agrega los meses posteriores al último del archivo y deja
+intactos los ya publicados.
+
+encadenar() es la otra transformación que usamos: convierte variaciones
+mensuales en % en un índice, con el mismo redondeo por paso que
+update_inflacion.py.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from finfocus_indices import almacen, formato, mensual, metricas
+
+def rezago(meses):
+    """Transformación: la serie base corrida `meses` meses hacia adelante."""
+    return lambda base: base.desplazar(meses)
+
+DERIVADAS = {nombre: (base, rezago(meses)) for nombre, (base, meses) in formato.REZAGOS.items()}
+
+def encadenar(variaciones, valor_previo, decimales=4):
+    """
+    Índice a partir de variaciones mensuales en %: cada mes vale
+    round(anterior * (1 + pct / 100), decimales), partiendo de
+    `valor_previo` (el del mes anterior al primero). Los meses sin
+    variación quedan en NaN y cortan la cadena.
+    """
+    salida = []
+    previo = float(valor_previo)
+    for pct in variaciones.valores.tolist():
+        if pct != pct:
+            previo = float("nan")
+        else:
+            previo = round(previo * (1 + pct / 100), decimales)
+        salida.append(previo)
+    return mensual.SerieMensual(variaciones.inicio, np.array(salida, dtype="<f8"))
+
+def calcular(nombre, directorio=None):
+    """SerieMensual derivada `nombre`, calculada desde su base."""
+    if nombre not in DERIVADAS:
+        raise KeyError(f"Serie derivada desconocida: {nombre!r}")
+    base, transformacion = DERIVADAS[nombre]
+    return transformacion(mensual.cargar(almacen.path_json(base, directorio)))
+
+def exportar(nombre, directorio=None):
+    """
+    Agrega a indices/<nombre>.json los meses de la derivada posteriores al
+    último del archivo. Devuelve {"mmm-yy": valor} con lo agregado.
+    """
+    path = almacen.path_json(nombre, directorio)
+    data = {}
+    if os.path.exists(path):
+        with metricas.etapa("carga"), open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    serie = calcular(nombre, directorio)
+    with metricas.etapa("calculo"):
+        ultimo = max(map(mensual.parsear, data), default=serie.inicio - 1)
+        nuevos = {}
+        for i in range(max(ultimo + 1, serie.inicio), serie.fin + 1):
+            valor = serie.valor(i)
+            if valor is not None:
+                nuevos[mensual.clave(i)] = valor
+    if nuevos:
+        data.update(nuevos)
+        almacen.guardar_json(path, data)
+        metricas.sumar("puntos_agregados", len(nuevos))
+    return nuevos
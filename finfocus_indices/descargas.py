@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sesión HTTP compartida por todos los scrapers.
+
+Reutiliza conexiones keep-alive por host (bcra.gob.ar, bna.com.ar,
+argentina.gob.ar) y limita a MAX_POR_HOST las descargas simultáneas contra
+un mismo host. Los orígenes se pueden redirigir, p. ej. a un servidor local
+que sirve páginas grabadas (ver servidor_fixtures.py).
+"""
+
+import os
+import threading
+from urllib.parse import urlsplit
+
+MAX_POR_HOST = 2
+USER_AGENT   = "finfocus-indices"
+
+# Redirecciones "https://www.bcra.gob.ar=http://127.0.0.1:8000/www.bcra.gob.ar,..."
+ENV_ORIGENES = "FINFOCUS_ORIGENES"
+
+_sesion   = None
+_lock     = threading.Lock()
+_origenes = {}
+
+def sesion():
+    """
+    Devuelve la sesión del proceso. Con pool_block=True el adaptador nunca
+    abre más de MAX_POR_HOST conexiones por host: el resto de los hilos
+    espera a que se libere una.
+
+    requests se importa recién acá: los updaters que no descargan (ripte1,
+    ripte2) y la línea de comandos no pagan su import.
+    """
+    global _sesion
+    with _lock:
+        if _sesion is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            s = requests.Session()
+            adaptador = HTTPAdapter(pool_connections=8, pool_maxsize=MAX_POR_HOST, pool_block=True)
+            s.mount("https://", adaptador)
+            s.mount("http://", adaptador)
+            s.headers["User-Agent"] = USER_AGENT
+            _sesion = s
+    return _sesion
+
+def redirigir(origen, destino):
+    """Hace que las URLs que empiezan con `origen` se pidan a `destino`."""
+    _origenes[origen.rstrip("/")] = destino.rstrip("/")
+
+def _cargar_origenes_env():
+    for par in os.environ.get(ENV_ORIGENES, "").split(","):
+        if "=" in par:
+            origen, destino = par.split("=", 1)
+            redirigir(origen.strip(), destino.strip())
+
+def resolver(url):
+    partes = urlsplit(url)
+    origen = f"{partes.scheme}://{partes.netloc}"
+    if origen in _origenes:
+        return _origenes[origen] + url[len(origen):]
+    return url
+
+def get(url, **kwargs):
+    """requests.get sobre la sesión compartida."""
+    return sesion().get(resolver(url), **kwargs)
+
+_cargar_origenes_env()
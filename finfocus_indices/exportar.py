@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Exportación de varias series en una sola tabla alineada por fecha.
+
+Todas las series se leen una vez (series.py) y se muestrean sobre un eje
+común, de a FILAS filas por bloque, así que la tabla se escribe a medida
+que se arma y nunca está entera en memoria:
+
+  - frecuencia "diaria": un renglón por día corrido; las mensuales valen
+    lo de su mes.
+  - frecuencia "mensual": un renglón por mes (fechado el día 1); cada
+    serie se toma al cierre del mes (su último día).
+
+Regla de relleno por serie: "arrastre" (el último dato en o antes de la
+fecha, como series.Serie.ultimo_hasta) o "nada" (sólo el dato exacto; el
+resto queda vacío).
+
+Formato según la extensión del destino: .parquet (zstd) o .arrow (IPC con
+zstd) si está instalado pyarrow, y si no CSV comprimido (.csv.gz) como
+alternativa; .csv / .csv.gz o "-" (salida estándar) siempre en CSV.
+
+Con --incremental el destino es un directorio: cada corrida agrega una
+parte con sólo los renglones nuevos desde la anterior y estado.json
+guarda hasta dónde se exportó. Para no publicar renglones que después
+cambian, una exportación incremental llega hasta el último día en que
+todas las series tienen dato (el cierre común). Si cambiaron las series,
+las opciones o algún renglón ya exportado (p. ej. una corrección, ver
+historial.py), se reexporta todo.
+
+Uso:
+  python -m finfocus_indices.exportar indices.parquet
+  python -m finfocus_indices.exportar - --series cer,ripte --frecuencia mensual
+  python -m finfocus_indices.exportar exportacion/ --incremental --relleno nada --relleno cer=arrastre
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+
+from finfocus_indices import series
+
+SERIES       = series.DIARIAS + ("ripte", "smvm", "inflacion", "inflacion_esperada")
+FRECUENCIAS  = ("diaria", "mensual")
+RELLENOS     = ("arrastre", "nada")
+TIPOS        = ("parquet", "arrow", "csv")
+EXTENSIONES  = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv.gz"}
+FILAS        = 4096
+ESTADO       = "estado.json"
+
+def _pyarrow():
+    """pyarrow si está instalado (es opcional), o None."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+def tipo_de(destino):
+    if destino == "-" or destino.endswith((".csv", ".csv.gz")):
+        return "csv"
+    if destino.endswith((".arrow", ".feather")):
+        return "arrow"
+    return "parquet"
+
+# ---------- tabla alineada ----------
+
+def _mes(fechas):
+    return np.asarray(fechas, dtype="datetime64[D]").astype("datetime64[M]")
+
+def eje(frecuencia, desde, hasta):
+    """Fechas del eje común entre desde y hasta (datetime64[D])."""
+    desde, hasta = np.datetime64(desde, "D"), np.datetime64(hasta, "D")
+    if frecuencia == "mensual":
+        return np.arange(_mes(desde), _mes(hasta) + 1).astype("datetime64[D]")
+    return np.arange(desde, hasta + 1)
+
+def _fin_de_mes(fecha):
+    return ((_mes(fecha) + 1).astype("datetime64[D]") - 1).item()
+
+def extremos(abiertas, frecuencia):
+    """(primera fecha con dato, última fecha con dato, cierre común) del eje."""
+    primeras = [s.primera for s in abiertas if s.primera]
+    # una mensual vale hasta el fin de su mes
+    ultimas = [_fin_de_mes(s.ultima[0]) if s.frecuencia == "mensual" else s.ultima[0]
+               for s in abiertas if s.ultima]
+    if not ultimas:
+        raise RuntimeError("Las series a exportar están vacías.")
+    desde, hasta, cierre = min(primeras), max(ultimas), min(ultimas)
+    if frecuencia == "mensual" and cierre != _fin_de_mes(cierre):
+        # el mes del cierre todavía no terminó para todas: queda afuera
+        cierre = cierre.replace(day=1) - timedelta(days=1)
+    return desde, hasta, cierre
+
+def bloques(nombres, desde, hasta, frecuencia="diaria", relleno=None, filas=FILAS,
+            directorio=series.DIR_INDICES):
+    """
+    Genera (fechas, {serie: valores}) de a `filas` renglones del eje común
+    entre desde y hasta. `relleno` es {serie: regla} (por defecto arrastre).
+    """
+    relleno = relleno or {}
+    abiertas = [series.obtener(nombre, directorio) for nombre in nombres]
+    fechas = eje(frecuencia, desde, hasta)
+    for i in range(0, len(fechas), filas):
+        bloque = fechas[i:i + filas]
+        # en el eje mensual cada serie se toma al último día del mes
+        muestra = bloque if frecuencia == "diaria" else (_mes(bloque) + 1).astype("datetime64[D]") - 1
+        columnas = {}
+        for serie in abiertas:
+            if relleno.get(serie.nombre, "arrastre") == "nada":
+                columnas[serie.nombre] = serie.valores_en(muestra)
+            else:
+                columnas[serie.nombre] = serie.valores_hasta(muestra)
+        yield bloque, columnas
+
+# ---------- escritores ----------
+
+class _CSV:
+    def __init__(self, path, nombres):
+        self.path = path
+        if path == "-":
+            self.f = sys.stdout
+        elif path.endswith(".gz"):
+            self.f = gzip.open(path + ".tmp", "wt", encoding="utf-8", newline="")
+        else:
+            self.f = open(path + ".tmp", "w", encoding="utf-8", newline="")
+        self.f.write(",".join(("fecha",) + tuple(nombres)) + "\n")
+
+    def escribir(self, fechas, columnas):
+        textos = [np.datetime_as_string(fechas).tolist()]
+        for valores in columnas.values():
+            textos.append(["" if v != v else repr(v) for v in valores.tolist()])
+        self.f.writelines(",".join(fila) + "\n" for fila in zip(*textos))
+
+    def cerrar(self):
+        if self.path == "-":
+            self.f.flush()
+            return
+        self.f.close()
+        os.replace(self.path + ".tmp", self.path)
+
+class _Arrow:
+    """Parquet (grupos de filas) o Arrow IPC, ambos con zstd, de a un bloque por vez."""
+
+    def __init__(self, path, nombres, tipo, pa):
+        self.pa, self.path = pa, path
+        self.schema = pa.schema([("fecha", pa.date32())] + [(n, pa.float64()) for n in nombres])
+        if tipo == "parquet":
+            self.writer = pa.parquet.ParquetWriter(path + ".tmp", self.schema, compression="zstd")
+        else:
+            opciones = pa.ipc.IpcWriteOptions(compression="zstd")
+            self.writer = pa.ipc.new_file(path + ".tmp", self.schema, options=opciones)
+
+    def escribir(self, fechas, columnas):
+        pa = self.pa
+        arreglos = [pa.array(fechas, type=pa.date32())]
+        arreglos += [pa.array(v, type=pa.float64(), from_pandas=True) for v in columnas.values()]
+        self.writer.write_table(pa.Table.from_arrays(arreglos, schema=self.schema))
+
+    def cerrar(self):
+        self.writer.close()
+        os.replace(self.path + ".tmp", self.path)
+
+def _escritor(path, nombres, tipo):
+    if tipo == "csv":
+        return _CSV(path, nombres)
+    return _Arrow(path, nombres, tipo, _pyarrow())
+
+def _resolver_tipo(tipo, destino=None):
+    """El tipo pedido, o CSV comprimido si hace falta pyarrow y no está."""
+    if tipo != "csv" and _pyarrow() is None:
+        sys.stderr.write(f"⚠️ pyarrow no está instalado: se exporta en CSV comprimido en lugar de {tipo}.\n")
+        if destino:
+            destino = destino[:-len(EXTENSIONES[tipo])] if destino.endswith(EXTENSIONES[tipo]) else destino
+            destino += EXTENSIONES["csv"]
+        return "csv", destino
+    return tipo, destino
+
+# ---------- exportación ----------
+
+def _volcar(escritor, generador, firma=None):
+    filas = 0
+    for fechas, columnas in generador:
+        if firma is not None:
+            _firmar(firma, fechas, columnas)
+        escritor.escribir(fechas, columnas)
+        filas += len(fechas)
+    escritor.cerrar()
+    return filas
+
+def _firmar(firma, fechas, columnas):
+    firma.update(fechas.astype("<i8").tobytes())
+    for valores in columnas.values():
+        firma.update(np.ascontiguousarray(valores, dtype="<f8").tobytes())
+
+def exportar(destino, nombres=SERIES, frecuencia=None, relleno=None, desde=None, hasta=None,
+             tipo=None, filas=FILAS, directorio=series.DIR_INDICES):
+    """
+    Escribe la tabla alineada en `destino` (archivo o "-") y devuelve
+    {destino, tipo, filas, desde, hasta}.
+    """
+    abiertas = [series.obtener(n, directorio) for n in nombres]
+    frecuencia = frecuencia or ("diaria" if any(s.frecuencia == "diaria" for s in abiertas) else "mensual")
+    primera, ultima, _ = extremos(abiertas, frecuencia)
+    desde, hasta = desde or primera, hasta or ultima
+    tipo, destino = _resolver_tipo(tipo or tipo_de(destino), destino)
+    generador = bloques(nombres, desde, hasta, frecuencia, relleno, filas, directorio)
+    n = _volcar(_escritor(destino, nombres, tipo), generador)
+    return {"destino": destino, "tipo": tipo, "filas": n,
+            "desde": desde.isoformat(), "hasta": hasta.isoformat()}
+
+def incremental(directorio_salida, nombres=SERIES, frecuencia=None, relleno=None, desde=None,
+                tipo="parquet", filas=FILAS, directorio=series.DIR_INDICES):
+    """
+    Agrega a `directorio_salida` una parte con los renglones posteriores a
+    la última exportación, hasta el cierre común de las series. Reexporta
+    todo si cambió la configuración o algún renglón ya exportado. Devuelve
+    {parte, filas, desde, hasta, completa}.
+    """
+    abiertas = [series.obtener(n, directorio) for n in nombres]
+    frecuencia = frecuencia or ("diaria" if any(s.frecuencia == "diaria" for s in abiertas) else "mensual")
+    relleno = {n: (relleno or {}).get(n, "arrastre") for n in nombres}
+    primera, _, cierre = extremos(abiertas, frecuencia)
+    desde = desde or primera
+    config = {"series": list(nombres), "frecuencia": frecuencia, "relleno": relleno,
+              "desde": desde.isoformat()}
+
+    os.makedirs(directorio_salida, exist_ok=True)
+    path_estado = os.path.join(directorio_salida, ESTADO)
+    estado = None
+    if os.path.exists(path_estado):
+        with open(path_estado, "r", encoding="utf-8") as f:
+            estado = json.load(f)
+    completa = estado is None or estado["config"] != config
+    if not completa:
+        # lo ya exportado tiene que seguir siendo igual
+        firma = hashlib.blake2b(digest_size=16)
+        previo = date.fromisoformat(estado["hasta"])
+        for fechas, columnas in bloques(nombres, desde, previo, frecuencia, relleno, filas, directorio):
+            _firmar(firma, fechas, columnas)
+        completa = firma.hexdigest() != estado["firma"]
+        if completa:
+            sys.stderr.write("⚠️ Cambiaron renglones ya exportados: se reexporta todo.\n")
+    if completa:
+        for parte in (estado or {}).get("partes", []):
+            try:
+                os.remove(os.path.join(directorio_salida, parte))
+            except FileNotFoundError:
+                pass
+        tipo, _ = _resolver_tipo(tipo)
+        estado = {"config": config, "tipo": tipo, "hasta": None, "firma": None, "partes": []}
+        inicio, firma = desde, hashlib.blake2b(digest_size=16)
+    else:
+        inicio = (eje(frecuencia, date.fromisoformat(estado["hasta"]), cierre)[1:2].tolist() or [None])[0]
+
+    if inicio is None or inicio > cierre:
+        return {"parte": None, "filas": 0, "desde": None, "hasta": estado["hasta"], "completa": completa}
+    parte = f"parte-{len(estado['partes']) + 1:05d}{EXTENSIONES[estado['tipo']]}"
+    generador = bloques(nombres, inicio, cierre, frecuencia, relleno, filas, directorio)
+    n = _volcar(_escritor(os.path.join(directorio_salida, parte), nombres, estado["tipo"]), generador, firma)
+    fin = eje(frecuencia, inicio, cierre)[-1].item()
+    estado.update(hasta=fin.isoformat(), firma=firma.hexdigest(), partes=estado["partes"] + [parte])
+    with open(path_estado + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(estado, f, ensure_ascii=False, indent=2)
+    os.replace(path_estado + ".tmp", path_estado)
+    return {"parte": parte, "filas": n, "desde": inicio.isoformat(), "hasta": fin.isoformat(),
+            "completa": completa}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta varias series en una tabla alineada por fecha.")
+    parser.add_argument("destino", help="archivo (.parquet, .arrow, .csv, .csv.gz), '-' o, con --incremental, directorio")
+    parser.add_argument("--series", default=",".join(SERIES), help="series separadas por coma")
+    parser.add_argument("--frecuencia", choices=FRECUENCIAS, help="por defecto diaria si hay alguna diaria")
+    parser.add_argument("--relleno", action="append", default=[], metavar="REGLA|SERIE=REGLA",
+                        help="arrastre (por defecto) o nada, para todas o para una serie")
+    parser.add_argument("--desde", type=date.fromisoformat)
+    parser.add_argument("--hasta", type=date.fromisoformat, help="no vale con --incremental")
+    parser.add_argument("--tipo", choices=TIPOS, help="por defecto, según la extensión del destino")
+    parser.add_argument("--filas", type=int, default=FILAS, help="renglones por bloque")
+    parser.add_argument("--incremental", action="store_true", help="agregar sólo los renglones nuevos")
+    parser.add_argument("--indices", default=series.DIR_INDICES, help="directorio de las series")
+    args = parser.parse_args(argv)
+
+    nombres = tuple(s for s in args.series.split(",") if s)
+    desconocidas = [s for s in nombres if s not in series.DIARIAS + series.MENSUALES]
+    if desconocidas or not nombres:
+        parser.error(f"series desconocidas: {', '.join(desconocidas) or '(ninguna)'}")
+    relleno = {}
+    for regla in args.relleno:
+        serie, _, regla = regla.rpartition("=")
+        if regla not in RELLENOS or (serie and serie not in nombres):
+            parser.error(f"relleno inválido: {serie + '=' if serie else ''}{regla}")
+        for nombre in ([serie] if serie else nombres):
+            if serie or nombre not in relleno:
+                relleno[nombre] = regla
+    if args.incremental and (args.hasta or args.destino == "-"):
+        parser.error("--incremental escribe en un directorio y llega hasta el cierre común")
+
+    if args.incremental:
+        r = incremental(args.destino, nombres, args.frecuencia, relleno, args.desde,
+                        args.tipo or "parquet", args.filas, args.indices)
+        if r["parte"]:
+            print(f"✅ {r['filas']} renglones ({r['desde']} a {r['hasta']}) en "
+                  f"{os.path.join(args.destino, r['parte'])}{' (reexportación completa)' if r['completa'] else ''}")
+        else:
+            print(f"{args.destino} ya está al día (hasta {r['hasta']}).")
+        return 0
+    r = exportar(args.destino, nombres, args.frecuencia, relleno, args.desde, args.hasta,
+                 args.tipo, args.filas, args.indices)
+    if r["destino"] != "-":
+        print(f"✅ {r['filas']} renglones ({r['desde']} a {r['hasta']}) en {r['destino']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
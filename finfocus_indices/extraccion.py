@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Extracción dirigida de HTML sin armar el árbol completo.
+
+Cada fuente necesita una sola tabla, lista o tarjeta. En lugar de construir
+un BeautifulSoup de toda la página, estos helpers alimentan un HTMLParser
+incremental por bloques de BLOQUE caracteres, devuelven los elementos a
+medida que se cierran y dejan de parsear apenas quien los consume corta
+la iteración. El texto se normaliza igual que get_text(strip=True) de bs4:
+cada nodo de texto se recorta y se descartan los vacíos.
+"""
+
+import re
+from html import unescape
+from html.parser import HTMLParser
+
+BLOQUE = 4096
+
+_RE_TABLA = re.compile(r"<table\b", re.I)
+_RE_TAG   = re.compile(r"<[^>]*>")
+
+class _Elementos(HTMLParser):
+    """
+    Junta el texto de cada elemento `tags` (admite anidados) y lo deja en
+    `listos` como lista de nodos de texto al cerrarse el elemento.
+    """
+
+    def __init__(self, tags, fin=None):
+        super().__init__(convert_charrefs=True)
+        self.tags    = set(tags)
+        self.fin     = fin          # tag cuyo cierre termina el recorrido
+        self.abiertos = []          # [(tag, nodos)]
+        self.nodo    = []           # partes del nodo de texto en curso
+        self.listos  = []
+        self.cerrado = False
+
+    def _cortar_nodo(self):
+        if self.nodo:
+            texto = "".join(self.nodo).strip()
+            self.nodo = []
+            if texto:
+                for _, nodos in self.abiertos:
+                    nodos.append(texto)
+
+    def handle_starttag(self, tag, attrs):
+        self._cortar_nodo()
+        if tag in self.tags:
+            self.abiertos.append((tag, []))
+
+    def handle_endtag(self, tag):
+        self._cortar_nodo()
+        if tag in self.tags:
+            # cerrar hasta el último abierto con ese tag (tolera HTML mal anidado)
+            for i in range(len(self.abiertos) - 1, -1, -1):
+                if self.abiertos[i][0] == tag:
+                    cerrados = self.abiertos[i:]
+                    del self.abiertos[i:]
+                    for t, nodos in reversed(cerrados):
+                        self.listos.append((t, nodos))
+                    break
+        if tag == self.fin:
+            self.cerrado = True
+
+    def handle_data(self, data):
+        if self.abiertos:
+            self.nodo.append(data)
+
+def _recorrer(html, parser, desde=0):
+    """Alimenta `parser` por bloques y va entregando lo que se cierra."""
+    for i in range(desde, len(html), BLOQUE):
+        parser.feed(html[i:i + BLOQUE])
+        listos, parser.listos = parser.listos, []
+        yield from listos
+        if parser.cerrado:
+            return
+    parser.close()
+    yield from parser.listos
+
+def filas_tabla(html):
+    """
+    Itera las filas de la primera <table> como listas con el texto de cada
+    <td> (las filas sin <td>, como las de <thead>, se saltean). Devuelve None
+    si la página no tiene tabla. No mira nada antes ni después de la tabla.
+    """
+    m = _RE_TABLA.search(html)
+    if not m:
+        return None
+    return _filas(html, m.start())
+
+def _filas(html, desde):
+    parser = _Elementos(("tr", "td"), fin="table")
+    celdas = []
+    for tag, nodos in _recorrer(html, parser, desde):
+        if tag == "td":
+            celdas.append("".join(nodos))
+        else:
+            if celdas:
+                yield celdas
+            celdas = []
+
+def textos(html, tags, separador=""):
+    """
+    Itera el texto de cada elemento `tags` en el orden en que se cierran
+    (los anidados salen antes que su contenedor).
+    """
+    if isinstance(tags, str):
+        tags = (tags,)
+    for _, nodos in _recorrer(html, _Elementos(tags)):
+        yield separador.join(nodos)
+
+def texto_plano(fragmento):
+    """Texto de un fragmento HTML, sin tags y con espacios normalizados."""
+    return " ".join(unescape(_RE_TAG.sub(" ", fragmento)).split())
+
+def texto_desde(html, ancla, largo=300):
+    """
+    Texto plano de los `largo` caracteres de HTML que siguen a `ancla`,
+    o None si `ancla` no aparece literalmente en la página.
+    """
+    i = html.find(ancla)
+    if i < 0:
+        return None
+    return texto_plano(html[i:i + len(ancla) + largo])
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Qué hay en indices/ y cómo está guardado, en Python puro.
+
+Son las definiciones que comparten los módulos de lectura con NumPy
+(binario, mensual, series) y la lectura rápida de la línea de comandos
+(consulta.py), que no puede pagar el import de NumPy en cada consulta:
+
+  - las series y su frecuencia, y las derivadas como rezagos de su base;
+  - el encabezado de los .bin de las series diarias (ver binario.py);
+  - las claves "mmm-yy" de las mensuales y su índice de mes absoluto,
+    anio * 12 + (mes - 1) (ver mensual.py).
+
+Regla de siglo fija: yy >= PIVOTE es 19yy, si no 20yy. La serie más vieja
+(RIPTE) empieza en jul-94; la regla vale hasta que haya datos de 2090.
+"""
+
+import hashlib
+import os
+import struct
+from datetime import date
+
+RAIZ        = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIR_INDICES = os.environ.get("FINFOCUS_INDICES", os.path.join(RAIZ, "indices"))
+
+DIARIAS   = ("activa", "pasiva", "cer")
+MENSUALES = ("inflacion", "inflacion_esperada", "ripte", "ripte1", "ripte2", "smvm")
+
+# derivada → (serie base, meses de rezago); se calculan al leer (derivadas.py)
+REZAGOS = {
+    "ripte1": ("ripte", 1),
+    "ripte2": ("ripte", 2),
+}
+
+# ---------- .bin de las series diarias ----------
+
+MAGIA      = b"FFIDX02\0"
+ENCABEZADO = struct.Struct("<8sqq8sqq")
+
+def path_binario(path_json):
+    """indices/cer.json → indices/cer.bin"""
+    return os.path.splitext(path_json)[0] + ".bin"
+
+def hash_json(contenido):
+    return hashlib.blake2b(contenido, digest_size=8).digest()
+
+def leer_encabezado(path):
+    """Devuelve (fecha_inicial, cantidad, hash_export, mtime_ns_json, tamaño_json)."""
+    with open(path, "rb") as f:
+        crudo = f.read(ENCABEZADO.size)
+    if len(crudo) < ENCABEZADO.size or crudo[:len(MAGIA)] != MAGIA:
+        raise ValueError(f"{path} no es un archivo de serie diaria (o es de un formato anterior)")
+    _, ordinal, n, hash_export, mtime_ns, tamanio = ENCABEZADO.unpack(crudo)
+    return (date.fromordinal(ordinal) if n else None), n, hash_export, mtime_ns, tamanio
+
+def bin_vigente(path_json):
+    """
+    True si el .bin existe y corresponde al JSON actual. Compara primero la
+    mtime y el tamaño del JSON con los guardados en el encabezado; sólo si
+    el tamaño coincide y la mtime no (p. ej. después de un checkout) lee y
+    hashea el JSON. Un .bin de formato anterior no vale: se rearma en el
+    próximo guardado.
+    """
+    path_bin = path_binario(path_json)
+    try:
+        _, _, hash_export, mtime_ns, tamanio = leer_encabezado(path_bin)
+    except (FileNotFoundError, ValueError):
+        return False
+    try:
+        st = os.stat(path_json)
+    except FileNotFoundError:
+        return True
+    if (st.st_mtime_ns, st.st_size) == (mtime_ns, tamanio):
+        return True
+    if st.st_size != tamanio:
+        return False
+    with open(path_json, "rb") as f:
+        return hash_export == hash_json(f.read())
+
+# ---------- claves de las series mensuales ----------
+
+ABBR   = ["ene", "feb", "mar", "abr", "may", "jun", "jul", "ago", "sep", "oct", "nov", "dic"]
+PIVOTE = 90
+_MES   = {abbr: i for i, abbr in enumerate(ABBR)}
+
+def indice(anio, mes):
+    return anio * 12 + mes - 1
+
+def indice_de_fecha(fecha):
+    return fecha.year * 12 + fecha.month - 1
+
+def fecha_de_indice(i):
+    """Primer día del mes."""
+    anio, m = divmod(int(i), 12)
+    return date(anio, m + 1, 1)
+
+def parsear(clave):
+    """'may-25' → índice de mayo de 2025."""
+    mes, yy = clave.split("-")
+    yy = int(yy)
+    return indice(1900 + yy if yy >= PIVOTE else 2000 + yy, _MES[mes] + 1)
+
+def clave(i):
+    """Índice de mes → 'may-25'."""
+    anio, m = divmod(int(i), 12)
+    return f"{ABBR[m]}-{anio % 100:02d}"
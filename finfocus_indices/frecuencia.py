@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Conversión de frecuencia entre series diarias y mensuales.
+
+De una diaria (activa, pasiva, cer) a una mensual:
+
+  - cierre:   el último dato en o antes del último día del mes;
+  - promedio: el promedio de los días con dato del mes;
+  - tasa:     la tasa capitalizada del mes, de fin de mes a fin de mes,
+              con las reglas de intereses.py (activa suma T.N.A./365
+              hasta que empieza a capitalizar).
+
+Sólo entran los meses ya cerrados (cuyo último día es anterior o igual al
+último dato), para no publicar un promedio o una tasa de medio mes; por
+lo mismo, si la serie empieza a mitad de mes, el promedio arranca en el
+primer mes completo y la tasa del primer mes queda en NaN.
+
+De una mensual (ripte, inflacion, smvm, ...) a una diaria:
+
+  - mes:      cada día vale lo de su mes;
+  - prorrata: interpolación geométrica entre el valor de un mes (el día 1)
+              y el del siguiente, según los días transcurridos del mes;
+              llega hasta el día 1 del último mes con dato.
+
+y "tasa" de una mensual es la variación de cada mes contra el anterior.
+
+Todo se calcula con operaciones de arreglos sobre la serie guardada. Los
+resultados son SerieMensual / SerieDiaria de sólo lectura y se guardan
+por (serie, método); obtener() los recalcula si cambió alguno de los
+archivos de la serie (.json, .bin o journal; ripte1/ripte2 dependen de
+ripte). lote() resuelve varios pedidos leyendo cada serie una sola vez y
+muestrear() devuelve una matriz serie × fecha.
+
+    from finfocus_indices import frecuencia
+    frecuencia.obtener("cer", "cierre").a_dict()        # {"ene-25": ...}
+    frecuencia.obtener("ripte", "prorrata").valor(date(2025, 5, 16))
+    frecuencia.lote([("activa", "tasa"), ("pasiva", "tasa"), ("cer", "tasa")])
+    frecuencia.muestrear([("ripte", "prorrata"), ("cer", "cierre")], fechas)
+
+Uso:
+  ./finfocus convert SERIE:METODO [...]  (o python -m finfocus_indices.frecuencia)
+  python -m finfocus_indices.frecuencia SERIE:METODO [...] [--desde FECHA] [--hasta FECHA] [--json] [--indices DIR]
+"""
+
+import argparse
+import json
+import sys
+import threading
+from datetime import date
+
+import numpy as np
+
+from finfocus_indices import almacen, binario, formato, intereses, mensual, series
+from finfocus_indices.series import EPOCA_MES
+
+METODOS = {
+    "diaria":  ("cierre", "promedio", "tasa"),
+    "mensual": ("mes", "prorrata", "tasa"),
+}
+
+def _solo_lectura(valores):
+    valores.setflags(write=False)
+    return valores
+
+# ---------- diaria → mensual ----------
+
+def _meses_cerrados(fechas):
+    """Meses (datetime64[M]) entre el primer dato y el último mes completo."""
+    return np.arange(fechas[0].astype("datetime64[M]"), (fechas[-1] + 1).astype("datetime64[M]"))
+
+def _fin_de_mes(meses):
+    return (meses + 1).astype("datetime64[D]") - 1
+
+def cierre(serie):
+    fechas, _ = serie.rango(date.min, date.max)
+    meses = _meses_cerrados(fechas)
+    return meses, serie.valores_hasta(_fin_de_mes(meses))
+
+def promedio(serie):
+    fechas, valores = serie.rango(date.min, date.max)
+    meses = _meses_cerrados(fechas)
+    if len(meses) and meses[0].astype("datetime64[D]") < fechas[0]:
+        meses = meses[1:]                   # el primer mes no está completo
+    if not len(meses):
+        return meses, np.empty(0)
+    # cortes de cada mes dentro del arreglo diario
+    cortes = (meses.astype("datetime64[D]") - fechas[0]).astype(np.int64)
+    valores = valores[cortes[0]:(_fin_de_mes(meses[-1]) - fechas[0]).astype(np.int64) + 1]
+    cortes -= cortes[0]
+    hay = ~np.isnan(valores)
+    sumas = np.add.reduceat(np.where(hay, valores, 0.0), cortes)
+    cuantos = np.add.reduceat(hay.astype(np.int64), cortes)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return meses, np.where(cuantos > 0, sumas / cuantos, np.nan)
+
+def tasa_diaria(serie, directorio):
+    fechas, _ = serie.rango(date.min, date.max)
+    meses = _meses_cerrados(fechas)
+    desdes, hastas = _fin_de_mes(meses - 1), _fin_de_mes(meses)
+    # el primer mes no tiene fin de mes anterior dentro de la serie
+    validos = desdes >= fechas[0]
+    prefijos = intereses.obtener(serie.nombre, directorio)
+    tasas = np.full(len(meses), np.nan)
+    tasas[validos] = prefijos.compuesto_lote(desdes[validos], hastas[validos])
+    return meses, tasas
+
+# ---------- mensual → diaria ----------
+
+def _dias(meses):
+    """Días de los meses dados: (días datetime64[D], posición del mes de cada día)."""
+    dias = np.arange(meses[0].astype("datetime64[D]"), _fin_de_mes(meses[-1]) + 1)
+    return dias, (dias.astype("datetime64[M]") - meses[0]).astype(np.int64)
+
+def por_mes(serie):
+    fechas, valores = serie.rango(date.min, date.max)
+    dias, posicion = _dias(fechas.astype("datetime64[M]"))
+    return dias, valores[posicion]
+
+def prorrata(serie):
+    fechas, valores = serie.rango(date.min, date.max)
+    meses = fechas.astype("datetime64[M]")
+    dias = np.arange(fechas[0], fechas[-1] + 1)
+    posicion = (dias.astype("datetime64[M]") - meses[0]).astype(np.int64)
+    transcurridos = (dias - fechas[posicion]).astype(np.int64)
+    largo = (_fin_de_mes(meses[posicion]) - fechas[posicion]).astype(np.int64) + 1
+    actual, siguiente = valores[posicion], np.append(valores[1:], np.nan)[posicion]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        interpolado = actual * (siguiente / actual) ** (transcurridos / largo)
+    # el día 1 vale lo del mes aunque todavía no haya mes siguiente
+    return dias, np.where(transcurridos == 0, actual, interpolado)
+
+def tasa_mensual(serie):
+    fechas, valores = serie.rango(date.min, date.max)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tasas = np.append(np.nan, valores[1:] / valores[:-1] - 1)
+    return fechas.astype("datetime64[M]"), tasas
+
+# ---------- resultados, caché y lotes ----------
+
+def convertir(serie, metodo, directorio=series.DIR_INDICES):
+    """SerieMensual o SerieDiaria con `metodo` aplicado a la Serie `serie`."""
+    if metodo not in METODOS[serie.frecuencia]:
+        raise RuntimeError(f"{serie.nombre}: método {metodo!r} inválido para una serie {serie.frecuencia} "
+                           f"(uno de {', '.join(METODOS[serie.frecuencia])}).")
+    fechas, _ = serie.rango(date.min, date.max)
+    if not len(fechas):
+        raise RuntimeError(f"{serie.nombre}: la serie está vacía.")
+    if serie.frecuencia == "diaria":
+        if metodo == "tasa":
+            meses, valores = tasa_diaria(serie, directorio)
+        else:
+            meses, valores = (cierre if metodo == "cierre" else promedio)(serie)
+        inicio = int(meses[0].astype(np.int64)) + EPOCA_MES if len(meses) else 0
+        return mensual.SerieMensual(inicio, _solo_lectura(np.asarray(valores, dtype="<f8")))
+    if metodo == "tasa":
+        meses, valores = tasa_mensual(serie)
+        return mensual.SerieMensual(int(meses[0].astype(np.int64)) + EPOCA_MES,
+                                    _solo_lectura(np.asarray(valores, dtype="<f8")))
+    dias, valores = (por_mes if metodo == "mes" else prorrata)(serie)
+    return binario.SerieDiaria(dias[0].item(), _solo_lectura(np.asarray(valores, dtype="<f8")))
+
+_cache = {}
+_lock = threading.Lock()
+
+def _firma(nombre, directorio):
+    """(mtime_ns, tamaño) de los archivos de los que sale la serie."""
+    base = formato.REZAGOS[nombre][0] if nombre in formato.REZAGOS else nombre
+    return almacen.firma(almacen.path_json(base, directorio))
+
+def lote(pedidos, directorio=series.DIR_INDICES):
+    """
+    Lista de resultados de los pedidos [(serie, método)], en el mismo
+    orden. Cada serie que haya que recalcular se lee una sola vez.
+    """
+    pedidos = list(pedidos)
+    abiertas = {}
+    resultados = []
+    with _lock:
+        for nombre, metodo in pedidos:
+            firma = _firma(nombre, directorio)
+            clave = (nombre, metodo, directorio)
+            previo = _cache.get(clave)
+            if previo and previo[0] == firma:
+                resultados.append(previo[1])
+                continue
+            if nombre not in abiertas:
+                # una Serie nueva (no la del LRU de series.obtener) para leer lo último
+                abiertas[nombre] = series.Serie(nombre, directorio)
+            resultado = convertir(abiertas[nombre], metodo, directorio)
+            _cache[clave] = (firma, resultado)
+            resultados.append(resultado)
+    return resultados
+
+def obtener(nombre, metodo, directorio=series.DIR_INDICES):
+    """La serie `nombre` convertida con `metodo`, recalculada si cambió su fuente."""
+    return lote([(nombre, metodo)], directorio)[0]
+
+def valores_en(resultado, fechas):
+    """Valor de un resultado en cada fecha (datetime64[D]): el del día o el del mes, o NaN."""
+    fechas = np.asarray(fechas, dtype="datetime64[D]")
+    if isinstance(resultado, binario.SerieDiaria):
+        i = (fechas - np.datetime64(resultado.inicio, "D")).astype(np.int64)
+    else:
+        i = fechas.astype("datetime64[M]").astype(np.int64) + EPOCA_MES - resultado.inicio
+    n = len(resultado.valores)
+    if not n:
+        return np.full(fechas.shape, np.nan)
+    return np.where((i >= 0) & (i < n), resultado.valores[np.clip(i, 0, n - 1)], np.nan)
+
+def muestrear(pedidos, fechas, directorio=series.DIR_INDICES):
+    """Matriz len(pedidos) × len(fechas) con cada conversión evaluada en las fechas."""
+    pedidos = list(pedidos)
+    return np.vstack([valores_en(r, fechas) for r in lote(pedidos, directorio)]) if pedidos \
+        else np.empty((0, len(fechas)))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conversión de frecuencia de las series.")
+    parser.add_argument("pedidos", nargs="+", metavar="SERIE:METODO",
+                        help="p. ej. cer:cierre, activa:tasa, ripte:prorrata")
+    parser.add_argument("--desde", type=date.fromisoformat, default=date.min)
+    parser.add_argument("--hasta", type=date.fromisoformat, default=date.max)
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de texto")
+    parser.add_argument("--indices", default=series.DIR_INDICES, help="directorio de las series")
+    args = parser.parse_args(argv)
+
+    pedidos = []
+    for pedido in args.pedidos:
+        nombre, _, metodo = pedido.partition(":")
+        if nombre not in series.DIARIAS + series.MENSUALES:
+            parser.error(f"serie desconocida: {nombre}")
+        frecuencia = "diaria" if nombre in series.DIARIAS else "mensual"
+        if metodo not in METODOS[frecuencia]:
+            parser.error(f"{nombre}: método {metodo!r} inválido (uno de {', '.join(METODOS[frecuencia])})")
+        pedidos.append((nombre, metodo))
+
+    salida = {}
+    for (nombre, metodo), r in zip(pedidos, lote(pedidos, args.indices)):
+        if isinstance(r, binario.SerieDiaria):
+            datos = {k: v for k, v in r.a_dict().items()
+                     if args.desde.isoformat() <= k <= args.hasta.isoformat()}
+        else:
+            a, b = mensual.indice_de_fecha(args.desde), mensual.indice_de_fecha(args.hasta)
+            datos = {mensual.clave(r.inicio + k): v for k, v in enumerate(r.valores.tolist())
+                     if v == v and a <= r.inicio + k <= b}
+        salida[f"{nombre}:{metodo}"] = datos
+    if args.json:
+        print(json.dumps(salida, ensure_ascii=False, indent=2))
+        return 0
+    for pedido, datos in salida.items():
+        print(f"{pedido}: {len(datos)} puntos")
+        for clave, valor in list(datos.items())[-12:]:
+            print(f"  {clave}  {valor:.6g}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Historial de revisiones de las series: qué valor tenía cada punto según
+lo que se sabía en una fecha dada.
+
+update_inflacion_esperada.py pisa el mes en curso cada día y update_activa
+reescribe la cola cuando la vigencia se corre para atrás; el valor previo
+sólo queda en git. Cada escritura del almacén (guardar_json, guardar_diaria
+y agregar_diaria en modo journal) agrega aquí una línea JSON con sólo los
+puntos que cambiaron respecto de la revisión anterior:
+
+  {"t": 1752948000, "c": {"jul-25": 24.6}, "b": ["2025-07-19"]}
+
+t es el instante de la escritura (segundos UTC, no decrece), c los puntos
+nuevos o modificados y b los borrados. La primera vez que se escribe una
+serie sin historial se siembra con su contenido previo (con la fecha de
+modificación del archivo); `importar` la siembra en cambio desde git log,
+con una revisión por commit.
+
+Los .historial son parte de lo publicado: viven junto a cada serie en
+indices/ y el workflow diario los commitea con ella (git add indices/),
+así quien clona el repo puede consultar valores pasados sin reconstruirlos.
+
+Al cargar se arma, por punto, la lista de instantes de sus revisiones y
+los valores, y la lista de instantes de todas las revisiones: "el valor
+de X según lo conocido en K" es una búsqueda binaria sobre las revisiones
+de X, y la serie entera a K aplica en memoria las revisiones hasta K.
+obtener() comparte el historial cargado y lo relee si el archivo cambió
+por fuera del proceso.
+
+Escribir no necesita cargarlo: los agregados del journal (que no borran
+puntos y ya saben qué cambió) usan anotar(), que sólo lee el final del
+archivo para recortar una línea cortada y no retroceder t.
+
+    from finfocus_indices import historial
+    h = historial.obtener("inflacion_esperada")
+    h.valor("jul-25", date(2025, 7, 10))     # lo publicado al 10/07/2025
+    h.estado(date(2025, 7, 10))              # la serie entera a esa fecha
+
+Uso:
+  python -m finfocus_indices.historial [serie ...]                # resumen
+  python -m finfocus_indices.historial valor SERIE CLAVE [--al FECHA]
+  python -m finfocus_indices.historial revisiones SERIE CLAVE
+  python -m finfocus_indices.historial estado SERIE [--al FECHA] [--salida JSON]
+  python -m finfocus_indices.historial importar [serie ...]       # desde git log
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timezone
+from datetime import time as hora
+
+from finfocus_indices import formato, metricas
+
+COLA = 4096      # bytes del final que mira anotar() para hallar la última revisión
+
+_FALTA = object()
+_ISO = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
+def path_historial(path_json):
+    """indices/cer.json → indices/cer.historial"""
+    return os.path.splitext(path_json)[0] + ".historial"
+
+def instante(conocido):
+    """
+    Segundos UTC de `conocido`: None es "ahora", un date cuenta hasta el
+    final de ese día y un datetime sin zona se toma como UTC.
+    """
+    if conocido is None:
+        return float("inf")
+    if isinstance(conocido, (int, float)):
+        return conocido
+    if not isinstance(conocido, datetime):
+        conocido = datetime.combine(conocido, hora.max)
+    if conocido.tzinfo is None:
+        conocido = conocido.replace(tzinfo=timezone.utc)
+    return conocido.timestamp()
+
+def es_serie(data):
+    """True si `data` es {clave: número}: lo único que se versiona."""
+    return isinstance(data, dict) and all(
+        v is None or (isinstance(v, (int, float)) and not isinstance(v, bool)) for v in data.values()
+    )
+
+class Historial:
+    """Revisiones de una serie, indexadas por punto y por instante."""
+
+    def __init__(self, path_json):
+        self.path = path_historial(path_json)
+        self.tiempos = []      # instante de cada revisión, en orden
+        self._cambios = []     # (c, b) de cada revisión, alineado con tiempos
+        self.puntos = {}       # clave → ([instantes], [valores]); None = borrado
+        self.vigente = {}      # estado después de la última revisión
+        self._desordenada = False   # alguna clave nueva llegó antes que una previa
+        self.bytes_validos = 0
+        self._cargar()
+
+    def _cargar(self):
+        if not os.path.exists(self.path):
+            return
+        with metricas.etapa("carga"), open(self.path, "rb") as f:
+            for linea in f:
+                if not linea.endswith(b"\n"):
+                    break                       # escritura incompleta
+                try:
+                    self._aplicar(json.loads(linea))
+                except ValueError:
+                    break
+                self.bytes_validos += len(linea)
+
+    def _aplicar(self, revision):
+        t = revision["t"]
+        self.tiempos.append(t)
+        self._cambios.append((revision.get("c", {}), revision.get("b", ())))
+        for clave, valor in revision.get("c", {}).items():
+            if clave not in self.puntos:
+                self._desordenada |= bool(self.puntos) and clave < next(reversed(self.puntos))
+            tiempos, valores = self.puntos.setdefault(clave, ([], []))
+            tiempos.append(t)
+            valores.append(valor)
+            self.vigente[clave] = valor
+        for clave in revision.get("b", ()):
+            tiempos, valores = self.puntos.setdefault(clave, ([], []))
+            tiempos.append(t)
+            valores.append(None)
+            self.vigente.pop(clave, None)
+
+    def diferencia(self, data, completo=True):
+        """({clave: valor} nuevos o cambiados, [claves borradas]) respecto de lo vigente."""
+        vigente = self.vigente
+        cambios = {k: v for k, v in data.items() if vigente.get(k, _FALTA) != v}
+        borrados = [k for k in vigente if k not in data] if completo else []
+        return cambios, borrados
+
+    def registrar(self, data, completo=True, t=None):
+        """
+        Agrega una revisión con lo que cambió de `data` (la serie entera si
+        `completo`, si no sólo esos puntos). Devuelve cuántos puntos cambió.
+        """
+        cambios, borrados = self.diferencia(data, completo)
+        if not cambios and not borrados:
+            return 0
+        t = int(time.time()) if t is None else int(t)
+        if self.tiempos:
+            t = max(t, self.tiempos[-1])
+        revision = {"t": t, "c": cambios}
+        if borrados:
+            revision["b"] = borrados
+        linea = (json.dumps(revision, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size > self.bytes_validos:
+                os.ftruncate(fd, self.bytes_validos)   # descarta una línea cortada
+            os.write(fd, linea)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        metricas.sumar("bytes_escritos", len(linea))
+        self.bytes_validos += len(linea)
+        self._aplicar(revision)
+        return len(cambios) + len(borrados)
+
+    def valor(self, clave, conocido=None):
+        """Valor de `clave` según lo conocido en `conocido` (None si no existía)."""
+        if clave not in self.puntos:
+            return None
+        tiempos, valores = self.puntos[clave]
+        i = bisect_right(tiempos, instante(conocido))
+        return valores[i - 1] if i else None
+
+    def revisiones(self, clave):
+        """[(datetime UTC, valor)] de cada cambio de `clave`; None es un borrado."""
+        tiempos, valores = self.puntos.get(clave, ([], []))
+        return [(datetime.fromtimestamp(t, timezone.utc), v) for t, v in zip(tiempos, valores)]
+
+    def cantidad(self, conocido=None):
+        """Revisiones registradas hasta `conocido`."""
+        return bisect_right(self.tiempos, instante(conocido))
+
+    def estado(self, conocido=None):
+        """La serie {clave: valor} según lo conocido en `conocido`."""
+        if conocido is None:
+            estado = dict(self.vigente)
+        else:
+            estado = {}
+            for cambios, borrados in self._cambios[:self.cantidad(conocido)]:
+                estado.update(cambios)
+                for clave in borrados:
+                    estado.pop(clave, None)
+        # las diarias van por fecha aunque un hueco se haya completado después
+        if self._desordenada and estado and _ISO.match(next(iter(estado))):
+            estado = dict(sorted(estado.items()))
+        return estado
+
+_historiales = {}
+_lock = threading.Lock()
+
+def _firma(path):
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except FileNotFoundError:
+        return None
+
+def _obtener(path_json):
+    path = path_historial(path_json)
+    previo = _historiales.get(path_json)
+    if previo and previo[0] == _firma(path):
+        return previo[1]
+    h = Historial(path_json)
+    _historiales[path_json] = (_firma(path), h)
+    return h
+
+def obtener(serie, directorio=None):
+    """Historial compartido de la serie, releído si su archivo cambió."""
+    with _lock:
+        return _obtener(os.path.join(directorio or formato.DIR_INDICES, f"{serie}.json"))
+
+def sembrar(path_json, previo):
+    """
+    Si la serie todavía no tiene historial, lo empieza con su contenido
+    actual, `previo()`, fechado con la modificación del archivo. Se llama
+    antes de escribir para no perder los valores que se van a pisar.
+    """
+    if os.path.exists(path_historial(path_json)) or not os.path.exists(path_json):
+        return
+    data = previo()
+    if not es_serie(data):
+        return
+    with _lock:
+        h = _obtener(path_json)
+        if not h.tiempos:
+            h.registrar(data, t=min(os.path.getmtime(path_json), time.time()))
+
+def registrar(path_json, data, completo=True, t=None):
+    """Registra lo que cambió de la serie de `path_json` (ver Historial.registrar)."""
+    if not es_serie(data):
+        return 0
+    with _lock:
+        return _obtener(path_json).registrar(data, completo, t)
+
+def _final(fd):
+    """(bytes hasta la última revisión entera, su t) de un .historial abierto."""
+    tamanio = os.fstat(fd).st_size
+    if not tamanio:
+        return 0, None
+    cola = os.pread(fd, min(tamanio, COLA), tamanio - min(tamanio, COLA))
+    fin = cola.rfind(b"\n") + 1            # lo que sigue es una escritura cortada
+    previo = cola.rfind(b"\n", 0, max(fin - 1, 0))
+    if fin and (previo >= 0 or len(cola) == tamanio):
+        try:
+            return tamanio - len(cola) + fin, json.loads(cola[previo + 1:fin])["t"]
+        except (ValueError, KeyError, TypeError):
+            pass
+    largo, ultimo = 0, None                 # cola rara: recorrerlo entero, como _cargar()
+    for linea in os.pread(fd, tamanio, 0).splitlines(keepends=True):
+        if not linea.endswith(b"\n"):
+            break
+        try:
+            ultimo = json.loads(linea)["t"]
+        except (ValueError, KeyError, TypeError):
+            break
+        largo += len(linea)
+    return largo, ultimo
+
+def anotar(path_json, cambios, t=None):
+    """
+    Agrega una revisión con `cambios` ({clave: valor} que ya se sabe que
+    cambiaron, sin borrados) sin cargar el historial. Devuelve cuántos
+    puntos anotó.
+    """
+    if not cambios:
+        return 0
+    t = int(time.time()) if t is None else int(t)
+    with _lock:
+        fd = os.open(path_historial(path_json), os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            largo, ultimo = _final(fd)
+            revision = {"t": max(t, ultimo) if ultimo is not None else t, "c": cambios}
+            linea = (json.dumps(revision, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+            if os.fstat(fd).st_size > largo:
+                os.ftruncate(fd, largo)             # descarta una línea cortada
+            os.write(fd, linea)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    metricas.sumar("bytes_escritos", len(linea))
+    return len(cambios)
+
+# ---------- importación desde git ----------
+
+def _git(*args):
+    return subprocess.run(("git",) + args, capture_output=True, check=True).stdout
+
+def importar(serie, directorio=None):
+    """
+    Siembra el historial con una revisión por commit que tocó la serie,
+    fechada con el commit. Sólo si la serie todavía no tiene historial.
+    """
+    directorio = directorio or formato.DIR_INDICES
+    path_json = os.path.join(directorio, f"{serie}.json")
+    if os.path.exists(path_historial(path_json)):
+        raise RuntimeError(f"{serie}: ya tiene historial en {path_historial(path_json)}")
+    raiz = _git("-C", directorio, "rev-parse", "--show-toplevel").decode().strip()
+    relativo = os.path.relpath(os.path.abspath(path_json), raiz).replace(os.sep, "/")
+    commits = _git("-C", raiz, "log", "--reverse", "--format=%H %ct", "--", relativo).decode().split()
+    revisiones = 0
+    for sha, ct in zip(commits[::2], commits[1::2]):
+        try:
+            texto = _git("-C", raiz, "show", f"{sha}:{relativo}").decode("utf-8")
+            data = json.loads(re.sub(r',\s*([}\]])', r'\1', texto))
+        except (subprocess.CalledProcessError, ValueError):
+            continue                            # borrado o roto en ese commit
+        revisiones += bool(registrar(path_json, data, t=int(ct)))
+    return revisiones
+
+def _al(texto):
+    """"2025-07-10" es ese día entero; con hora, ese instante."""
+    return date.fromisoformat(texto) if len(texto) == 10 else datetime.fromisoformat(texto)
+
+def main(argv=None):
+    from finfocus_indices import almacen, series
+    todas = series.DIARIAS + series.MENSUALES
+    directorio = almacen.DIR_INDICES
+
+    parser = argparse.ArgumentParser(description="Historial de revisiones de las series.")
+    sub = parser.add_subparsers(dest="comando")
+    p = sub.add_parser("valor", help="valor de un punto según lo conocido en una fecha")
+    p.add_argument("serie", choices=todas)
+    p.add_argument("clave")
+    p.add_argument("--al", type=_al, help="fecha o instante (por defecto, ahora)")
+    p = sub.add_parser("revisiones", help="todas las revisiones de un punto")
+    p.add_argument("serie", choices=todas)
+    p.add_argument("clave")
+    p = sub.add_parser("estado", help="la serie entera según lo conocido en una fecha")
+    p.add_argument("serie", choices=todas)
+    p.add_argument("--al", type=_al)
+    p.add_argument("--salida", metavar="JSON", help="guardar en un archivo en lugar de imprimir")
+    p = sub.add_parser("importar", help="sembrar el historial desde git log")
+    p.add_argument("series", nargs="*")
+    argv = sys.argv[1:] if argv is None else argv
+    comando = argv[0] if argv and argv[0] in sub.choices else None
+    args = parser.parse_args(argv) if comando else argparse.Namespace(comando=None, series=argv)
+    if hasattr(args, "series") and set(args.series) - set(todas):
+        parser.error(f"series desconocidas: {', '.join(sorted(set(args.series) - set(todas)))}")
+
+    if args.comando == "valor":
+        print(obtener(args.serie, directorio).valor(args.clave, args.al))
+    elif args.comando == "revisiones":
+        for t, valor in obtener(args.serie, directorio).revisiones(args.clave):
+            print(f"{t.isoformat()}  {'(borrado)' if valor is None else valor}")
+    elif args.comando == "estado":
+        estado = obtener(args.serie, directorio).estado(args.al)
+        if args.salida:
+            with open(args.salida, "wb") as f:
+                f.write(almacen.serializar(estado))
+            print(f"✅ {len(estado)} puntos en {args.salida}")
+        else:
+            print(json.dumps(estado, ensure_ascii=False, indent=2))
+    elif args.comando == "importar":
+        for serie in args.series or todas:
+            print(f"✅ {serie}: {importar(serie, directorio)} revisiones importadas de git")
+    else:
+        for serie in args.series or todas:
+            h = obtener(serie, directorio)
+            if not h.tiempos:
+                print(f"{serie}: sin historial")
+                continue
+            desde = datetime.fromtimestamp(h.tiempos[0], timezone.utc).date().isoformat()
+            corregidos = sum(len(t) > 1 for t, _ in h.puntos.values())
+            print(f"{serie}: {len(h.tiempos)} revisiones desde {desde}, "
+                  f"{len(h.puntos)} puntos ({corregidos} con más de una versión)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Control de huecos y consistencia de las series diarias.
+
+activa, pasiva y cer tienen un valor por día corrido. Un scrape que falla
+deja el día sin dato y nadie se entera, hasta que update_activa.py no
+encuentra el día anterior desde el que capitalizar. escanear() revisa la
+serie entera de una vez, sobre arreglos:
+
+  - faltantes: días sin dato entre el primero y el último (NaN en el
+    arreglo denso, base + journal);
+  - duplicados: fechas repetidas en el JSON publicado (json.load se queda
+    con la última en silencio);
+  - desordenadas: claves del JSON anteriores a la que las precede.
+
+reparar() completa los faltantes con una estrategia de ESTRATEGIAS y
+devuelve el detalle de cada día que cambió:
+
+  - arrastre:   el último valor anterior al hueco;
+  - geometrica: interpolación geométrica entre los valores que rodean el
+    hueco (tasa diaria constante en el tramo), redondeada a los decimales
+    de la serie;
+  - backfill:   los valores de una exportación histórica (mismos formatos
+    que backfill.py); los días que el archivo no trae quedan sin reparar.
+
+Al guardar, la serie se reescribe ordenada y sin claves repetidas.
+
+Uso:
+  python -m finfocus_indices.huecos                          # escanear todas
+  python -m finfocus_indices.huecos pasiva --reparar geometrica --simular
+  python -m finfocus_indices.huecos pasiva --reparar backfill --archivo fixtures/backfill/pasiva.csv
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import date
+
+import numpy as np
+
+from finfocus_indices import almacen, backfill, binario, journal
+
+def leer_pares(path):
+    """Pares (clave, valor) del JSON en el orden del archivo, con repetidos."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    return json.loads(re.sub(r',\s*([}\]])', r'\1', text), object_pairs_hook=lambda pares: pares)
+
+def densa(path, pares):
+    """
+    (fecha_inicial, arreglo por día) de los pares del JSON más el journal,
+    sin pasar por almacen: abrir_diaria lee el .bin si está al día, y acá
+    se revisa lo publicado en el JSON. No escribe nada.
+    """
+    return binario.desde_dict({**dict(pares), **journal.leer(path)})
+
+def escanear(serie, directorio=None):
+    """Resumen de faltantes, duplicados y desordenadas de la serie diaria."""
+    path = almacen.path_json(serie, directorio)
+    pares = leer_pares(path)
+    dias = np.array([k for k, _ in pares], dtype="datetime64[D]").astype(np.int64)
+
+    anteriores = np.maximum.accumulate(dias)
+    desordenadas = np.flatnonzero(np.r_[False, dias[1:] < anteriores[:-1]])
+
+    unicos, conteos = np.unique(dias, return_counts=True)
+    duplicados = []
+    for d in unicos[conteos > 1].tolist():
+        valores = [pares[i][1] for i in np.flatnonzero(dias == d).tolist()]
+        # el que queda al leer (y al reescribir la serie) es el último
+        duplicados.append({"fecha": _iso(d), "valores": valores, "vigente": valores[-1]})
+
+    inicio, valores = densa(path, pares)
+    faltantes = np.flatnonzero(np.isnan(valores))
+    ordinal = inicio.toordinal() if inicio else 0
+    return {
+        "serie": serie,
+        "dias": len(valores),
+        "primera": inicio.isoformat() if inicio else None,
+        "ultima": date.fromordinal(ordinal + len(valores) - 1).isoformat() if inicio else None,
+        "faltantes": [date.fromordinal(ordinal + i).isoformat() for i in faltantes.tolist()],
+        "duplicados": duplicados,
+        "desordenadas": [pares[i][0] for i in desordenadas.tolist()],
+        "ok": not (len(faltantes) or duplicados or len(desordenadas)),
+    }
+
+def _iso(dia):
+    """Días desde 1970-01-01 → 'YYYY-MM-DD'."""
+    return str(np.datetime64(int(dia), "D"))
+
+def decimales_de(valores, muestra=100):
+    """Decimales con que se publican los últimos valores de la serie."""
+    con_dato = valores[~np.isnan(valores)][-muestra:]
+    return max((len(repr(v).partition(".")[2]) for v in con_dato.tolist()), default=0)
+
+def arrastre(inicio, valores, faltantes, **_):
+    """El último valor con dato anterior a cada faltante."""
+    con_dato = np.where(np.isnan(valores), 0, np.arange(len(valores)))
+    return valores[np.maximum.accumulate(con_dato)[faltantes]]
+
+def geometrica(inicio, valores, faltantes, decimales=None, **_):
+    """Interpolación geométrica entre los valores que rodean cada hueco."""
+    n = len(valores)
+    hay = ~np.isnan(valores)
+    izquierda = np.maximum.accumulate(np.where(hay, np.arange(n), 0))[faltantes]
+    derecha = np.minimum.accumulate(np.where(hay, np.arange(n), n - 1)[::-1])[::-1][faltantes]
+    fraccion = (faltantes - izquierda) / (derecha - izquierda)
+    reparados = valores[izquierda] * (valores[derecha] / valores[izquierda]) ** fraccion
+    if decimales is None:
+        decimales = decimales_de(valores)
+    return np.round(reparados, decimales)
+
+def desde_archivo(inicio, valores, faltantes, archivo=None, **_):
+    """Los valores que trae una exportación histórica para los faltantes."""
+    if archivo is None:
+        raise RuntimeError("La estrategia backfill necesita --archivo con la exportación.")
+    reparados = np.full(len(faltantes), np.nan)
+    posicion = np.full(len(valores), -1)
+    posicion[faltantes] = np.arange(len(faltantes))
+    with open(archivo, "r", encoding="utf-8-sig", newline="") as f:
+        for unidades, nuevos, _ in backfill.bloques(f, backfill.parsear_dia):
+            i = unidades - inicio
+            dentro = (i >= 0) & (i < len(valores))
+            j = posicion[i[dentro]]
+            reparados[j[j >= 0]] = nuevos[dentro][j >= 0]
+    return reparados
+
+ESTRATEGIAS = {
+    "arrastre":   arrastre,
+    "geometrica": geometrica,
+    "backfill":   desde_archivo,
+}
+
+def reparar(serie, estrategia, simular=False, directorio=None, **opciones):
+    """
+    Completa los faltantes de la serie con `estrategia` y la reescribe
+    ordenada y sin repetidos. Devuelve el escaneo previo más el detalle
+    de lo que cambió.
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise KeyError(f"Estrategia desconocida: {estrategia!r}")
+    reporte = escanear(serie, directorio)
+    path = almacen.path_json(serie, directorio)
+    # la misma lectura que escanear(): con simular=True no se escribe nada
+    fecha_inicial, valores = densa(path, leer_pares(path))
+    inicio = fecha_inicial.toordinal() if fecha_inicial else 0
+    faltantes = np.flatnonzero(np.isnan(valores))
+
+    reparados = ESTRATEGIAS[estrategia](inicio, valores, faltantes, **opciones)
+    hechos = ~np.isnan(reparados)
+    valores[faltantes[hechos]] = reparados[hechos]
+
+    reporte.update({
+        "estrategia": estrategia,
+        "cambios": [{"fecha": date.fromordinal(inicio + i).isoformat(), "antes": None, "despues": v}
+                    for i, v in zip(faltantes[hechos].tolist(), reparados[hechos].tolist())],
+        "sin_reparar": [date.fromordinal(inicio + i).isoformat() for i in faltantes[~hechos].tolist()],
+        "escrito": False,
+    })
+    if not simular and (reporte["cambios"] or reporte["duplicados"] or reporte["desordenadas"]):
+        almacen.guardar_diaria(path, binario.a_dict(fecha_inicial, valores))
+        reporte["escrito"] = True
+    return reporte
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Huecos y consistencia de las series diarias.")
+    parser.add_argument("series", nargs="*", help="series a revisar (por defecto, todas las diarias)")
+    parser.add_argument("--reparar", choices=ESTRATEGIAS, metavar="ESTRATEGIA",
+                        help="completar los faltantes: " + ", ".join(ESTRATEGIAS))
+    parser.add_argument("--archivo", help="exportación histórica para la estrategia backfill")
+    parser.add_argument("--decimales", type=int, help="redondeo de la interpolación geométrica")
+    parser.add_argument("--simular", action="store_true", help="no escribir nada")
+    parser.add_argument("--reporte", metavar="JSON", help="guardar también el reporte en un archivo")
+    args = parser.parse_args(argv)
+    desconocidas = [s for s in args.series if s not in almacen.DIARIAS]
+    if desconocidas:
+        parser.error(f"series desconocidas: {', '.join(desconocidas)}")
+
+    reportes = []
+    for serie in args.series or almacen.DIARIAS:
+        if args.reparar:
+            reportes.append(reparar(serie, args.reparar, args.simular,
+                                    archivo=args.archivo, decimales=args.decimales))
+        else:
+            reportes.append(escanear(serie))
+    salida = json.dumps(reportes, ensure_ascii=False, indent=2)
+    print(salida)
+    if args.reporte:
+        with open(args.reporte, "w", encoding="utf-8") as f:
+            f.write(salida)
+    if args.reparar:
+        return 1 if any(r["sin_reparar"] for r in reportes) else 0
+    return 0 if all(r["ok"] for r in reportes) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Interés simple y compuesto entre dos fechas cualesquiera sobre las series
+diarias de tasas (activa, pasiva) y el CER.
+
+Los juzgados aplican las tasas de dos maneras: capitalizando (cociente de
+índices, producto de 1 + tasa diaria) o sumando las tasas diarias. Sumar
+varios años día por día para cada crédito es lento, así que por serie se
+arman una vez dos arreglos de prefijos sobre la tasa diaria t[i]:
+
+  suma[i]     = t[1] + ... + t[i]
+  producto[i] = (1 + t[1]) * ... * (1 + t[i])
+
+y cualquier período es una resta o un cociente: simple(desde, hasta) =
+suma[hasta] - suma[desde], compuesto = producto[hasta] / producto[desde] - 1.
+La tasa de un día rige entre el día anterior y ese día, así que el
+período cuenta los días de (desde, hasta].
+
+La tasa diaria sale de los valores guardados según cómo se armó cada
+tramo de la serie. Los tramos se guardan junto a las series, en
+indices/reglas_tasas.json (con la evidencia de cada cambio); una serie
+que no figura ahí es compuesta de punta a punta:
+
+  - compuesta: t = v[i] / v[i-1] - 1 (pasiva, CER, y activa desde que
+    update_activa capitaliza);
+  - aditiva: t = (v[i] - v[i-1]) / 100 (la historia de activa, que suma
+    T.N.A. / 365 puntos por día).
+
+verificar() busca en los datos el día en que la serie pasa de sumar a
+capitalizar (el corte que deja más pareja la T.N.A. implícita) y lo
+compara con el configurado; obtener() avisa por stderr si no coinciden,
+por ejemplo si la serie se regeneró con otra regla.
+
+Los días sin dato reparten en partes iguales (geométricas o aritméticas,
+según la regla) la variación entre los días con dato que los rodean.
+
+Cuando se agregan días, actualizar() no rearma todo: busca el primer día
+que cambió y recalcula los prefijos sólo desde el último dato anterior a
+él. obtener() devuelve los prefijos compartidos de una serie y los pone al
+día si cambiaron sus archivos (.json, .bin o journal).
+
+    from finfocus_indices import intereses
+    p = intereses.obtener("activa")
+    p.simple(date(2020, 1, 1), date(2025, 7, 1))       # 3.40 = 340 %
+    p.compuesto(date(2020, 1, 1), date(2025, 7, 1))
+    p.simple_lote(desdes, hastas)                     # arreglos datetime64[D]
+
+Uso:
+  python -m finfocus_indices.intereses activa 2020-01-01 2025-07-01
+  python -m finfocus_indices.intereses verificar [serie ...]
+"""
+
+import os
+import sys
+import threading
+from datetime import date
+
+import numpy as np
+
+from finfocus_indices import almacen, formato
+from finfocus_indices.series import EPOCA
+
+ARCHIVO_REGLAS = "reglas_tasas.json"
+VENTANA        = 30     # días a cada lado de un cambio de regla en los que se lo busca
+
+def leer_reglas(directorio=formato.DIR_INDICES):
+    """
+    serie → tramos (desde, regla) en orden, de <directorio>/reglas_tasas.json
+    (o del de indices/ del repo, si el directorio no tiene uno); cada regla
+    rige hasta el siguiente tramo.
+    """
+    path = os.path.join(directorio, ARCHIVO_REGLAS)
+    if not os.path.exists(path):
+        path = os.path.join(formato.DIR_INDICES, ARCHIVO_REGLAS)
+    try:
+        data = almacen.leer_json(path)
+    except FileNotFoundError:
+        data = {}
+    reglas = {}
+    for serie in formato.DIARIAS:
+        tramos = data.get(serie) or [{"desde": None, "regla": "compuesta"}]
+        for tramo in tramos:
+            if tramo["regla"] not in ("aditiva", "compuesta"):
+                raise RuntimeError(f"{serie}: regla desconocida {tramo['regla']!r} en {ARCHIVO_REGLAS}")
+        reglas[serie] = tuple((date.fromisoformat(t["desde"]) if t["desde"] else date.min, t["regla"])
+                              for t in tramos)
+    return reglas
+
+REGLAS = leer_reglas()
+
+def tasas_diarias(inicio, valores, reglas=REGLAS["pasiva"]):
+    """
+    Tasa diaria t[1..n-1] de la serie densa `valores` que empieza el día
+    con ordinal `inicio` (t[0] no existe: el primer día no tiene anterior).
+    """
+    valores = np.asarray(valores, dtype="<f8")
+    tasas = np.full(max(len(valores) - 1, 0), np.nan)
+    con_dato = np.flatnonzero(~np.isnan(valores))
+    if len(con_dato) < 2:
+        return tasas
+    saltos = np.diff(con_dato)
+    previos, siguientes = valores[con_dato[:-1]], valores[con_dato[1:]]
+    # la regla del tramo la decide el día con dato que lo cierra
+    vigencias = np.array([d.toordinal() for d, _ in reglas], dtype=np.int64)
+    regla = np.searchsorted(vigencias, inicio + con_dato[1:], side="right") - 1
+    aditiva = np.array([r == "aditiva" for _, r in reglas])[regla]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        por_dia = np.where(aditiva,
+                           (siguientes - previos) / 100 / saltos,
+                           (siguientes / previos) ** (1 / saltos) - 1)
+    tasas[con_dato[0]:con_dato[-1]] = np.repeat(por_dia, saltos)
+    return tasas
+
+def cambio_detectado(inicio, valores, aproximado, ventana=VENTANA):
+    """
+    Primer día en que la serie densa (que empieza el día con ordinal
+    `inicio`) capitaliza en lugar de sumar, buscado a ±ventana días de
+    `aproximado`: el corte con el que la T.N.A. implícita día a día queda
+    más pareja. None si no hay datos alrededor.
+    """
+    valores = np.asarray(valores, dtype="<f8")
+    o = aproximado.toordinal() - inicio
+    a, b = max(o - ventana, 1), min(o + ventana, len(valores) - 1)
+    if b - a < 2:
+        return None
+    v = valores[a - 1:b + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sumando = np.diff(v) / 100 * 365             # T.N.A. si el día suma
+        capitalizando = (v[1:] / v[:-1] - 1) * 365   # T.N.A. si el día capitaliza
+    costos = [np.nansum(np.abs(np.diff(np.r_[sumando[:k], capitalizando[k:]])))
+              for k in range(len(sumando) + 1)]
+    return date.fromordinal(inicio + a + int(np.argmin(costos)))
+
+def verificar(inicio, valores, reglas):
+    """
+    [(configurado, detectado)] de los pasos de aditiva a compuesta de
+    `reglas` que no coinciden con lo que muestran los datos.
+    """
+    distintos = []
+    for (_, previa), (desde, regla) in zip(reglas, reglas[1:]):
+        if (previa, regla) != ("aditiva", "compuesta"):
+            continue
+        detectado = cambio_detectado(inicio, valores, desde)
+        if detectado != desde:
+            distintos.append((desde, detectado))
+    return distintos
+
+class Prefijos:
+    """Sumas y productos acumulados de la tasa diaria de una serie."""
+
+    def __init__(self, nombre, inicio, valores, reglas=None):
+        self.nombre = nombre
+        self.reglas = reglas or REGLAS[nombre]
+        self.inicio = None
+        self.n = 0
+        self._valores = np.empty(0)
+        self._suma = np.empty(0)
+        self._producto = np.empty(0)
+        self.actualizar(inicio, valores)
+
+    def _capacidad(self, n):
+        """Agranda los arreglos al doble cuando no alcanzan (agregar es O(1) amortizado)."""
+        if n <= len(self._valores):
+            return
+        nueva = max(n, 2 * len(self._valores))
+        for nombre in ("_valores", "_suma", "_producto"):
+            viejo = getattr(self, nombre)
+            arreglo = np.full(nueva, np.nan)
+            arreglo[:len(viejo)] = viejo
+            setattr(self, nombre, arreglo)
+
+    def actualizar(self, inicio, valores):
+        """
+        Pone los prefijos al día con la serie (`inicio` date, `valores`
+        densos) y devuelve cuántos días recalculó: sólo los posteriores al
+        último dato anterior al primer día que cambió.
+        """
+        valores = np.asarray(valores, dtype="<f8")
+        if inicio is None or not len(valores):
+            raise RuntimeError(f"{self.nombre}: la serie está vacía.")
+        if self.inicio != inicio.toordinal():
+            self.inicio, self.n, desde = inicio.toordinal(), 0, 0
+        else:
+            n = min(self.n, len(valores))
+            previos = self._valores[:n]
+            iguales = (previos == valores[:n]) | (np.isnan(previos) & np.isnan(valores[:n]))
+            distintos = np.flatnonzero(~iguales)
+            primero = int(distintos[0]) if len(distintos) else n
+            if primero == len(valores) == self.n:
+                return 0
+            con_dato = np.flatnonzero(~np.isnan(valores[:primero]))
+            desde = int(con_dato[-1]) if len(con_dato) else 0
+
+        self._capacidad(len(valores))
+        tasas = tasas_diarias(self.inicio + desde, valores[desde:], self.reglas)
+        if desde == 0:
+            self._suma[0], self._producto[0] = 0.0, 1.0
+        fin = len(valores)
+        self._suma[desde + 1:fin] = self._suma[desde] + np.cumsum(tasas)
+        self._producto[desde + 1:fin] = self._producto[desde] * np.cumprod(1 + tasas)
+        self._valores[desde:fin] = valores[desde:]
+        self._valores[fin:self.n] = np.nan
+        self.n = fin
+        return fin - desde
+
+    @property
+    def fin(self):
+        return date.fromordinal(self.inicio + self.n - 1)
+
+    def _posicion(self, fecha):
+        """Posición de la fecha; después del último dato cuenta el último."""
+        i = fecha.toordinal() - self.inicio
+        if i < 0:
+            raise RuntimeError(f"{self.nombre}: no hay datos en o antes de {fecha.isoformat()}")
+        return min(i, self.n - 1)
+
+    def _posiciones(self, fechas):
+        i = np.asarray(fechas, dtype="datetime64[D]").astype(np.int64) + EPOCA - self.inicio
+        if len(i) and i.min() < 0:
+            raise RuntimeError(f"{self.nombre}: {int((i < 0).sum())} fechas anteriores a "
+                               f"{date.fromordinal(self.inicio).isoformat()}.")
+        return np.minimum(i, self.n - 1)
+
+    def simple(self, desde, hasta):
+        """Suma de las tasas diarias de (desde, hasta] (0.1 = 10 %)."""
+        return float(self._suma[self._posicion(hasta)] - self._suma[self._posicion(desde)])
+
+    def compuesto(self, desde, hasta):
+        """Tasa capitalizada de (desde, hasta]: producto de (1 + t) menos 1."""
+        return float(self._producto[self._posicion(hasta)] / self._producto[self._posicion(desde)] - 1)
+
+    def simple_lote(self, desdes, hastas):
+        return self._suma[self._posiciones(hastas)] - self._suma[self._posiciones(desdes)]
+
+    def compuesto_lote(self, desdes, hastas):
+        return self._producto[self._posiciones(hastas)] / self._producto[self._posiciones(desdes)] - 1
+
+_prefijos = {}
+_lock = threading.Lock()
+
+def obtener(nombre, directorio=None):
+    """Prefijos compartidos de la serie, puestos al día si cambiaron sus archivos."""
+    if nombre not in REGLAS:
+        raise KeyError(f"Serie sin regla de tasas: {nombre!r}")
+    path = almacen.path_json(nombre, directorio)
+    with _lock:
+        previo = _prefijos.get(path)
+        if previo and previo[0] == almacen.firma(path):
+            return previo[1]
+        serie = almacen.abrir_diaria(path)
+        if previo:
+            prefijos = previo[1]
+            prefijos.actualizar(serie.inicio, serie.valores)
+        else:
+            prefijos = Prefijos(nombre, serie.inicio, serie.valores,
+                                 leer_reglas(directorio or almacen.DIR_INDICES)[nombre])
+        if serie.inicio:
+            for desde, detectado in verificar(serie.inicio.toordinal(), serie.valores, prefijos.reglas):
+                print(f"⚠️ {nombre}: {ARCHIVO_REGLAS} dice que capitaliza desde el {desde.isoformat()}, "
+                      f"pero los datos cambian de régimen el "
+                      f"{detectado.isoformat() if detectado else '(sin datos alrededor)'}", file=sys.stderr)
+        _prefijos[path] = (almacen.firma(path), prefijos)
+        return prefijos
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "verificar":
+        distintos = 0
+        for nombre in argv[1:] or list(REGLAS):
+            diaria = almacen.abrir_diaria(almacen.path_json(nombre))
+            cambios = [d for d, _ in REGLAS[nombre][1:]]
+            errores = verificar(diaria.inicio.toordinal(), diaria.valores, REGLAS[nombre]) if diaria.inicio else []
+            distintos += len(errores)
+            for desde, detectado in errores:
+                print(f"❌ {nombre}: configurado {desde.isoformat()}, en los datos "
+                      f"{detectado.isoformat() if detectado else '(sin datos alrededor)'}")
+            if not errores:
+                print(f"✅ {nombre}: " + (", ".join(f"{r} desde {d.isoformat()}" for d, r in REGLAS[nombre][1:])
+                                         if cambios else "compuesta") + " (coincide con los datos)")
+        return 1 if distintos else 0
+    if len(argv) != 3:
+        print(__doc__.split("Uso:")[1].rstrip())
+        return 2
+    nombre, desde, hasta = argv[0], date.fromisoformat(argv[1]), date.fromisoformat(argv[2])
+    p = obtener(nombre)
+    print(f"{nombre} del {desde.isoformat()} al {hasta.isoformat()}:")
+    print(f"  simple:    {p.simple(desde, hasta) * 100:.4f} %")
+    print(f"  compuesto: {p.compuesto(desde, hasta) * 100:.4f} %")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Journal de solo-agregado para las series diarias.
+
+Cada corrida agrega sus puntos nuevos a indices/<serie>.journal, una línea
+JSON por punto, con una sola escritura en modo append seguida de fsync: el
+costo de escribir depende de los puntos nuevos y no del largo de la serie.
+Una línea cortada por un corte de luz (sin salto de línea final o JSON
+inválido) se ignora al leer y agregar() la recorta antes de escribir, para
+no pegarle la entrada siguiente; si igual quedó una línea inválida en el
+medio (de una versión anterior), se saltea y se leen las que siguen. Las
+lecturas combinan la base (.bin/.json) con el journal; compactar() vuelca
+el journal en la base y lo borra.
+"""
+
+import json
+import os
+import time
+
+from finfocus_indices import metricas
+
+COLA = 4096      # bytes del final que se miran para saber si la última línea está entera
+
+def path_journal(path_json):
+    """indices/cer.json → indices/cer.journal"""
+    return os.path.splitext(path_json)[0] + ".journal"
+
+def _valida(linea):
+    if not linea.endswith(b"\n"):
+        return False
+    try:
+        return isinstance(json.loads(linea), dict)
+    except ValueError:
+        return False
+
+def _largo_valido(fd):
+    """Bytes del journal hasta el final de su última línea completa y válida."""
+    tamanio = os.fstat(fd).st_size
+    if not tamanio:
+        return 0
+    cola = os.pread(fd, min(tamanio, COLA), tamanio - min(tamanio, COLA))
+    previo = cola.rfind(b"\n", 0, len(cola) - 1)
+    if (previo >= 0 or len(cola) == tamanio) and _valida(cola[previo + 1:]):
+        return tamanio                      # lo normal: termina en una línea entera
+    largo = fin = 0
+    for linea in os.pread(fd, tamanio, 0).splitlines(keepends=True):
+        largo += len(linea)
+        if _valida(linea):
+            fin = largo
+    return fin
+
+def agregar(path_json, puntos):
+    """
+    Agrega {"YYYY-MM-DD": valor} al journal de forma atómica y durable.
+    Si la última escritura quedó cortada, primero recorta ese resto.
+    """
+    if not puntos:
+        return 0
+    t = int(time.time())
+    lineas = "".join(
+        json.dumps({"fecha": fecha, "valor": valor, "t": t}) + "\n"
+        for fecha, valor in puntos.items()
+    ).encode("utf-8")
+    with metricas.etapa("escritura"):
+        fd = os.open(path_journal(path_json), os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            largo = _largo_valido(fd)
+            if os.fstat(fd).st_size > largo:
+                os.ftruncate(fd, largo)     # descarta una línea cortada
+            os.write(fd, lineas)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    metricas.sumar("bytes_escritos", len(lineas))
+    return len(lineas)
+
+def entradas(path_json):
+    """Lista de entradas válidas del journal, en orden de escritura (saltea las inválidas)."""
+    path = path_journal(path_json)
+    if not os.path.exists(path):
+        return []
+    validas = []
+    with open(path, "rb") as f:
+        for linea in f:
+            if not linea.endswith(b"\n"):
+                continue                    # escritura incompleta
+            try:
+                entrada = json.loads(linea)
+            except ValueError:
+                continue
+            if isinstance(entrada, dict) and "fecha" in entrada and "valor" in entrada:
+                validas.append(entrada)
+    return validas
+
+def leer(path_json):
+    """{"YYYY-MM-DD": valor} del journal; la última escritura de cada día gana."""
+    return {e["fecha"]: e["valor"] for e in entradas(path_json)}
+
+def antiguedad(path_json):
+    """Segundos desde la entrada más vieja del journal (0 si está vacío)."""
+    lista = entradas(path_json)
+    return time.time() - lista[0]["t"] if lista else 0
+
+def vaciar(path_json):
+    try:
+        os.remove(path_journal(path_json))
+    except FileNotFoundError:
+        pass
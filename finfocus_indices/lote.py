@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Actualización de carteras de créditos en una sola llamada.
+
+    from finfocus_indices import lote
+    montos, coeficientes = lote.actualizar(capitales, desdes, hastas, "cer")
+
+Recibe columnas (capitales y fechas como arreglos o listas) en lugar de un
+crédito por vez: todas las fechas se resuelven con una búsqueda vectorizada
+sobre el índice de la serie y las cuentas son operaciones de arreglos. El
+resultado es idéntico, bit a bit, al de llamar para cada crédito a
+
+    capital * series.obtener(indice).coeficiente(desde, hasta)
+"""
+
+import numpy as np
+
+from finfocus_indices import series
+
+def _fechas(valores):
+    """Lista de date/str ISO o arreglo datetime64 → arreglo datetime64[D]."""
+    return np.asarray(valores, dtype="datetime64[D]")
+
+def coeficientes(desdes, hastas, indice, directorio=series.DIR_INDICES):
+    """Coeficiente valor(hasta) / valor(desde) de cada par de fechas."""
+    return coeficientes_de(series.obtener(indice, directorio), desdes, hastas)
+
+def coeficientes_de(serie, desdes, hastas):
+    """Como coeficientes(), sobre una Serie ya abierta."""
+    desdes, hastas = _fechas(desdes), _fechas(hastas)
+    if desdes.shape != hastas.shape:
+        raise RuntimeError("Las columnas de fechas tienen largos distintos.")
+    inicial = serie.valores_hasta(desdes)
+    final = serie.valores_hasta(hastas)
+    faltan = np.isnan(inicial) | np.isnan(final)
+    if faltan.any():
+        i = int(np.flatnonzero(faltan)[0])
+        raise RuntimeError(f"{serie.nombre}: {int(faltan.sum())} créditos sin dato en o antes de sus "
+                           f"fechas (el primero, fila {i}: {desdes[i]} → {hastas[i]}).")
+    return final / inicial
+
+def actualizar(capitales, desdes, hastas, indice, directorio=series.DIR_INDICES):
+    """(montos actualizados, coeficientes) para cada crédito."""
+    capitales = np.asarray(capitales, dtype="<f8")
+    coef = coeficientes(desdes, hastas, indice, directorio)
+    if capitales.shape != coef.shape:
+        raise RuntimeError("La columna de capitales no tiene el largo de las fechas.")
+    return capitales * coef, coef
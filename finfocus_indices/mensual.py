@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Representación común de las series mensuales (ripte, smvm, inflacion, ...).
+
+Las claves "mmm-yy" se parsean una sola vez al cargar y se convierten en un
+índice de mes absoluto, anio * 12 + (mes - 1). La serie queda como el
+índice del primer mes más un arreglo contiguo de float64 con NaN en los
+meses sin dato, así que buscar un mes, el último dato, desplazar la serie
+o cortar un rango son operaciones O(1) sin volver a tocar strings.
+
+Las claves y la regla de siglo están en formato.py (sin NumPy).
+"""
+
+import json
+import os
+
+import numpy as np
+
+from finfocus_indices import metricas
+from finfocus_indices.formato import clave, fecha_de_indice, indice, indice_de_fecha, parsear
+
+class SerieMensual:
+    """Primer mes (índice absoluto) + un float64 por mes (NaN = sin dato)."""
+
+    def __init__(self, inicio, valores, path=None):
+        self.inicio  = inicio
+        self.valores = valores
+        self.path    = path
+        self._ultimo = None
+
+    def __len__(self):
+        return len(self.valores)
+
+    def __contains__(self, i):
+        return self.valor(i) is not None
+
+    @property
+    def fin(self):
+        return self.inicio + len(self.valores) - 1
+
+    def valor(self, i):
+        """Valor del mes `i` (None si está fuera de rango o falta)."""
+        k = i - self.inicio
+        if k < 0 or k >= len(self.valores):
+            return None
+        v = float(self.valores[k])
+        return None if v != v else v
+
+    def posiciones_hasta(self):
+        """posiciones_hasta()[k] = posición del último mes con dato <= k (-1 si no hay)."""
+        if self._ultimo is None:
+            idx = np.where(np.isnan(self.valores), -1, np.arange(len(self.valores)))
+            self._ultimo = np.maximum.accumulate(idx) if len(idx) else idx
+        return self._ultimo
+
+    def ultimo_hasta(self, i):
+        """(índice, valor) del último mes con dato en o antes de `i`, o None."""
+        k = min(i - self.inicio, len(self.valores) - 1)
+        if k < 0:
+            return None
+        k = int(self.posiciones_hasta()[k])
+        if k < 0:
+            return None
+        return self.inicio + k, float(self.valores[k])
+
+    def ultimo(self):
+        """(índice, valor) del último mes con dato, o None si la serie está vacía."""
+        return self.ultimo_hasta(self.fin) if len(self.valores) else None
+
+    def desplazar(self, meses):
+        """La misma serie corrida `meses` meses hacia adelante (vista sin copia)."""
+        return SerieMensual(self.inicio + meses, self.valores)
+
+    def rango(self, desde, hasta):
+        """Vista sin copia de los valores entre los meses desde y hasta (inclusive)."""
+        i = max(desde - self.inicio, 0)
+        j = min(hasta - self.inicio + 1, len(self.valores))
+        return self.valores[i:max(i, j)]
+
+    def a_dict(self):
+        """{"mmm-yy": valor} en orden cronológico, sin los meses NaN."""
+        return {clave(self.inicio + k): v for k, v in enumerate(self.valores.tolist()) if v == v}
+
+def desde_dict(data, path=None):
+    """{"mmm-yy": valor} → SerieMensual (las claves se parsean una vez)."""
+    if not data:
+        return SerieMensual(0, np.empty(0, dtype="<f8"), path)
+    indices = np.fromiter((parsear(k) for k in data), dtype=np.int64, count=len(data))
+    valores = np.fromiter((float(v) for v in data.values()), dtype="<f8", count=len(data))
+    inicio = int(indices.min())
+    arreglo = np.full(int(indices.max()) - inicio + 1, np.nan, dtype="<f8")
+    arreglo[indices - inicio] = valores
+    return SerieMensual(inicio, arreglo, path)
+
+def cargar(path):
+    """Serie mensual de un JSON de indices/ (vacía si el archivo no existe)."""
+    if not os.path.exists(path):
+        return desde_dict({}, path)
+    with metricas.etapa("carga"):
+        with open(path, "r", encoding="utf-8") as f:
+            return desde_dict(json.load(f), path)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Métricas por etapa de cada corrida de un updater.
+
+Con FINFOCUS_METRICAS=<archivo> (o "-" para stderr) cada corrida agrega
+una línea JSON con la duración de cada etapa y los contadores:
+
+  {"ts": ..., "serie": "cer", "ok": true, "duracion_s": 0.21,
+   "etapas": {"descarga": 0.18, "parseo": 0.002, "carga": 0.004, "escritura": 0.01},
+   "contadores": {"bytes_descargados": 3474, "bytes_escritos": 74712,
+                  "puntos_agregados": 1, "cache_304": 1}}
+
+Etapas: descarga, parseo, carga (lectura de JSON/.bin), calculo, escritura.
+Contadores: bytes_descargados, bytes_escritos, puntos_agregados,
+cache_304 (la fuente respondió 304) y cache_hit (la página no cambió desde
+la última vez que la serie la procesó).
+
+Desactivado (el caso normal), etapa() devuelve un contexto vacío
+compartido y sumar() retorna enseguida: el costo es una comparación.
+
+Con FINFOCUS_PERFILAR=<serie> ese updater corre bajo cProfile; el perfil
+queda en perfil_<serie>.prof y las funciones más costosas van a stderr.
+
+    with metricas.etapa("parseo"):
+        ...
+    metricas.sumar("puntos_agregados", len(nuevos))
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+destino  = os.environ.get("FINFOCUS_METRICAS", "")
+perfilar = os.environ.get("FINFOCUS_PERFILAR", "")
+activo   = bool(destino)
+
+_local = threading.local()
+_lock  = threading.Lock()
+
+class _Nulo:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULO = _Nulo()
+
+class Registro:
+    def __init__(self, serie):
+        self.serie = serie
+        self.etapas = {}
+        self.contadores = {}
+        self.abiertas = set()
+
+class _Etapa:
+    """Suma su duración a la etapa; si la misma etapa ya está abierta
+    (cargar_diaria → leer_json) no vuelve a contar el tramo anidado."""
+    __slots__ = ("registro", "nombre", "t0")
+
+    def __init__(self, registro, nombre):
+        self.registro = registro
+        self.nombre = nombre
+        self.t0 = None
+
+    def __enter__(self):
+        if self.nombre not in self.registro.abiertas:
+            self.registro.abiertas.add(self.nombre)
+            self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.t0 is not None:
+            etapas = self.registro.etapas
+            etapas[self.nombre] = etapas.get(self.nombre, 0.0) + time.perf_counter() - self.t0
+            self.registro.abiertas.discard(self.nombre)
+        return False
+
+def configurar(destino_=None, perfilar_=None):
+    """Activa las métricas o el perfil desde código (p. ej. flags de update_all.py)."""
+    global destino, perfilar, activo
+    if destino_ is not None:
+        destino = destino_
+        activo = bool(destino)
+    if perfilar_ is not None:
+        perfilar = perfilar_
+
+def etapa(nombre):
+    """Contexto que suma su duración a la etapa `nombre` de la corrida actual."""
+    if not activo:
+        return _NULO
+    registro = getattr(_local, "registro", None)
+    return _NULO if registro is None else _Etapa(registro, nombre)
+
+def sumar(contador, n=1):
+    if not activo:
+        return
+    registro = getattr(_local, "registro", None)
+    if registro is not None:
+        registro.contadores[contador] = registro.contadores.get(contador, 0) + n
+
+def _emitir(linea):
+    texto = json.dumps(linea, ensure_ascii=False) + "\n"
+    with _lock:
+        if destino == "-":
+            sys.stderr.write(texto)
+        else:
+            with open(destino, "a", encoding="utf-8") as f:
+                f.write(texto)
+
+def _perfilado(serie, fn):
+    # sólo al perfilar: pstats suma ~10 ms al arranque de cada script
+    import cProfile
+    import pstats
+    perfil = cProfile.Profile()
+    try:
+        return perfil.runcall(fn)
+    finally:
+        path = f"perfil_{serie}.prof"
+        perfil.dump_stats(path)
+        sys.stderr.write(f"Perfil de {serie} en {path}\n")
+        pstats.Stats(perfil, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+
+def correr(serie, fn):
+    """Corre fn() (el main() de un updater) registrando sus métricas."""
+    if perfilar == serie:
+        ejecutar = lambda: _perfilado(serie, fn)
+    else:
+        ejecutar = fn
+    if not activo:
+        return ejecutar()
+    registro = Registro(serie)
+    _local.registro = registro
+    t0 = time.perf_counter()
+    ok = False
+    try:
+        resultado = ejecutar()
+        ok = True
+        return resultado
+    finally:
+        _local.registro = None
+        _emitir({
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "serie": serie,
+            "ok": ok,
+            "duracion_s": round(time.perf_counter() - t0, 6),
+            "etapas": {k: round(v, 6) for k, v in registro.etapas.items()},
+            "contadores": registro.contadores,
+        })
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Grafo de dependencias de las series y estado incremental de update_all.py.
+
+Cada nodo es una serie con su updater y sus entradas:
+
+  - fuentes: páginas web que lee (bcra, bna, ripte, smvm). Un nodo con
+    fuentes corre siempre, porque el cambio de la página se detecta con el
+    GET condicional de cache_http y el updater no reescribe nada si no cambió.
+  - series: otros JSON de indices/ de los que se deriva (ripte → ripte1).
+    Estos nodos esperan a que terminen sus entradas y corren sólo si el
+    hash de alguna entrada, o el de su propia salida, difiere del
+    registrado en la última corrida exitosa.
+
+El estado (hash de entradas y salida de cada nodo) se guarda en
+ESTADO, junto a la caché HTTP. Las ramas independientes corren en paralelo
+(ver update_all.correr_todas).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import NamedTuple
+
+from finfocus_indices import almacen, cache_http, journal
+
+ESTADO = os.environ.get("FINFOCUS_PIPELINE",
+                        os.path.join(os.path.dirname(cache_http.DIR_CACHE), "pipeline.json"))
+
+class Nodo(NamedTuple):
+    modulo: str
+    fuentes: tuple = ()
+    series: tuple = ()
+
+NODOS = {
+    "activa":             Nodo("update_activa", fuentes=("bna",)),
+    "pasiva":             Nodo("update_pasiva", fuentes=("bcra",)),
+    "cer":                Nodo("update_cer", fuentes=("bcra",)),
+    "inflacion":          Nodo("update_inflacion", fuentes=("bcra",)),
+    "inflacion_esperada": Nodo("update_inflacion_esperada", fuentes=("bcra",)),
+    "ripte":              Nodo("update_ripte", fuentes=("ripte",)),
+    "ripte1":             Nodo("update_ripte1", series=("ripte",)),
+    "ripte2":             Nodo("update_ripte2", series=("ripte",)),
+    "smvm":               Nodo("update_smvm", fuentes=("smvm",)),
+}
+
+_lock = threading.Lock()
+
+def hash_serie(serie, directorio=None):
+    """Hash del contenido publicado de una serie (JSON + journal pendiente)."""
+    h = hashlib.blake2b(digest_size=16)
+    path = almacen.path_json(serie, directorio)
+    for p in (path, journal.path_journal(path)):
+        try:
+            with open(p, "rb") as f:
+                h.update(f.read())
+        except FileNotFoundError:
+            h.update(b"\0")
+    return h.hexdigest()
+
+def depende_de(serie):
+    """Series de las que depende `serie` (las que tienen que terminar antes)."""
+    return NODOS[serie].series
+
+def leer_estado(path=ESTADO):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def _entradas(serie):
+    return {s: hash_serie(s) for s in NODOS[serie].series}
+
+def pendiente(serie, estado):
+    """
+    None si el nodo tiene que correr, o el motivo para saltearlo: sus
+    entradas y su salida son las mismas que en la última corrida exitosa.
+    """
+    nodo = NODOS[serie]
+    if nodo.fuentes or cache_http.refrescar:
+        return None
+    previo = estado.get(serie)
+    if not previo:
+        return None
+    if previo.get("entradas") != _entradas(serie) or previo.get("salida") != hash_serie(serie):
+        return None
+    return f"sin cambios en {', '.join(nodo.series)}"
+
+def registrar(serie, estado, path=ESTADO):
+    """Guarda los hashes del nodo después de una corrida exitosa."""
+    with _lock:
+        estado[serie] = {"entradas": _entradas(serie), "salida": hash_serie(serie)}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        almacen.guardar_json(path, estado)
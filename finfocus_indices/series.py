@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API de lectura de los índices de indices/.
+
+    from finfocus_indices import series
+    cer = series.obtener("cer")
+    cer.valor(date(2025, 7, 1))           # valor exacto del día (o None)
+    cer.ultimo_hasta(date(2025, 7, 1))    # (fecha, valor) del último dato <= fecha
+    fechas, valores = cer.rango(desde, hasta)
+
+Cada Serie carga su archivo la primera vez que se consulta y arma el
+índice de fechas una sola vez; obtener() guarda las últimas MAX_SERIES
+series cargadas en un LRU por proceso (invalidar() lo vacía).
+
+Las diarias se leen del almacén binario (un float64 por día corrido) y las
+mensuales de finfocus_indices.mensual (un float64 por mes): en ambos casos
+la consulta es un acceso por offset y rango() devuelve vistas sin copia,
+con NaN donde no hay dato. Las mensuales usan el primer día del mes como
+fecha; ripte1 y ripte2 son vistas de ripte (finfocus_indices.derivadas).
+"""
+
+import os
+import threading
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from finfocus_indices import almacen, derivadas, mensual
+from finfocus_indices.formato import DIR_INDICES, MENSUALES, RAIZ
+
+MAX_SERIES  = 16
+
+DIARIAS   = almacen.DIARIAS
+
+EPOCA     = date(1970, 1, 1).toordinal()   # datetime64[D] → ordinal
+EPOCA_MES = 1970 * 12                      # datetime64[M] → índice de mes
+
+class Serie:
+    """Serie de un archivo de indices/, cargada en la primera consulta."""
+
+    def __init__(self, nombre, directorio=DIR_INDICES):
+        if nombre not in DIARIAS and nombre not in MENSUALES:
+            raise KeyError(f"Serie desconocida: {nombre!r}")
+        self.nombre     = nombre
+        self.path       = os.path.join(directorio, f"{nombre}.json")
+        self.frecuencia = "diaria" if nombre in DIARIAS else "mensual"
+        self._lock      = threading.Lock()
+        self._cargada   = False
+
+    def _cargar(self):
+        with self._lock:
+            if self._cargada:
+                return
+            if self.frecuencia == "diaria":
+                diaria = almacen.abrir_diaria(self.path)
+                self._inicio  = diaria.inicio.toordinal() if diaria.inicio else 0
+                self._valores = diaria.valores
+            else:
+                if self.nombre in derivadas.DERIVADAS:
+                    serie = derivadas.calcular(self.nombre, os.path.dirname(self.path))
+                else:
+                    serie = mensual.cargar(self.path)
+                self._inicio  = serie.inicio
+                self._valores = serie.valores
+            # _ultimo[i] = posición del último dato <= i (-1 si no hay)
+            idx = np.where(np.isnan(self._valores), -1, np.arange(len(self._valores)))
+            self._ultimo = np.maximum.accumulate(idx) if len(idx) else idx
+            self._cargada = True
+
+    def _unidad(self, fecha):
+        """Fecha → ordinal del día o índice del mes, según la frecuencia."""
+        if self.frecuencia == "mensual":
+            return mensual.indice_de_fecha(fecha)
+        return fecha.toordinal()
+
+    def _fecha(self, unidad):
+        if self.frecuencia == "mensual":
+            return mensual.fecha_de_indice(unidad)
+        return date.fromordinal(unidad)
+
+    def _unidades(self, fechas):
+        """Versión vectorizada de _unidad() para un arreglo datetime64."""
+        if self.frecuencia == "mensual":
+            return fechas.astype("datetime64[M]").astype(np.int64) + EPOCA_MES
+        return fechas.astype("datetime64[D]").astype(np.int64) + EPOCA
+
+    def __len__(self):
+        self._cargar()
+        return int(np.count_nonzero(~np.isnan(self._valores)))
+
+    def valor(self, fecha):
+        """Valor exacto de la fecha (del mes, si es mensual) o None."""
+        self._cargar()
+        i = self._unidad(fecha) - self._inicio
+        if 0 <= i < len(self._valores):
+            v = float(self._valores[i])
+            return None if v != v else v
+        return None
+
+    def ultimo_hasta(self, fecha):
+        """(fecha, valor) del último dato en o antes de `fecha`, o None."""
+        self._cargar()
+        i = min(self._unidad(fecha) - self._inicio, len(self._valores) - 1)
+        if i < 0:
+            return None
+        i = int(self._ultimo[i])
+        if i < 0:
+            return None
+        return self._fecha(self._inicio + i), float(self._valores[i])
+
+    def rango(self, desde, hasta):
+        """
+        (fechas, valores) entre desde y hasta inclusive, como arreglos de
+        NumPy (datetime64[D], float64). Los valores son vistas sin copia.
+        """
+        self._cargar()
+        i = max(self._unidad(desde) - self._inicio, 0)
+        j = max(min(self._unidad(hasta) - self._inicio + 1, len(self._valores)), i)
+        unidades = self._inicio + np.arange(i, j)
+        if self.frecuencia == "mensual":
+            fechas = (unidades - EPOCA_MES).astype("datetime64[M]").astype("datetime64[D]")
+        else:
+            fechas = (unidades - EPOCA).astype("datetime64[D]")
+        return fechas, self._valores[i:j]
+
+    def coeficiente(self, desde, hasta):
+        """
+        valor(hasta) / valor(desde), tomando en cada punta el último dato en
+        o antes de la fecha.
+        """
+        a, b = self.ultimo_hasta(desde), self.ultimo_hasta(hasta)
+        if a is None or b is None:
+            raise RuntimeError(f"{self.nombre}: no hay datos en o antes de {min(desde, hasta).isoformat()}")
+        return b[1] / a[1]
+
+    def valores_hasta(self, fechas):
+        """
+        Versión vectorizada de ultimo_hasta(): para cada fecha (arreglo
+        datetime64[D]) el valor del último dato en o antes de ella, o NaN.
+        """
+        self._cargar()
+        u = self._unidades(np.asarray(fechas, dtype="datetime64[D]"))
+        if not len(self._valores):
+            return np.full(u.shape, np.nan)
+        i = np.minimum(u - self._inicio, len(self._valores) - 1)
+        pos = np.where(i >= 0, self._ultimo[np.maximum(i, 0)], -1)
+        return np.where(pos >= 0, self._valores[np.maximum(pos, 0)], np.nan)
+
+    def valores_en(self, fechas):
+        """
+        Versión vectorizada de valor(): el dato exacto de cada fecha (del
+        mes, si es mensual), o NaN.
+        """
+        self._cargar()
+        i = self._unidades(np.asarray(fechas, dtype="datetime64[D]")) - self._inicio
+        if not len(self._valores):
+            return np.full(i.shape, np.nan)
+        dentro = (i >= 0) & (i < len(self._valores))
+        return np.where(dentro, self._valores[np.clip(i, 0, len(self._valores) - 1)], np.nan)
+
+    @property
+    def primera(self):
+        """Fecha del primer dato."""
+        fechas, _ = self.rango(date.min, date.max)
+        return fechas[0].item() if len(fechas) else None
+
+    @property
+    def ultima(self):
+        """(fecha, valor) del último dato."""
+        return self.ultimo_hasta(date.max)
+
+@lru_cache(maxsize=MAX_SERIES)
+def obtener(nombre, directorio=DIR_INDICES):
+    """Serie `nombre`, compartida por todo el proceso (LRU de MAX_SERIES)."""
+    return Serie(nombre, directorio)
+
+def invalidar():
+    """Olvida las series cargadas (p. ej. después de actualizar los archivos)."""
+    obtener.cache_clear()
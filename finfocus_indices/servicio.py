@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servicio HTTP local, de sólo lectura, sobre indices/ y accidente/.
+
+Para las calculadoras internas que consultan los índices muchas veces
+por segundo: en lugar de que cada una lea y parsee los JSON (o los baje
+de GitHub), el servicio tiene todas las series y los topes cargados en
+memoria (series.Serie, topes.Topes) y contesta cada consulta con un
+acceso por offset o una bisección.
+
+  GET  /series                                   series con su primer y último dato
+  GET  /valor/<serie>?fecha=2025-07-01           último dato en o antes de la fecha
+  GET  /valor/<serie>?fecha=2025-07-01&exacto=1  sólo el dato de ese día / mes
+  GET  /rango/<serie>?desde=...&hasta=...        fechas y valores (null = sin dato)
+  GET  /coeficiente/<serie>?desde=...&hasta=...
+  GET  /tope/<articulo>?fecha=...                monto y resolución vigentes
+  POST /lote/valores        {"serie": "cer", "fechas": [...]}
+  POST /lote/coeficientes   {"serie": "cer", "desdes": [...], "hastas": [...], "capitales": [...]}
+  POST /lote/topes          {"fechas": [...]}
+
+Las respuestas GET llevan ETag (la versión de los datos cargados) y
+contestan 304 a If-None-Match. Todas las estructuras de una versión
+forman una Instantanea inmutable: cada INTERVALO segundos se revisan
+tamaño y mtime de los archivos y, si cambiaron, se arma la nueva en un
+hilo y se reemplaza la referencia. Las consultas en curso terminan con
+la anterior, así que recargar no corta ninguna. Si la nueva no carga
+(un archivo a medio escribir), se sigue con la anterior y se reintenta.
+
+Uso:
+  python -m finfocus_indices.servicio [--puerto 8765] [--host 127.0.0.1]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import date
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from finfocus_indices import lote, series, topes
+
+PUERTO       = 8765
+INTERVALO    = 1.0
+MAX_CUERPO   = 16 * 1024 * 1024
+MAX_LOTE     = 1_000_000
+MAX_CACHE    = 4096
+EXTENSIONES  = (".json", ".bin", ".journal")
+
+class ErrorHTTP(Exception):
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+MOTIVOS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large", 422: "Unprocessable Entity",
+           500: "Internal Server Error"}
+
+def firma(directorios):
+    """(nombre, tamaño, mtime) de cada archivo de datos: cambia si cambian los datos."""
+    archivos = []
+    for directorio in directorios:
+        with os.scandir(directorio) as it:
+            for e in it:
+                if e.name.endswith(EXTENSIONES):
+                    st = e.stat()
+                    archivos.append((e.path, st.st_size, st.st_mtime_ns))
+    return tuple(sorted(archivos))
+
+def _fecha(params, nombre):
+    try:
+        return date.fromisoformat(params[nombre][0])
+    except KeyError:
+        raise ErrorHTTP(400, f"Falta el parámetro {nombre!r}.")
+    except ValueError:
+        raise ErrorHTTP(400, f"{nombre}={params[nombre][0]!r} no es una fecha AAAA-MM-DD.")
+
+def _fechas(cuerpo, nombre):
+    if nombre not in cuerpo or not isinstance(cuerpo[nombre], list):
+        raise ErrorHTTP(400, f"Falta la lista {nombre!r}.")
+    if len(cuerpo[nombre]) > MAX_LOTE:
+        raise ErrorHTTP(413, f"{nombre}: más de {MAX_LOTE} elementos.")
+    try:
+        return np.array(cuerpo[nombre], dtype="datetime64[D]")
+    except ValueError as e:
+        raise ErrorHTTP(400, f"{nombre}: {e}")
+
+def _numeros(cuerpo, nombre):
+    if not isinstance(cuerpo[nombre], list):
+        raise ErrorHTTP(400, f"{nombre} debe ser una lista de números.")
+    if len(cuerpo[nombre]) > MAX_LOTE:
+        raise ErrorHTTP(413, f"{nombre}: más de {MAX_LOTE} elementos.")
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in cuerpo[nombre]):
+        raise ErrorHTTP(400, f"{nombre}: todos los elementos deben ser números.")
+    return np.array(cuerpo[nombre], dtype="<f8")
+
+def _texto(cuerpo, nombre):
+    if not isinstance(cuerpo.get(nombre), str):
+        raise ErrorHTTP(400, f"Falta el texto {nombre!r}.")
+    return cuerpo[nombre]
+
+def _lista(valores):
+    """Arreglo float64 → lista JSON con null en lugar de NaN."""
+    return [None if v != v else v for v in valores.tolist()]
+
+class Instantanea:
+    """Series y topes de una versión de los archivos, cargados por completo."""
+
+    def __init__(self, dir_indices=series.DIR_INDICES, dir_accidente=topes.DIR_ACCIDENTE):
+        self.directorios = (dir_indices, dir_accidente)
+        self.firma = firma(self.directorios)
+        self.series = {}
+        for nombre in series.DIARIAS + series.MENSUALES:
+            serie = series.Serie(nombre, dir_indices)
+            serie.ultima                       # carga el archivo y arma el índice
+            self.series[nombre] = serie
+        self.topes = topes.Topes({a: topes.leer_tabla(os.path.join(dir_accidente, f"{a}.json"))
+                                  for a in topes.ARTICULOS})
+        self.version = hashlib.blake2b(repr(self.firma).encode(), digest_size=8).hexdigest()
+        self.etag = f'"{self.version}"'
+        self.cache = {}
+
+    def serie(self, nombre):
+        if nombre not in self.series:
+            raise ErrorHTTP(404, f"Serie desconocida: {nombre!r}")
+        return self.series[nombre]
+
+    # GET: cada uno devuelve el objeto a serializar
+
+    def get_series(self, _, params):
+        salida = {}
+        for nombre, serie in self.series.items():
+            ultima = serie.ultima
+            primera = serie.primera
+            salida[nombre] = {
+                "frecuencia": serie.frecuencia,
+                "primera": primera.isoformat() if primera else None,
+                "ultima": ultima[0].isoformat() if ultima else None,
+                "ultimo_valor": ultima[1] if ultima else None,
+            }
+        return {"version": self.version, "series": salida}
+
+    def get_valor(self, nombre, params):
+        serie, fecha = self.serie(nombre), _fecha(params, "fecha")
+        if params.get("exacto", ["0"])[0] not in ("", "0"):
+            valor = serie.valor(fecha)
+            return {"serie": nombre, "fecha": fecha.isoformat(), "valor": valor,
+                    "fecha_dato": fecha.isoformat() if valor is not None else None}
+        dato = serie.ultimo_hasta(fecha)
+        return {"serie": nombre, "fecha": fecha.isoformat(),
+                "valor": dato[1] if dato else None,
+                "fecha_dato": dato[0].isoformat() if dato else None}
+
+    def get_rango(self, nombre, params):
+        serie = self.serie(nombre)
+        fechas, valores = serie.rango(_fecha(params, "desde"), _fecha(params, "hasta"))
+        return {"serie": nombre, "fechas": np.datetime_as_string(fechas).tolist(),
+                "valores": _lista(valores)}
+
+    def get_coeficiente(self, nombre, params):
+        serie = self.serie(nombre)
+        desde, hasta = _fecha(params, "desde"), _fecha(params, "hasta")
+        try:
+            coef = serie.coeficiente(desde, hasta)
+        except RuntimeError as e:
+            raise ErrorHTTP(422, str(e))
+        return {"serie": nombre, "desde": desde.isoformat(), "hasta": hasta.isoformat(),
+                "coeficiente": coef}
+
+    def get_tope(self, articulo, params):
+        fecha = _fecha(params, "fecha")
+        try:
+            monto = self.topes.monto(articulo, fecha)
+        except KeyError as e:
+            raise ErrorHTTP(404, e.args[0])
+        return {"articulo": articulo, "fecha": fecha.isoformat(), "monto": monto,
+                "resolucion": self.topes.resolucion(articulo, fecha)}
+
+    # POST de lotes
+
+    def post_valores(self, cuerpo):
+        serie = self.serie(_texto(cuerpo, "serie"))
+        return {"serie": serie.nombre, "valores": _lista(serie.valores_hasta(_fechas(cuerpo, "fechas")))}
+
+    def post_coeficientes(self, cuerpo):
+        serie = self.serie(_texto(cuerpo, "serie"))
+        try:
+            coef = lote.coeficientes_de(serie, _fechas(cuerpo, "desdes"), _fechas(cuerpo, "hastas"))
+        except RuntimeError as e:
+            raise ErrorHTTP(422, str(e))
+        salida = {"serie": serie.nombre, "coeficientes": coef.tolist()}
+        if "capitales" in cuerpo:
+            capitales = _numeros(cuerpo, "capitales")
+            if capitales.shape != coef.shape:
+                raise ErrorHTTP(400, "La lista de capitales no tiene el largo de las fechas.")
+            salida["montos"] = (capitales * coef).tolist()
+        return salida
+
+    def post_topes(self, cuerpo):
+        montos = self.topes.montos_lote(_fechas(cuerpo, "fechas"))
+        return {"montos": {a: _lista(m) for a, m in montos.items()}}
+
+    RUTAS_GET = {
+        "series": get_series, "valor": get_valor, "rango": get_rango,
+        "coeficiente": get_coeficiente, "tope": get_tope,
+    }
+    RUTAS_POST = {
+        "valores": post_valores, "coeficientes": post_coeficientes, "topes": post_topes,
+    }
+
+    def get(self, objetivo):
+        """Cuerpo JSON (bytes) de un GET; se guarda por URL mientras dure la versión."""
+        contenido = self.cache.get(objetivo)
+        if contenido is None:
+            url = urlsplit(objetivo)
+            partes = url.path.strip("/").split("/")
+            if partes[0] not in self.RUTAS_GET or len(partes) > 2:
+                raise ErrorHTTP(404, f"Ruta desconocida: {url.path}")
+            manejador = self.RUTAS_GET[partes[0]]
+            resultado = manejador(self, partes[1] if len(partes) > 1 else None, parse_qs(url.query))
+            contenido = json.dumps(resultado, ensure_ascii=False).encode("utf-8")
+            if len(self.cache) >= MAX_CACHE:
+                self.cache.clear()
+            self.cache[objetivo] = contenido
+        return contenido
+
+    def post(self, objetivo, cuerpo):
+        partes = urlsplit(objetivo).path.strip("/").split("/")
+        if len(partes) != 2 or partes[0] != "lote" or partes[1] not in self.RUTAS_POST:
+            raise ErrorHTTP(404, f"Ruta desconocida: {objetivo}")
+        try:
+            cuerpo = json.loads(cuerpo)
+        except ValueError:
+            raise ErrorHTTP(400, "El cuerpo no es JSON válido.")
+        if not isinstance(cuerpo, dict):
+            raise ErrorHTTP(400, "El cuerpo debe ser un objeto JSON.")
+        resultado = self.RUTAS_POST[partes[1]](self, cuerpo)
+        return json.dumps(resultado, ensure_ascii=False).encode("utf-8")
+
+class Servicio:
+    def __init__(self, dir_indices=series.DIR_INDICES, dir_accidente=topes.DIR_ACCIDENTE,
+                 intervalo=INTERVALO):
+        self.dir_indices = dir_indices
+        self.dir_accidente = dir_accidente
+        self.intervalo = intervalo
+        self.actual = Instantanea(dir_indices, dir_accidente)
+        self.recargas = 0
+
+    async def vigilar(self):
+        """Cambia de Instantanea cuando cambian los archivos."""
+        while True:
+            await asyncio.sleep(self.intervalo)
+            try:
+                if firma(self.actual.directorios) == self.actual.firma:
+                    continue
+                nueva = await asyncio.to_thread(Instantanea, self.dir_indices, self.dir_accidente)
+            except Exception as e:                    # a medio escribir: reintentar
+                print(f"⚠️ no pude recargar: {type(e).__name__}: {e}", file=sys.stderr)
+                continue
+            self.actual = nueva
+            self.recargas += 1
+            print(f"Datos recargados (versión {nueva.version})", file=sys.stderr)
+
+    def responder(self, metodo, objetivo, headers, cuerpo):
+        """(estado, headers extra, contenido) de una consulta."""
+        instantanea = self.actual                      # la misma para toda la consulta
+        try:
+            if metodo in ("GET", "HEAD"):
+                if headers.get("if-none-match") == instantanea.etag:
+                    return 304, {"ETag": instantanea.etag}, b""
+                return 200, {"ETag": instantanea.etag}, instantanea.get(objetivo)
+            if metodo == "POST":
+                return 200, {}, instantanea.post(objetivo, cuerpo)
+            raise ErrorHTTP(405, f"Método no admitido: {metodo}")
+        except ErrorHTTP as e:
+            return e.estado, {}, json.dumps({"error": str(e)}, ensure_ascii=False).encode("utf-8")
+        except Exception as e:
+            return 500, {}, json.dumps({"error": f"{type(e).__name__}: {e}"}).encode("utf-8")
+
+    async def atender(self, reader, writer):
+        """Una conexión HTTP/1.1 con keep-alive: consultas hasta que el cliente cierre."""
+        try:
+            while True:
+                try:
+                    cabecera = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                linea, *resto = cabecera.decode("latin-1").split("\r\n")
+                try:
+                    metodo, objetivo, version = linea.split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for h in resto:
+                    k, _, v = h.partition(":")
+                    if v:
+                        headers[k.strip().lower()] = v.strip()
+                largo = headers.get("content-length", "0")
+                # sólo dígitos: int() aceptaría "-1", "+5" o "1_0"
+                largo = int(largo) if largo.isascii() and largo.isdigit() else None
+                if largo is None:
+                    estado, extra = 400, {}
+                    contenido = json.dumps({"error": "Content-Length inválido"}, ensure_ascii=False).encode("utf-8")
+                    seguir = False
+                elif largo > MAX_CUERPO:
+                    estado, extra, contenido = 413, {}, b'{"error": "cuerpo demasiado grande"}'
+                    seguir = False
+                else:
+                    cuerpo = await reader.readexactly(largo) if largo else b""
+                    estado, extra, contenido = self.responder(metodo, objetivo, headers, cuerpo)
+                    seguir = (version == "HTTP/1.1" and headers.get("connection", "").lower() != "close")
+                lineas = [f"HTTP/1.1 {estado} {MOTIVOS.get(estado, '')}",
+                          "Content-Type: application/json; charset=utf-8",
+                          f"Content-Length: {len(contenido)}"]
+                lineas += [f"{k}: {v}" for k, v in extra.items()]
+                if not seguir:
+                    lineas.append("Connection: close")
+                writer.write(("\r\n".join(lineas) + "\r\n\r\n").encode("latin-1"))
+                if metodo != "HEAD":
+                    writer.write(contenido)
+                await writer.drain()
+                if not seguir:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def servir(self, host="127.0.0.1", puerto=PUERTO, listo=None):
+        """Atiende hasta que se cancele la tarea. `listo(puerto)` avisa cuando escucha."""
+        servidor = await asyncio.start_server(self.atender, host, puerto)
+        vigilancia = asyncio.create_task(self.vigilar())
+        if listo:
+            listo(servidor.sockets[0].getsockname()[1])
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            vigilancia.cancel()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP local de consulta de índices.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=PUERTO)
+    parser.add_argument("--indices", default=series.DIR_INDICES, help="directorio de las series")
+    parser.add_argument("--accidente", default=topes.DIR_ACCIDENTE, help="directorio de los topes")
+    parser.add_argument("--intervalo", type=float, default=INTERVALO,
+                        help="segundos entre revisiones de los archivos")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    servicio = Servicio(args.indices, args.accidente, args.intervalo)
+    print(f"Datos cargados en {time.perf_counter() - t0:.2f} s (versión {servicio.actual.version})")
+    try:
+        asyncio.run(servicio.servir(args.host, args.puerto,
+                                    lambda p: print(f"Escuchando en http://{args.host}:{p}/", flush=True)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
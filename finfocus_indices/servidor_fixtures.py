@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor HTTP local que sirve las páginas grabadas en fixtures/paginas/
+como si fueran las fuentes reales.
+
+La ruta pedida es /<host>/<path>, p. ej.
+  /www.bcra.gob.ar/PublicacionesEstadisticas/Principales_variables.asp
+se sirve desde fixtures/paginas/www.bcra.gob.ar/PublicacionesEstadisticas/...
+"""
+
+import os
+import sys
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from finfocus_indices import descargas
+
+DIR_PAGINAS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "fixtures", "paginas")
+HOSTS = ["www.bcra.gob.ar", "www.bna.com.ar", "www.argentina.gob.ar"]
+
+class _Handler(SimpleHTTPRequestHandler):
+    # Las páginas no tienen extensión .html: forzamos el tipo
+    def guess_type(self, path):
+        return "text/html; charset=utf-8"
+
+    def log_message(self, formato, *args):
+        pass
+
+def iniciar(directorio=DIR_PAGINAS, puerto=0):
+    """
+    Levanta el servidor en un hilo y redirige los hosts reales hacia él.
+    Devuelve el servidor (llamar a .shutdown() al terminar).
+    """
+    handler = partial(_Handler, directory=directorio)
+    servidor = ThreadingHTTPServer(("127.0.0.1", puerto), handler)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{servidor.server_address[1]}"
+    for host in HOSTS:
+        descargas.redirigir(f"https://{host}", f"{base}/{host}")
+    return servidor
+
+if __name__ == "__main__":
+    puerto = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    handler = partial(_Handler, directory=DIR_PAGINAS)
+    print(f"Sirviendo {DIR_PAGINAS} en http://127.0.0.1:{puerto}")
+    ThreadingHTTPServer(("127.0.0.1", puerto), handler).serve_forever()
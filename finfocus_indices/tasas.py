@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de cronogramas de T.N.A. para las series diarias capitalizadas.
+
+Un cronograma es una lista de (fecha de vigencia, T.N.A. en %): cada tasa
+rige desde su fecha hasta la siguiente. tasas_diarias() arma de una vez el
+eje de días y la tasa de cada día (searchsorted sobre las vigencias) y
+componer() capitaliza:
+
+  - decimales=None: producto acumulado vectorizado, sin redondeo.
+  - decimales=n: reproduce exactamente la regla de update_activa.py,
+    round(previo * (1 + tasa_diaria), n) día por día. Redondear en cada paso
+    hace de la serie una recurrencia no lineal que ningún cumprod reproduce
+    bit a bit, así que ese tramo queda como un recorrido único sobre los
+    factores ya calculados en NumPy (floats nativos, sin dicts ni fechas):
+    25 años se regeneran en pocos milisegundos.
+
+tasas_implicitas() y cronograma_implicito() hacen el camino inverso y
+permiten contrastar una serie guardada (p. ej. pasiva) con el cronograma
+que la explica:
+
+  python -m finfocus_indices.tasas verificar pasiva --decimales 4
+  python -m finfocus_indices.tasas cronograma activa --desde 2025-07-01
+"""
+
+import argparse
+import json
+from datetime import date, timedelta
+
+import numpy as np
+
+from finfocus_indices import almacen
+
+DIAS_ANIO = 365
+
+def _ordinales(cronograma):
+    vigencias = np.array([f.toordinal() for f, _ in cronograma], dtype=np.int64)
+    if len(vigencias) > 1 and np.any(np.diff(vigencias) <= 0):
+        raise RuntimeError("El cronograma de tasas tiene vigencias desordenadas o repetidas.")
+    tnas = np.array([tna for _, tna in cronograma], dtype="<f8")
+    return vigencias, tnas
+
+def tasas_diarias(cronograma, desde, hasta, base=DIAS_ANIO):
+    """Tasa diaria (tna / 100 / base) de cada día entre desde y hasta inclusive."""
+    if not cronograma:
+        raise RuntimeError("El cronograma de tasas está vacío.")
+    vigencias, tnas = _ordinales(cronograma)
+    dias = np.arange(desde.toordinal(), hasta.toordinal() + 1, dtype=np.int64)
+    i = np.searchsorted(vigencias, dias, side="right") - 1
+    if len(i) and i[0] < 0:
+        raise RuntimeError(f"No hay tasa vigente el {desde.isoformat()} "
+                           f"(el cronograma empieza el {cronograma[0][0].isoformat()}).")
+    return (tnas[i] / 100) / base
+
+def componer(valor_inicial, tasas, decimales=None):
+    """Valores de cada día partiendo de `valor_inicial` (el del día anterior)."""
+    factores = 1 + np.asarray(tasas, dtype="<f8")
+    if decimales is None:
+        return valor_inicial * np.cumprod(factores)
+    salida = []
+    previo = float(valor_inicial)
+    for f in factores.tolist():
+        previo = round(previo * f, decimales)
+        salida.append(previo)
+    return np.array(salida, dtype="<f8")
+
+def regenerar(valor_previo, cronograma, desde, hasta, decimales=6, base=DIAS_ANIO):
+    """{"YYYY-MM-DD": valor} desde `desde` hasta `hasta` según el cronograma."""
+    if desde > hasta:
+        return {}
+    valores = componer(valor_previo, tasas_diarias(cronograma, desde, hasta, base), decimales)
+    dias = np.datetime64(desde, "D") + np.arange(len(valores))
+    return dict(zip(np.datetime_as_string(dias).tolist(), valores.tolist()))
+
+def regenerar_serie(data, cronograma, desde, hasta, decimales=6, base=DIAS_ANIO):
+    """
+    Como regenerar(), tomando como punto de partida el valor guardado en
+    `data` para el día anterior a `desde`.
+    """
+    previo = (desde - timedelta(days=1)).isoformat()
+    if previo not in data:
+        raise RuntimeError(f"Falta el valor del {previo}: no hay desde dónde capitalizar "
+                           f"(ver python -m finfocus_indices.huecos).")
+    return regenerar(float(data[previo]), cronograma, desde, hasta, decimales, base)
+
+def tasas_implicitas(valores):
+    """
+    Tasa diaria implícita entre cada día y el anterior. En los días sin
+    dato se reparte en partes geométricas iguales la variación entre los
+    dos días con dato que los rodean.
+    """
+    valores = np.asarray(valores, dtype="<f8")
+    con_dato = np.flatnonzero(~np.isnan(valores))
+    tasas = np.full(max(len(valores) - 1, 0), np.nan)
+    if len(con_dato) < 2:
+        return tasas
+    saltos = np.diff(con_dato)
+    por_dia = (valores[con_dato[1:]] / valores[con_dato[:-1]]) ** (1 / saltos) - 1
+    tasas[con_dato[0]:con_dato[-1]] = np.repeat(por_dia, saltos)
+    return tasas
+
+def cronograma_implicito(inicio, valores, decimales_tna=2, base=DIAS_ANIO):
+    """
+    Cronograma [(fecha, tna)] que explica la serie: la T.N.A. implícita de
+    cada día, redondeada a `decimales_tna`, comprimida en sus cambios.
+    """
+    tnas = np.round(tasas_implicitas(valores) * 100 * base, decimales_tna)
+    validas = ~np.isnan(tnas)
+    dias = np.arange(1, len(valores))[validas]
+    tnas = tnas[validas]
+    if not len(tnas):
+        return []
+    cambios = np.flatnonzero(np.r_[True, tnas[1:] != tnas[:-1]])
+    o = inicio.toordinal()
+    return [(date.fromordinal(o + int(dias[c])), float(tnas[c])) for c in cambios]
+
+def verificar(inicio, valores, cronograma, decimales=None, base=DIAS_ANIO):
+    """
+    Regenera la serie desde su primer valor con `cronograma` y la compara
+    con la guardada. Devuelve (desvío máximo, fecha del desvío máximo).
+    """
+    valores = np.asarray(valores, dtype="<f8")
+    if len(valores) < 2:
+        return 0.0, None
+    desde = inicio + timedelta(days=1)
+    hasta = date.fromordinal(inicio.toordinal() + len(valores) - 1)
+    tasas = tasas_diarias(cronograma, desde, hasta, base)
+    # los huecos de la serie no interrumpen la cadena: se capitaliza igual
+    regenerada = componer(valores[0], tasas, decimales)
+    desvio = np.abs(regenerada - valores[1:])
+    if np.all(np.isnan(desvio)):
+        return 0.0, None
+    i = int(np.nanargmax(desvio))
+    return float(desvio[i]), date.fromordinal(desde.toordinal() + i)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cronogramas de T.N.A. de las series diarias.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    p = sub.add_parser("cronograma", help="cronograma implícito de una serie")
+    p.add_argument("serie", choices=almacen.DIARIAS)
+    p.add_argument("--desde", type=date.fromisoformat)
+    p.add_argument("--decimales-tna", type=int, default=2)
+    p = sub.add_parser("verificar", help="regenera la serie con su cronograma implícito")
+    p.add_argument("serie", choices=almacen.DIARIAS)
+    p.add_argument("--decimales-tna", type=int, default=2)
+    p.add_argument("--decimales", type=int, help="redondeo por paso (por defecto ninguno)")
+    args = parser.parse_args(argv)
+
+    diaria = almacen.abrir_diaria(almacen.path_json(args.serie))
+    cronograma = cronograma_implicito(diaria.inicio, diaria.valores, args.decimales_tna)
+    if args.comando == "cronograma":
+        desde = args.desde or date.min
+        print(json.dumps([[f.isoformat(), tna] for f, tna in cronograma if f >= desde], indent=2))
+        return
+    desvio, fecha = verificar(diaria.inicio, diaria.valores, cronograma, args.decimales)
+    print(f"{args.serie}: {len(cronograma)} cambios de tasa, desvío máximo {desvio:.6f}"
+          + (f" el {fecha.isoformat()}" if fecha else ""))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índice de tramos de los topes de accidente/ (arts. 3, 11.a/b/c, 14.a/b, 15).
+
+Cada tabla es una lista de {res, desde, hasta, monto}. Al cargar se valida
+que los tramos estén ordenados, no se superpongan ni dejen huecos, y las
+siete tablas se reúnen sobre un único arreglo de bordes (las fechas de
+inicio de todos los tramos) con una fila de montos por artículo. Una
+consulta es una bisección sobre los bordes; montos_lote() resuelve un
+arreglo de fechas para todos los artículos con un solo searchsorted.
+
+    from finfocus_indices import topes
+    t = topes.obtener()
+    t.monto("11.a", date(2025, 4, 1))
+    t.montos_lote(fechas)        # {"3": arreglo, "11.a": arreglo, ...}
+"""
+
+import json
+import os
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from finfocus_indices.series import EPOCA, RAIZ
+
+DIR_ACCIDENTE = os.path.join(RAIZ, "accidente")
+ARTICULOS = ("3", "11.a", "11.b", "11.c", "14.a", "14.b", "15")
+
+def leer_tabla(path):
+    """Lista de tramos (desde, hasta, monto, res) validada."""
+    with open(path, "r", encoding="utf-8") as f:
+        filas = json.load(f)
+    tramos = []
+    for n, fila in enumerate(filas, 1):
+        desde = date.fromisoformat(fila["desde"])
+        hasta = date.fromisoformat(fila["hasta"])
+        if hasta < desde:
+            raise RuntimeError(f"{path}, tramo {n}: 'hasta' ({hasta}) es anterior a 'desde' ({desde}).")
+        if tramos:
+            fin = tramos[-1][1]
+            if desde.toordinal() <= fin.toordinal():
+                raise RuntimeError(f"{path}, tramo {n}: empieza el {desde} y se superpone "
+                                   f"con el anterior, que termina el {fin}.")
+            if desde.toordinal() > fin.toordinal() + 1:
+                raise RuntimeError(f"{path}, tramo {n}: deja un hueco entre el {fin} y el {desde}.")
+        tramos.append((desde, hasta, float(fila["monto"]), fila.get("res")))
+    if not tramos:
+        raise RuntimeError(f"{path} no tiene tramos.")
+    return tramos
+
+class Topes:
+    def __init__(self, tablas):
+        """`tablas`: {articulo: lista de tramos de leer_tabla()}."""
+        self.articulos = tuple(tablas)
+        bordes = sorted({t[0].toordinal() for tramos in tablas.values() for t in tramos}
+                        | {tramos[-1][1].toordinal() + 1 for tramos in tablas.values()})
+        # tramo k del índice = [bordes[k], bordes[k + 1]); el último borde sólo cierra
+        self._bordes = bordes
+        self.bordes = np.array(bordes, dtype=np.int64)
+        self.montos = np.full((len(tablas), len(bordes)), np.nan)
+        self.resoluciones = [[None] * len(bordes) for _ in tablas]
+        for a, tramos in enumerate(tablas.values()):
+            inicios = [t[0].toordinal() for t in tramos]
+            fin = tramos[-1][1].toordinal()
+            for k, borde in enumerate(bordes[:-1]):
+                if inicios[0] <= borde <= fin:
+                    _, _, monto, res = tramos[bisect_right(inicios, borde) - 1]
+                    self.montos[a, k] = monto
+                    self.resoluciones[a][k] = res
+        self._fila = {articulo: a for a, articulo in enumerate(self.articulos)}
+
+    def _tramo(self, articulo, fecha):
+        if articulo not in self._fila:
+            raise KeyError(f"Artículo desconocido: {articulo!r}")
+        k = bisect_right(self._bordes, fecha.toordinal()) - 1
+        if k < 0 or k >= len(self._bordes) - 1:
+            return None
+        return self._fila[articulo], k
+
+    def monto(self, articulo, fecha):
+        """Monto vigente del artículo en la fecha, o None fuera de las tablas."""
+        tramo = self._tramo(articulo, fecha)
+        if tramo is None:
+            return None
+        v = float(self.montos[tramo])
+        return None if v != v else v
+
+    def resolucion(self, articulo, fecha):
+        tramo = self._tramo(articulo, fecha)
+        return None if tramo is None else self.resoluciones[tramo[0]][tramo[1]]
+
+    def montos_lote(self, fechas):
+        """{articulo: montos} para un arreglo de fechas (NaN fuera de las tablas)."""
+        o = np.asarray(fechas, dtype="datetime64[D]").astype(np.int64) + EPOCA
+        k = np.searchsorted(self.bordes, o, side="right") - 1
+        fuera = (k < 0) | (k >= len(self.bordes) - 1)
+        columnas = np.where(fuera, 0, k)
+        matriz = np.where(fuera, np.nan, self.montos[:, columnas])
+        return dict(zip(self.articulos, matriz))
+
+@lru_cache(maxsize=1)
+def obtener(directorio=DIR_ACCIDENTE):
+    """Topes de los siete artículos, cargados y validados una vez por proceso."""
+    return Topes({a: leer_tabla(os.path.join(directorio, f"{a}.json")) for a in ARTICULOS})
+
+def main():
+    t = obtener()
+    print(f"{len(t.articulos)} tablas válidas, {len(t.bordes) - 1} tramos, "
+          f"del {date.fromordinal(int(t.bordes[0]))} al {date.fromordinal(int(t.bordes[-1]) - 1)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""derivadas.exportar(): agrega meses nuevos sin tocar los ya publicados."""
+
+import json
+
+from finfocus_indices import derivadas
+
+def _escribir(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+def _leer(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def test_exportar_deja_intactos_los_meses_publicados(tmp_path):
+    _escribir(tmp_path / "ripte.json", {"ene-25": 100.0, "feb-25": 101.123456, "mar-25": 102.5, "abr-25": 103.0})
+    # ripte1.json publicado con otro redondeo y sin su primer mes
+    publicado = {"mar-25": 101.1234565, "abr-25": 102.5}
+    _escribir(tmp_path / "ripte1.json", publicado)
+
+    nuevos = derivadas.exportar("ripte1", str(tmp_path))
+
+    assert nuevos == {"may-25": 103.0}
+    assert _leer(tmp_path / "ripte1.json") == {**publicado, "may-25": 103.0}
+
+def test_exportar_sin_meses_nuevos_no_escribe(tmp_path):
+    _escribir(tmp_path / "ripte.json", {"ene-25": 100.0, "feb-25": 101.0})
+    _escribir(tmp_path / "ripte2.json", {"mar-25": 100.0, "abr-25": 101.0})
+    antes = (tmp_path / "ripte2.json").stat().st_mtime_ns
+
+    assert derivadas.exportar("ripte2", str(tmp_path)) == {}
+    assert (tmp_path / "ripte2.json").stat().st_mtime_ns == antes
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Historial de revisiones: los agregados del journal se anotan sin cargarlo."""
+
+import pytest
+
+from finfocus_indices import almacen, historial, journal
+
+@pytest.fixture
+def diaria(tmp_path, monkeypatch):
+    monkeypatch.setattr(almacen, "MODO_ESCRITURA", "journal")
+    path = str(tmp_path / "cer.json")
+    almacen.guardar_diaria(path, {"2025-01-01": 1.0, "2025-01-02": 2.0})
+    return path
+
+def test_agregar_en_modo_journal_no_carga_el_historial(diaria, monkeypatch):
+    def cargar(self):
+        raise AssertionError("agregar_diaria() cargó el historial entero")
+    monkeypatch.setattr(historial.Historial, "_cargar", cargar)
+    almacen.agregar_diaria(diaria, {"2025-01-02": 2.0, "2025-01-03": 3.0})
+    almacen.agregar_diaria(diaria, {"2025-01-03": 3.5})
+    assert len(journal.entradas(diaria)) == 3
+
+    monkeypatch.undo()
+    h = historial.Historial(diaria)
+    # el punto que no cambió no genera revisión
+    assert [len(c) for c, _ in h._cambios] == [2, 1, 1]
+    assert h.revisiones("2025-01-02")[0][1] == 2.0 and len(h.revisiones("2025-01-02")) == 1
+    assert [v for _, v in h.revisiones("2025-01-03")] == [3.0, 3.5]
+    assert h.estado() == almacen.cargar_diaria(diaria)
+
+def test_anotar_recorta_una_linea_cortada(diaria):
+    with open(historial.path_historial(diaria), "ab") as f:
+        f.write(b'{"t": 1, "c": {"2025-01-0')           # escritura interrumpida
+    historial.anotar(diaria, {"2025-01-03": 3.0}, t=1)
+    h = historial.Historial(diaria)
+    assert h.estado() == {"2025-01-01": 1.0, "2025-01-02": 2.0, "2025-01-03": 3.0}
+    # t no retrocede respecto de la revisión anterior
+    assert h.tiempos == sorted(h.tiempos) and h.tiempos[-1] > 1
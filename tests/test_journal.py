@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Journal: recuperación de una escritura cortada y lectura salteando líneas inválidas."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from finfocus_indices import journal
+
+def _dia(i):
+    return (date(2020, 1, 1) + timedelta(days=i)).isoformat()
+
+@pytest.fixture
+def cortado(tmp_path):
+    """Journal con una línea a medias al final (como después de un corte de luz)."""
+    path = str(tmp_path / "serie.json")
+    journal.agregar(path, {_dia(0): 1.0, _dia(1): 2.0})
+    with open(journal.path_journal(path), "ab") as f:
+        f.write(b'{"fecha": "2020-01-03", "val')          # escritura interrumpida
+    return path
+
+def test_agregar_recorta_la_linea_cortada(cortado):
+    journal.agregar(cortado, {_dia(2): 3.0})
+    journal.agregar(cortado, {_dia(3): 4.0})
+    with open(journal.path_journal(cortado), "rb") as f:
+        lineas = f.read().splitlines(keepends=True)
+    assert all(l.endswith(b"\n") and json.loads(l) for l in lineas)
+    assert journal.leer(cortado) == {_dia(0): 1.0, _dia(1): 2.0, _dia(2): 3.0, _dia(3): 4.0}
+
+def test_leer_ignora_la_linea_cortada(cortado):
+    assert journal.leer(cortado) == {_dia(0): 1.0, _dia(1): 2.0}
+
+def test_linea_invalida_en_el_medio_no_corta_la_lectura(cortado):
+    journal.agregar(cortado, {_dia(2): 3.0, _dia(3): 4.0})
+    with open(journal.path_journal(cortado), "r+b") as f:
+        contenido = f.read()
+        primera = contenido.splitlines(keepends=True)[0]
+        f.seek(0)
+        f.write(primera[:-10] + b"\n" + contenido[len(primera):])
+    assert set(journal.leer(cortado)) == {_dia(1), _dia(2), _dia(3)}
+    # y un agregado posterior no la toca ni pierde lo que sigue
+    journal.agregar(cortado, {_dia(4): 5.0})
+    assert set(journal.leer(cortado)) == {_dia(1), _dia(2), _dia(3), _dia(4)}
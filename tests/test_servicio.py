@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Validación de los POST de lotes: un cuerpo mal armado es 400, no 500."""
+
+import json
+
+import pytest
+
+from finfocus_indices import servicio
+
+@pytest.fixture(scope="module")
+def srv():
+    return servicio.Servicio()
+
+def _post(srv, ruta, cuerpo):
+    estado, _, contenido = srv.responder("POST", ruta, {}, json.dumps(cuerpo).encode("utf-8"))
+    return estado, json.loads(contenido)
+
+@pytest.mark.parametrize("serie", [["cer"], {"a": 1}, 3, None])
+def test_serie_que_no_es_texto(srv, serie):
+    for ruta in ("/lote/valores", "/lote/coeficientes"):
+        estado, _ = _post(srv, ruta, {"serie": serie, "fechas": [], "desdes": [], "hastas": []})
+        assert estado == 400
+
+@pytest.mark.parametrize("capitales", [["a"], [[1, 2]], [True], {"x": 1}, "100", 100])
+def test_capitales_no_numericos(srv, capitales):
+    estado, _ = _post(srv, "/lote/coeficientes", {"serie": "cer", "desdes": ["2024-01-01"],
+                                                  "hastas": ["2024-02-01"], "capitales": capitales})
+    assert estado == 400
+
+def test_capitales_validos(srv):
+    estado, salida = _post(srv, "/lote/coeficientes", {"serie": "cer", "desdes": ["2024-01-01"],
+                                                       "hastas": ["2024-02-01"], "capitales": [1000]})
+    assert estado == 200
+    assert salida["montos"] == [pytest.approx(1000 * salida["coeficientes"][0])]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""update_activa.main() contra una página armada, en un indices/ temporal."""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+import update_activa
+from finfocus_indices import almacen, cache_http
+
+HTML = "<ul><li>T.N.A. 36,50%</li></ul><p>Vigente desde {}</p>"
+
+@pytest.fixture
+def activa(tmp_path, monkeypatch):
+    """indices/activa.json hasta `ultimo` y una página que anuncia `vigencia`."""
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("indices")
+
+    def preparar(ultimo, vigencia):
+        data, valor = {}, 100.0
+        for i in range(10, -1, -1):
+            data[(ultimo - timedelta(days=i)).isoformat()] = valor
+            valor = round(valor * 1.002, 6)
+        with open(update_activa.ACTIVA_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        pagina = cache_http.Pagina(update_activa.URL, HTML.format(vigencia.strftime(update_activa.DATE_FMT)),
+                                   "sha", False)
+        monkeypatch.setattr(cache_http, "obtener", lambda url, **kwargs: pagina)
+        monkeypatch.setattr(cache_http, "ya_procesada", lambda pagina, consumidor: False)
+        monkeypatch.setattr(cache_http, "confirmar", lambda *args, **kwargs: None)
+        return data
+
+    return preparar
+
+def _hoy():
+    return datetime.utcnow().date()
+
+def test_vigencia_posterior_al_dia_siguiente(activa):
+    # el cron se salteó días: la vigencia cae después de ultimo + 1
+    ultimo = _hoy() - timedelta(days=6)
+    previa = activa(ultimo, ultimo + timedelta(days=3))
+    update_activa.main()
+    data = almacen.cargar_diaria(update_activa.ACTIVA_FILE)
+    dias = [(ultimo + timedelta(days=i)).isoformat() for i in range(7)]
+    assert all(d in data for d in dias)
+    assert data[dias[0]] == previa[dias[0]]
+    # los días sin vigencia publicada usan la tasa nueva, como antes
+    factor = data[dias[2]] / data[dias[1]]
+    assert data[dias[1]] / data[dias[0]] == pytest.approx(factor, rel=1e-7)
+    assert factor == pytest.approx(1 + 0.365 / 365, rel=1e-7)
+
+def test_vigencia_anterior_reescribe_desde_la_vigencia(activa):
+    ultimo = _hoy() - timedelta(days=2)
+    vigencia = ultimo - timedelta(days=4)
+    previa = activa(ultimo, vigencia)
+    update_activa.main()
+    data = almacen.cargar_diaria(update_activa.ACTIVA_FILE)
+    anterior = (vigencia - timedelta(days=1)).isoformat()
+    assert data[anterior] == previa[anterior]
+    assert data[vigencia.isoformat()] != previa[vigencia.isoformat()]
+    assert _hoy().isoformat() in data
@@ -1,30 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
 import re
-import requests
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+
+from finfocus_indices import almacen, cache_http, extraccion, metricas, tasas
 
 URL = "https://www.bna.com.ar/home/informacionalusuariofinanciero"
 ACTIVA_FILE = "indices/activa.json"
 DATE_FMT = "%d/%m/%Y"
 
-def obtener_tna_y_vigencia():
+def obtener_tna_y_vigencia(html):
     """
     Extrae del HTML:
       - el porcentaje T.N.A.
       - la fecha 'Vigente desde DD/MM/YYYY'
     """
-    resp = requests.get(URL, timeout=10)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    # 1) Buscar T.N.A.
+    # 1) Buscar T.N.A. (se deja de parsear en el primer <li> que la tenga)
     tna_pct = None
-    for li in soup.find_all("li"):
-        txt = li.get_text(strip=True)
+    for txt in extraccion.textos(html, "li"):
         if "T.N.A." in txt:
             m = re.search(r'([\d]+,[\d]+)%', txt)
             if m:
@@ -33,8 +27,9 @@ def obtener_tna_y_vigencia():
     if tna_pct is None:
         raise RuntimeError("No encontré la T.N.A. en el HTML.")
 
-    # 2) Buscar "Vigente desde DD/MM/YYYY"
-    texto = soup.get_text(" ", strip=True)
+    # 2) Buscar "Vigente desde DD/MM/YYYY" sólo alrededor del texto;
+    #    si no aparece literal (p. ej. partido por tags), en toda la página
+    texto = extraccion.texto_desde(html, "Vigente desde") or extraccion.texto_plano(html)
     m2 = re.search(r'Vigente desde\s+(\d{2}/\d{2}/\d{4})', texto)
     if m2:
         fecha_vigencia = datetime.strptime(m2.group(1), DATE_FMT).date()
@@ -46,20 +41,14 @@ def obtener_tna_y_vigencia():
 
 def cargar_activa():
     """
-    Lee el archivo activa.json, limpia los trailing commas
-    y devuelve el dict resultante.
+    Lee la serie activa desde indices/activa.bin (o desde activa.json,
+    tolerando trailing commas, si el .bin no está al día).
     """
-    with open(ACTIVA_FILE, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    # Eliminar comas antes de } o ]
-    text = re.sub(r',\s*([}\]])', r'\1', text)
-
-    return json.loads(text)
+    return almacen.cargar_diaria(ACTIVA_FILE)
 
 def guardar_activa(data):
-    with open(ACTIVA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Escribe indices/activa.bin y regenera activa.json desde él
+    almacen.guardar_diaria(ACTIVA_FILE, data)
 
 def main():
     data = cargar_activa()
@@ -67,11 +56,19 @@ def main():
     fechas = sorted(datetime.fromisoformat(d).date() for d in data.keys())
     ultimo_guardado = fechas[-1]
 
-    tna_pct, fecha_vigencia = obtener_tna_y_vigencia()
-    tasa_diaria = (tna_pct / 100) / 365
+    pagina = cache_http.obtener(URL, timeout=10)
+    sin_cambios = cache_http.ya_procesada(pagina, "activa")
+    if sin_cambios:
+        # Misma página que la última corrida: reusar lo extraído
+        tna_pct, vigencia_iso = cache_http.resultado_guardado(pagina, "activa")
+        fecha_vigencia = datetime.fromisoformat(vigencia_iso).date()
+    else:
+        with metricas.etapa("parseo"):
+            tna_pct, fecha_vigencia = obtener_tna_y_vigencia(pagina.texto)
 
-    # Determinar desde cuándo reescribir:
-    if fecha_vigencia <= ultimo_guardado:
+    # Determinar desde cuándo reescribir (si la página no cambió,
+    # el tramo desde 'Vigente desde' ya está escrito con esta tasa):
+    if fecha_vigencia <= ultimo_guardado and not sin_cambios:
         inicio = fecha_vigencia
     else:
         inicio = ultimo_guardado + timedelta(days=1)
@@ -81,25 +78,27 @@ def main():
         print("No hay nuevos días para procesar.")
         return
 
-    # Valor del día anterior a 'inicio'
-    prev_date = inicio - timedelta(days=1)
-    prev_val = float(data[prev_date.isoformat()])
+    # Generar nuevos valores desde 'inicio' hasta hoy (a partir del día anterior)
+    with metricas.etapa("calculo"):
+        # como la versión anterior, la tasa nueva rige desde `inicio` aunque la
+        # vigencia publicada sea posterior (el cron se salteó días o la página
+        # anuncia una tasa futura): el cronograma no puede empezar después
+        cronograma = [(min(inicio, fecha_vigencia), tna_pct)]
+        nuevos = tasas.regenerar_serie(data, cronograma, inicio, hoy)
 
     # Eliminar fechas >= inicio para reescritura limpia
-    for d in list(data.keys()):
-        if datetime.fromisoformat(d).date() >= inicio:
-            del data[d]
-
-    # Generar nuevos valores desde 'inicio' hasta hoy
-    date = inicio
-    while date <= hoy:
-        nueva = round(prev_val * (1 + tasa_diaria), 6)
-        data[date.isoformat()] = nueva
-        prev_val = nueva
-        date += timedelta(days=1)
-
-    guardar_activa(data)
+    borradas = [d for d in data.keys() if datetime.fromisoformat(d).date() >= inicio]
+    for d in borradas:
+        del data[d]
+
+    if set(borradas) <= nuevos.keys():
+        # Sólo se agregan o reemplazan días: alcanza con escribir el tramo nuevo
+        almacen.agregar_diaria(ACTIVA_FILE, nuevos)
+    else:
+        data.update(nuevos)
+        guardar_activa(data)
+    cache_http.confirmar(pagina, "activa", [tna_pct, fecha_vigencia.isoformat()])
     print(f"Actualizado desde {inicio.isoformat()} hasta {hoy.isoformat()}.")
 
 if __name__ == "__main__":
-    main()
+    metricas.correr("activa", main)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Corre todos los update_*.py en un solo proceso y en paralelo.
+
+Las descargas comparten la sesión de finfocus_indices.descargas (conexiones
+keep-alive y tope de conexiones por host), así que el tiempo total queda
+acotado por la fuente más lenta y no por la suma de todas. Las series
+derivadas sólo se recalculan si cambiaron sus entradas (pipeline.py). Al
+final escribe un reporte por serie con el resultado de cada una.
+
+Uso:
+  python update_all.py                      # todas las series
+  python update_all.py cer pasiva           # sólo algunas
+  python update_all.py --fixtures fixtures/paginas --directorio /tmp/copia
+  python update_all.py --archivar                    # guardar las páginas nuevas en archivo/
+  python update_all.py --metricas metricas.jsonl     # tiempos por etapa (metricas.py)
+  python update_all.py --perfilar activa             # cProfile de un updater
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+
+from finfocus_indices import metricas, pipeline
+
+# serie → módulo que la actualiza; las dependencias están en pipeline.NODOS
+UPDATERS = {serie: nodo.modulo for serie, nodo in pipeline.NODOS.items()}
+
+REPORTE = "reporte_actualizacion.json"
+
+class SalidaPorHilo(io.TextIOBase):
+    """sys.stdout que manda lo que imprime cada hilo a su propio buffer."""
+
+    def __init__(self, original):
+        self.original = original
+        self.local = threading.local()
+
+    def write(self, s):
+        return (getattr(self.local, "buffer", None) or self.original).write(s)
+
+    def flush(self):
+        self.original.flush()
+
+def correr(serie, estado=None, forzar=False):
+    """
+    Ejecuta el main() del updater y devuelve su resultado para el reporte.
+    Con `estado` (ver pipeline.py) saltea los nodos derivados cuyas
+    entradas no cambiaron, salvo `forzar`, y registra los hashes de los
+    que corren bien.
+    """
+    if estado is not None and not forzar:
+        motivo = pipeline.pendiente(serie, estado)
+        if motivo:
+            return {"ok": True, "segundos": 0.0, "error": None, "salida": motivo, "omitida": True}
+    modulo = importlib.import_module(UPDATERS[serie])
+    salida = io.StringIO()
+    if isinstance(sys.stdout, SalidaPorHilo):
+        sys.stdout.local.buffer = salida
+    t0 = time.perf_counter()
+    try:
+        metricas.correr(serie, modulo.main)
+        ok, error = True, None
+    except Exception as e:
+        ok, error = False, f"{type(e).__name__}: {e}"
+        salida.write(traceback.format_exc())
+    finally:
+        if isinstance(sys.stdout, SalidaPorHilo):
+            sys.stdout.local.buffer = None
+    if ok and estado is not None:
+        pipeline.registrar(serie, estado)
+    return {
+        "ok": ok,
+        "segundos": round(time.perf_counter() - t0, 3),
+        "error": error,
+        "salida": salida.getvalue().strip(),
+    }
+
+def correr_todas(series, max_hilos=None, estado=None, forzar=False):
+    """
+    Corre las series en un pool de hilos: cada una espera a las series de
+    las que depende (pipeline.NODOS) y las ramas independientes corren en
+    paralelo. Devuelve {serie: resultado}.
+    """
+    pendientes = list(series)
+    resultados = {}
+    en_curso   = {}
+
+    stdout = sys.stdout
+    sys.stdout = SalidaPorHilo(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=max_hilos or len(series) or 1) as pool:
+            while pendientes or en_curso:
+                activas = set(pendientes) | set(en_curso.values())
+                for serie in [s for s in pendientes if activas.isdisjoint(pipeline.depende_de(s))]:
+                    pendientes.remove(serie)
+                    en_curso[pool.submit(correr, serie, estado, forzar)] = serie
+                listos, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+                for fut in listos:
+                    serie = en_curso.pop(fut)
+                    resultados[serie] = r = fut.result()
+                    marca = "⏭️ " if r.get("omitida") else ("✅" if r["ok"] else "❌")
+                    stdout.write(f"{marca} {serie} ({r['segundos']} s)\n")
+                    if r["salida"]:
+                        stdout.write("   " + r["salida"].replace("\n", "\n   ") + "\n")
+    finally:
+        sys.stdout = stdout
+    return resultados
+
+def compactar_journals(forzar=False):
+    """Vuelca en la base los journals que llegaron a su límite (o todos)."""
+    from finfocus_indices import almacen
+    compactadas = []
+    for serie in almacen.DIARIAS:
+        path = almacen.path_json(serie)
+        if forzar:
+            almacen.compactar(path)
+            compactadas.append(serie)
+        elif almacen.compactar_si_corresponde(path):
+            compactadas.append(serie)
+    return compactadas
+
+def escribir_reporte(path, resultados, inicio, duracion, compactadas=()):
+    reporte = {
+        "inicio": inicio.isoformat(timespec="seconds"),
+        "duracion_s": round(duracion, 3),
+        "ok": all(r["ok"] for r in resultados.values()),
+        "series": resultados,
+        "journals_compactados": list(compactadas),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(reporte, f, ensure_ascii=False, indent=2)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Actualiza todas las series en paralelo.")
+    parser.add_argument("series", nargs="*", help="series a actualizar (por defecto, todas)")
+    parser.add_argument("--reporte", default=REPORTE, help="archivo del reporte JSON")
+    parser.add_argument("--hilos", type=int, default=None, help="máximo de hilos")
+    parser.add_argument("--refrescar", action="store_true",
+                        help="ignorar la caché HTTP y reprocesar todas las páginas")
+    parser.add_argument("--todo", action="store_true",
+                        help="correr también los nodos derivados cuyas entradas no cambiaron")
+    parser.add_argument("--compactar", action="store_true",
+                        help="volcar todos los journals en la base al terminar")
+    parser.add_argument("--metricas", metavar="ARCHIVO",
+                        help="agregar una línea JSON por serie con tiempos por etapa ('-' = stderr)")
+    parser.add_argument("--perfilar", metavar="SERIE", help="correr ese updater bajo cProfile")
+    parser.add_argument("--fixtures", metavar="DIR",
+                        help="servir las páginas grabadas de DIR en lugar de las fuentes reales")
+    parser.add_argument("--directorio", metavar="DIR",
+                        help="directorio de trabajo que contiene indices/ (por defecto, el actual)")
+    parser.add_argument("--archivar", action="store_true",
+                        help="guardar cada página nueva en el archivo (archivo.py)")
+    args = parser.parse_args(argv)
+    desconocidas = [s for s in args.series if s not in UPDATERS]
+    if desconocidas:
+        parser.error(f"series desconocidas: {', '.join(desconocidas)}")
+
+    # Los updaters se importan como módulos desde la raíz del repo
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    if args.metricas or args.perfilar:
+        metricas.configurar(os.path.abspath(args.metricas) if args.metricas not in (None, "-")
+                            else args.metricas, args.perfilar)
+
+    if args.refrescar:
+        from finfocus_indices import cache_http
+        cache_http.refrescar = True
+
+    if args.archivar or args.directorio:
+        from finfocus_indices import archivo
+        if args.archivar:
+            archivo.archivar = True
+        if args.directorio and not os.environ.get("FINFOCUS_ARCHIVO"):
+            archivo.DIR_ARCHIVO = os.path.join(os.path.abspath(args.directorio), "archivo")
+
+    servidor = None
+    if args.fixtures:
+        from finfocus_indices import servidor_fixtures
+        servidor = servidor_fixtures.iniciar(os.path.abspath(args.fixtures))
+    if args.directorio:
+        # los update_*.py usan indices/ relativo al directorio de trabajo;
+        # el almacén y las derivadas, DIR_INDICES: que apunten al mismo
+        from finfocus_indices import almacen, formato
+        almacen.DIR_INDICES = formato.DIR_INDICES = os.path.join(os.path.abspath(args.directorio), "indices")
+        os.chdir(args.directorio)
+
+    series = args.series or list(UPDATERS)
+    inicio = datetime.now(timezone.utc)
+    t0 = time.perf_counter()
+    try:
+        resultados = correr_todas(series, args.hilos, pipeline.leer_estado(), args.todo)
+    finally:
+        if servidor:
+            servidor.shutdown()
+    compactadas = compactar_journals(args.compactar)
+    duracion = time.perf_counter() - t0
+
+    escribir_reporte(args.reporte, resultados, inicio, duracion, compactadas)
+    fallidas = [s for s, r in resultados.items() if not r["ok"]]
+    print(f"Terminado en {duracion:.2f} s; reporte en {args.reporte}")
+    if fallidas:
+        print(f"Fallaron: {', '.join(fallidas)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
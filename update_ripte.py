@@ -3,11 +3,11 @@
 
 import os
 import json
-import requests
 import urllib3
-from bs4 import BeautifulSoup
 from datetime import datetime
 
+from finfocus_indices import almacen, cache_http, extraccion, metricas
+
 # Desactivar warnings SSL (certificados autofirmados)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -22,26 +22,21 @@ MONTHS = {
 
 def cargar_ripte():
     if os.path.exists(ACTIVO_FILE):
-        with open(ACTIVO_FILE, "r", encoding="utf-8") as f:
+        with metricas.etapa("carga"), open(ACTIVO_FILE, "r", encoding="utf-8") as f:
             return json.load(f)
     return {}
 
 def guardar_ripte(data):
-    with open(ACTIVO_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def obtener_ripte():
-    resp = requests.get(URL, timeout=10, verify=False)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    almacen.guardar_json(ACTIVO_FILE, data)
 
-    table = soup.find("table")
-    if not table:
+def obtener_ripte(html):
+    # Sólo hace falta la primera fila de datos de la tabla
+    filas = extraccion.filas_tabla(html)
+    if filas is None:
         raise RuntimeError("No encontré la tabla de RIPTE.")
-
-    body = table.find("tbody")
-    row  = body.find("tr")
-    cols = [td.get_text(strip=True) for td in row.find_all("td")]
+    cols = next(filas, None)
+    if not cols:
+        raise RuntimeError("La tabla de RIPTE no tiene filas.")
 
     # cols[0] = 'Mayo/2025', cols[-1] = '163.299,84'
     mes_str, val_str = cols[0], cols[-1]
@@ -59,17 +54,26 @@ def obtener_ripte():
     return clave, valor
 
 def main():
+    pagina = cache_http.obtener(URL, timeout=10, verify=False)
+    if cache_http.ya_procesada(pagina, "ripte"):
+        print("La página de RIPTE no cambió desde la última corrida, nada que hacer.")
+        return
+
     data  = cargar_ripte()
-    clave, valor = obtener_ripte()
+    with metricas.etapa("parseo"):
+        clave, valor = obtener_ripte(pagina.texto)
     print(f"Último RIPTE: {clave} → {valor}")
 
     if clave in data:
         print(f"Ya existe '{clave}', nada que hacer.")
+        cache_http.confirmar(pagina, "ripte")
         return
 
     data[clave] = valor
     guardar_ripte(data)
+    metricas.sumar("puntos_agregados")
+    cache_http.confirmar(pagina, "ripte")
     print(f"✅ Agregado '{clave}': {valor} a {ACTIVO_FILE}")
 
 if __name__ == "__main__":
-    main()
+    metricas.correr("ripte", main)
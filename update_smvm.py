@@ -3,37 +3,37 @@
 
 import json
 import re
-import requests
 from datetime import datetime
-from bs4 import BeautifulSoup
+
+from finfocus_indices import almacen, cache_http, extraccion, metricas
 
 URL         = "https://www.argentina.gob.ar/trabajo/consejodelsalario"
 SMVM_FILE   = "indices/smvm.json"
+TITULO      = "Salario Mínimo Vital y Móvil"
+# valor y mes/año dentro de la tarjeta: "$ 317.800 ... (julio 2025)"
+RE_SMVM     = re.compile(r"\$\s*([\d\.\,]+).*\((\w+)\s+(\d{4})\)")
 
 def cargar_smvm():
-    with open(SMVM_FILE, encoding="utf-8") as f:
+    with metricas.etapa("carga"), open(SMVM_FILE, encoding="utf-8") as f:
         return json.load(f)
 
 def guardar_smvm(data):
-    with open(SMVM_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def obtener_smvm():
-    resp = requests.get(URL, timeout=10)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    # 1) Encuentra el bloque que contenga exactamente ese texto
-    tarjeta = soup.find(lambda tag:
-        tag.name in ("div","section") and
-        "Salario Mínimo Vital y Móvil" in tag.get_text()
-    )
-    if not tarjeta:
-        raise RuntimeError("No encontré el bloque de SMVM en la página")
+    almacen.guardar_json(SMVM_FILE, data)
 
-    texto = tarjeta.get_text(separator=" ", strip=True)
-    # 2) Regex para extraer valor y mes/año
-    m = re.search(r"\$\s*([\d\.\,]+).*\((\w+)\s+(\d{4})\)", texto)
+def obtener_smvm(html):
+    # 1) La tarjeta es el div/section más interno que contiene el título
+    #    y el valor; los bloques se recorren a medida que se cierran
+    vio_titulo = False
+    m = None
+    for texto in extraccion.textos(html, ("div", "section"), separador=" "):
+        if TITULO in texto:
+            vio_titulo = True
+            # 2) Regex para extraer valor y mes/año
+            m = RE_SMVM.search(texto)
+            if m:
+                break
+    if not vio_titulo:
+        raise RuntimeError("No encontré el bloque de SMVM en la página")
     if not m:
         raise RuntimeError("No pude extraer valor + mes/año de SMVM")
     valor_str, mes_txt, anio = m.groups()
@@ -45,14 +45,22 @@ def obtener_smvm():
     return clave, valor
 
 def main():
+    pagina = cache_http.obtener(URL, timeout=10)
+    if cache_http.ya_procesada(pagina, "smvm"):
+        print("La página del SMVM no cambió desde la última corrida, nada que hacer.")
+        return
+
     data = cargar_smvm()
-    clave, valor = obtener_smvm()
+    with metricas.etapa("parseo"):
+        clave, valor = obtener_smvm(pagina.texto)
     if clave in data:
         print(f"'{clave}' ya existe en {SMVM_FILE}, nada que hacer.")
     else:
         data[clave] = valor
         guardar_smvm(data)
+        metricas.sumar("puntos_agregados")
         print(f"Añadido '{clave}': {valor} a {SMVM_FILE}")
+    cache_http.confirmar(pagina, "smvm")
 
 if __name__ == "__main__":
-    main()
+    metricas.correr("smvm", main)